@@ -7,9 +7,16 @@ Usage:
 
 import sys
 
-from crypto_portfolio_tracker.core.scanner import ChainScanner
+from crypto_portfolio_tracker.core.scanner import TRANSFER_TOPIC, ChainScanner
 from crypto_portfolio_tracker.rpc import ApeRPCProvider
 
+# balanceOf(address) selector
+BALANCE_OF_SELECTOR = "0x70a08231"
+
+# Recent blocks checked by the fallback Transfer query, and its eth_getLogs chunk size
+WINDOW = 1000
+CHUNK = 1000
+
 
 def main():
     """Debug address activity."""
@@ -61,9 +68,9 @@ def main():
 
         # Try a more recent block range
         try:
-            print("Querying last 1000 blocks for Transfer events...")
+            print(f"Querying last {WINDOW} blocks for Transfer events...")
             topics = [
-                "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+                TRANSFER_TOPIC,
                 None,
                 scanner._pad_address(address),
             ]
@@ -71,24 +78,40 @@ def main():
             # Get latest block
             latest = provider.make_request("eth_blockNumber", [])
             latest_int = int(latest, 16)
-            from_block = hex(latest_int - 1000)
+            from_block = max(latest_int - WINDOW, 0)
 
             print(f"  Latest block: {latest_int}")
-            print(f"  From block: {int(from_block, 16)}")
-
-            logs = provider.make_request(
-                "eth_getLogs",
-                [
-                    {
-                        "fromBlock": from_block,
-                        "toBlock": "latest",
-                        "topics": topics,
-                    }
-                ],
-            )
-
-            print(f"  Found {len(logs)} Transfer events in last 1000 blocks")
-            if len(logs) > 0:
+            print(f"  From block: {from_block}")
+
+            # Walk the window in chunks, halving the chunk when the provider rejects it
+            log_count = 0
+            chunk = CHUNK
+            start = from_block
+            while start <= latest_int:
+                end = min(start + chunk - 1, latest_int)
+                try:
+                    logs = provider.make_request(
+                        "eth_getLogs",
+                        [
+                            {
+                                "fromBlock": hex(start),
+                                "toBlock": hex(end),
+                                "topics": topics,
+                            }
+                        ],
+                    )
+                except Exception as e:
+                    if scanner._is_too_many_results_error(e) and chunk > 1:
+                        chunk //= 2
+                        print(f"  Range too large, retrying with {chunk}-block chunks")
+                        continue
+                    raise
+
+                log_count += len(logs)
+                start = end + 1
+
+            print(f"  Found {log_count} Transfer events in last {WINDOW} blocks")
+            if log_count > 0:
                 print("  ✓ Recent activity detected!")
             print()
 
@@ -119,33 +142,30 @@ def main():
     print(f"Lido contracts: {lido_addresses}")
     print()
 
-    if "steth" in lido_addresses:
-        steth_address = lido_addresses["steth"]
-        print(f"Checking stETH balance at {steth_address}...")
+    # Batch both balanceOf eth_calls into a single JSON-RPC round-trip
+    lido_tokens = [(key, symbol) for key, symbol in [("steth", "stETH"), ("wsteth", "wstETH")] if key in lido_addresses]
+    calldata = BALANCE_OF_SELECTOR + scanner._pad_address(address)[2:]
+    calls = [("eth_call", [{"to": lido_addresses[key], "data": calldata}, "latest"]) for key, _ in lido_tokens]
 
-        try:
-            contract = provider.get_contract(steth_address)
-            balance = contract.balanceOf(address)
-            print(f"  Raw balance: {balance}")
-            print(f"  Formatted: {balance / 10**18:.6f} stETH")
-            print()
-        except Exception as e:
-            print(f"  Error: {e}")
-            print()
+    try:
+        results = provider.make_batch_request(calls)
+    except Exception as e:
+        print(f"  Error: {e}")
+        print()
+        results = []
 
-    if "wsteth" in lido_addresses:
-        wsteth_address = lido_addresses["wsteth"]
-        print(f"Checking wstETH balance at {wsteth_address}...")
+    for (key, symbol), result in zip(lido_tokens, results, strict=False):
+        print(f"Checking {symbol} balance at {lido_addresses[key]}...")
 
-        try:
-            contract = provider.get_contract(wsteth_address)
-            balance = contract.balanceOf(address)
-            print(f"  Raw balance: {balance}")
-            print(f"  Formatted: {balance / 10**18:.6f} wstETH")
-            print()
-        except Exception as e:
-            print(f"  Error: {e}")
+        if result is None:
+            print("  Error: eth_call failed")
             print()
+            continue
+
+        balance = int(result, 16) if result != "0x" else 0
+        print(f"  Raw balance: {balance}")
+        print(f"  Formatted: {balance / 10**18:.6f} {symbol}")
+        print()
 
     # Cleanup
     provider.disconnect()
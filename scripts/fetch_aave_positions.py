@@ -12,18 +12,21 @@ TARGET_ADDRESS = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"  # vitalik.eth
 CHAINS = ["ethereum", "base", "arbitrum", "optimism"]
 
 # getUserAccountData(address) selector
-GET_USER_ACCOUNT_DATA_SELECTOR = "0xbf92857c"
+GET_USER_ACCOUNT_DATA_SELECTOR = bytes.fromhex("bf92857c")
 
+# ABI word size in bytes
+WORD_SIZE = 32
 
-def encode_address(address: str) -> str:
+
+def encode_address(address: str) -> bytes:
     """Encode address as 32-byte ABI parameter."""
-    return address.lower().replace("0x", "").zfill(64)
+    return int(address, 16).to_bytes(WORD_SIZE, "big")
 
 
-def decode_uint256(hex_str: str, offset: int) -> int:
-    """Decode a uint256 from hex response at word offset."""
-    start = 2 + (offset * 64)  # skip 0x prefix
-    return int(hex_str[start:start + 64], 16)
+def decode_uint256(buf: bytes, offset: int) -> int:
+    """Decode a uint256 from raw response bytes at word offset."""
+    start = offset * WORD_SIZE
+    return int.from_bytes(buf[start : start + WORD_SIZE], "big")
 
 
 def fetch_positions_for_chain(chain: str, user_address: str) -> None:
@@ -45,8 +48,8 @@ def fetch_positions_for_chain(chain: str, user_address: str) -> None:
         provider.connect()
         print(f"  Connected to {chain}:mainnet")
 
-        # Build calldata: getUserAccountData(address)
-        calldata = GET_USER_ACCOUNT_DATA_SELECTOR + encode_address(user_address)
+        # Build calldata: getUserAccountData(address), hex-encoded once for the RPC call
+        calldata = "0x" + (GET_USER_ACCOUNT_DATA_SELECTOR + encode_address(user_address)).hex()
 
         result = provider.make_request(
             "eth_call",
@@ -57,13 +60,14 @@ def fetch_positions_for_chain(chain: str, user_address: str) -> None:
             print("\n  Empty response — user has no AAVE positions on this chain.")
             return
 
-        # Decode the 6 uint256 return values
-        total_collateral_base = decode_uint256(result, 0)
-        total_debt_base = decode_uint256(result, 1)
-        available_borrows_base = decode_uint256(result, 2)
-        current_liq_threshold = decode_uint256(result, 3)
-        ltv = decode_uint256(result, 4)
-        health_factor = decode_uint256(result, 5)
+        # Decode the 6 uint256 return values from a single bytes conversion
+        buf = bytes.fromhex(result[2:])
+        total_collateral_base = decode_uint256(buf, 0)
+        total_debt_base = decode_uint256(buf, 1)
+        available_borrows_base = decode_uint256(buf, 2)
+        current_liq_threshold = decode_uint256(buf, 3)
+        ltv = decode_uint256(buf, 4)
+        health_factor = decode_uint256(buf, 5)
 
         # Base currency has 8 decimals, health factor has 18
         collateral_usd = total_collateral_base / 10**8
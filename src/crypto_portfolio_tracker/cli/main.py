@@ -1,37 +1,39 @@
 """CLI for crypto portfolio tracker."""
 
-import json
-from decimal import Decimal
+import asyncio
+import sys
 from enum import StrEnum
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TaskProgressColumn, TextColumn
 from rich.table import Table
 from rich.traceback import install
 
-# Import all protocol handlers to trigger auto-registration
-from crypto_portfolio_tracker import protocols  # noqa: F401
 from crypto_portfolio_tracker.core import ChainScanner, PositionAggregator
-from crypto_portfolio_tracker.core.models import PortfolioSummary
+from crypto_portfolio_tracker.core.models import ChainActivity, PortfolioSummary
 from crypto_portfolio_tracker.core.registry import ProtocolRegistry
 from crypto_portfolio_tracker.data import get_all_supported_chains
 from crypto_portfolio_tracker.pricing import ChainlinkPricing, DeFiLlamaPricing
-from crypto_portfolio_tracker.rpc import ApeRPCProvider
+from crypto_portfolio_tracker.rpc import ApeRPCProvider, MultiChainRPCProvider, get_persistent_cache, get_provider
 
-# Install rich traceback handler
-install(show_locals=True)
+# Install rich traceback handler - locals are left out so large position
+# lists are not rendered into every traceback
+install(show_locals=False, suppress=[typer])
 
 # Global debug flag
 DEBUG = False
 
+# Upper bound on chains scanned at once, to stay clear of provider rate limits
+MAX_CONCURRENT_CHAIN_SCANS = 5
+
 app = typer.Typer(
     name="crypto-portfolio-tracker",
     help="Fetch DeFi staking/lending positions across multiple chains using pure RPC calls",
     add_completion=False,
 )
 
-console = Console()
+console = Console(highlight=False)
 
 
 class OutputFormat(StrEnum):
@@ -41,7 +43,7 @@ class OutputFormat(StrEnum):
     JSON = "json"
 
 
-def _connect_to_chain(chain: str, console: Console, debug: bool = False) -> ApeRPCProvider:
+def _connect_to_chain(chain: str, progress: Progress, debug: bool = False) -> ApeRPCProvider:
     """
     Connect to a specific chain.
 
@@ -49,8 +51,8 @@ def _connect_to_chain(chain: str, console: Console, debug: bool = False) -> ApeR
     ----------
     chain : str
         Chain name
-    console : Console
-        Rich console for output
+    progress : Progress
+        Active progress display, used for status and error output
     debug : bool
         Enable debug output
 
@@ -65,25 +67,77 @@ def _connect_to_chain(chain: str, console: Console, debug: bool = False) -> ApeR
         If connection fails
 
     """
-    rpc_provider = ApeRPCProvider(chain=chain)
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Connecting to {chain} network...", total=None)
-        try:
-            rpc_provider.connect()
-            progress.update(task, description=f"✓ Connected to {chain}")
-            progress.stop()
-            return rpc_provider
-        except Exception as e:
-            progress.stop()
-            console.print(f"[bold red]Failed to connect to {chain}:[/bold red] {e}")
-            console.print("[yellow]Make sure you have set WEB3_INFURA_PROJECT_ID environment variable[/yellow]")
-            console.print("[dim]  Add to ~/.zshrc: export WEB3_INFURA_PROJECT_ID='your_project_id'[/dim]")
-            raise typer.Exit(code=1)
+    task = progress.add_task(f"Connecting to {chain} network...", total=None)
+    try:
+        rpc_provider = get_provider(chain)
+        rpc_provider.pin_block()
+        return rpc_provider
+    except Exception as e:
+        progress.console.print(f"[bold red]Failed to connect to {chain}:[/bold red] {e}")
+        progress.console.print("[yellow]Make sure you have set WEB3_INFURA_PROJECT_ID environment variable[/yellow]")
+        progress.console.print("[dim]  Add to ~/.zshrc: export WEB3_INFURA_PROJECT_ID='your_project_id'[/dim]")
+        raise typer.Exit(code=1)
+    finally:
+        progress.remove_task(task)
+
+
+async def _scan_chains_concurrently(
+    address: str,
+    rpc_providers: dict[str, ApeRPCProvider],
+    progress: Progress,
+    task_id: TaskID,
+    debug: bool = False,
+) -> dict[str, ChainActivity]:
+    """
+    Scan connected chains for activity concurrently.
+
+    Chain scans are dominated by network I/O on raw RPC requests, which go
+    straight to each chain's own provider, so they can safely overlap.
+
+    Parameters
+    ----------
+    address : str
+        Wallet address to scan
+    rpc_providers : dict[str, ApeRPCProvider]
+        Connected providers by chain name
+    progress : Progress
+        Rich progress bar, advanced once per finished chain
+    task_id : TaskID
+        Progress task to advance
+    debug : bool
+        Enable debug output
+
+    Returns
+    -------
+    dict[str, ChainActivity]
+        Activity per chain, in the order of ``rpc_providers`` (failed scans omitted)
+
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHAIN_SCANS)
+
+    async def scan(chain_name: str, rpc_provider: ApeRPCProvider) -> ChainActivity:
+        async with semaphore:
+            scanner = ChainScanner(rpc_provider=rpc_provider, debug=debug, activity_cache=get_persistent_cache())
+            try:
+                return await asyncio.to_thread(scanner.scan_chain, address, chain_name)
+            finally:
+                progress.advance(task_id)
+
+    chains = list(rpc_providers)
+    results = await asyncio.gather(
+        *(scan(chain_name, rpc_providers[chain_name]) for chain_name in chains),
+        return_exceptions=True,
+    )
+
+    activities = {}
+    for chain_name, result in zip(chains, results, strict=True):
+        if isinstance(result, BaseException):
+            if debug:
+                console.print(f"[dim]Error scanning {chain_name}: {result}[/dim]")
+            continue
+        activities[chain_name] = result
+
+    return activities
 
 
 @app.command()
@@ -124,120 +178,135 @@ def positions(
     if debug:
         console.print("[dim]Debug mode enabled[/dim]")
 
-    # Initialize fallback pricing service
-    defillama_pricing = DeFiLlamaPricing()
-
-    rpc_providers = {}  # Track providers for cleanup
+    # Initialize fallback pricing service; recent prices are reused across runs
+    price_cache = get_persistent_cache()
+    defillama_pricing = DeFiLlamaPricing(price_cache=price_cache)
 
     try:
-        # Fetch positions based on filters
-        if protocol:
-            # Protocol filter - scan specific protocol across specified chain(s)
-            target_chain = chain or "ethereum"
+        # One progress display for the whole run; tasks are added per phase
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            # Fetch positions based on filters
+            if protocol:
+                # Protocol filter - scan specific protocol across specified chain(s)
+                target_chain = chain or "ethereum"
+
+                # Connect to network
+                rpc_provider = _connect_to_chain(target_chain, progress, debug)
+
+                # Create Chainlink pricing with DeFiLlama fallback
+                pricing = ChainlinkPricing(
+                    rpc_provider=rpc_provider, fallback_pricing=defillama_pricing, price_cache=price_cache
+                )
 
-            # Connect to network
-            rpc_provider = _connect_to_chain(target_chain, console, debug)
-            rpc_providers[target_chain] = rpc_provider
+                scanner = ChainScanner(rpc_provider=rpc_provider, debug=debug, activity_cache=get_persistent_cache())
+
+                if debug:
+                    console.print(f"[dim]Filtering by protocol: {protocol} on {target_chain}[/dim]")
+
+                progress.add_task(f"Fetching {protocol} positions...", total=None)
+                with (
+                    PositionAggregator(
+                        scanner=scanner, pricing_service=pricing, rpc_provider=rpc_provider, debug=debug
+                    ) as aggregator,
+                    rpc_provider.activate(),
+                ):
+                    portfolio = aggregator.get_positions_for_protocol(address, protocol, target_chain)
+
+                # Convert to summary format
+                summary = PortfolioSummary(address=address, positions=portfolio).finalize()
+            elif chain:
+                # Single chain scan
+                rpc_provider = _connect_to_chain(chain, progress, debug)
+
+                # Create Chainlink pricing with DeFiLlama fallback
+                pricing = ChainlinkPricing(
+                    rpc_provider=rpc_provider, fallback_pricing=defillama_pricing, price_cache=price_cache
+                )
 
-            # Create Chainlink pricing with DeFiLlama fallback
-            pricing = ChainlinkPricing(rpc_provider=rpc_provider, fallback_pricing=defillama_pricing)
+                scanner = ChainScanner(rpc_provider=rpc_provider, debug=debug, activity_cache=get_persistent_cache())
 
-            scanner = ChainScanner(rpc_provider=rpc_provider, debug=debug)
-            aggregator = PositionAggregator(
-                scanner=scanner, pricing_service=pricing, rpc_provider=rpc_provider, debug=debug
-            )
+                if debug:
+                    console.print(f"[dim]Scanning chain: {chain}[/dim]")
 
-            if debug:
-                console.print(f"[dim]Filtering by protocol: {protocol} on {target_chain}[/dim]")
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"Fetching {protocol} positions...", total=None)
-                portfolio = aggregator.get_positions_for_protocol(address, protocol, target_chain)
-                progress.update(task, description=f"✓ Fetched {len(portfolio)} positions")
-
-            # Convert to summary format
-            summary = PortfolioSummary(
-                address=address,
-                positions=portfolio,
-                total_usd_value=sum((p.usd_value or Decimal("0") for p in portfolio), Decimal("0")),
-            )
-        elif chain:
-            # Single chain scan
-            rpc_provider = _connect_to_chain(chain, console, debug)
-            rpc_providers[chain] = rpc_provider
-
-            # Create Chainlink pricing with DeFiLlama fallback
-            pricing = ChainlinkPricing(rpc_provider=rpc_provider, fallback_pricing=defillama_pricing)
-
-            scanner = ChainScanner(rpc_provider=rpc_provider, debug=debug)
-            aggregator = PositionAggregator(
-                scanner=scanner, pricing_service=pricing, rpc_provider=rpc_provider, debug=debug
-            )
+                progress.add_task(f"Scanning {chain} for positions...", total=None)
+                with (
+                    PositionAggregator(
+                        scanner=scanner, pricing_service=pricing, rpc_provider=rpc_provider, debug=debug
+                    ) as aggregator,
+                    rpc_provider.activate(),
+                ):
+                    positions_list = aggregator.get_positions_for_chain(address, chain)
+
+                summary = PortfolioSummary(address=address, positions=positions_list).finalize()
+            else:
+                # Multi-chain scan - scan all supported chains
+                supported_chains = get_all_supported_chains()
+                rpc_providers: dict[str, ApeRPCProvider] = {}
+                all_positions = []
 
-            if debug:
-                console.print(f"[dim]Scanning chain: {chain}[/dim]")
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"Scanning {chain} for positions...", total=None)
-                positions_list = aggregator.get_positions_for_chain(address, chain)
-                progress.update(task, description=f"✓ Found {len(positions_list)} positions")
-
-            summary = PortfolioSummary(
-                address=address,
-                positions=positions_list,
-                total_usd_value=sum((p.usd_value or Decimal("0") for p in positions_list), Decimal("0")),
-            )
-        else:
-            # Multi-chain scan - scan all supported chains
-            supported_chains = get_all_supported_chains()
-            all_positions = []
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console,
-            ) as progress:
                 main_task = progress.add_task(
                     f"Scanning {len(supported_chains)} chains...",
                     total=len(supported_chains),
                 )
 
-                for i, chain_name in enumerate(supported_chains):
-                    progress.update(
-                        main_task,
-                        description=f"Scanning {chain_name}...",
-                        completed=i,
-                    )
+                # Connect sequentially - Ape's active network is process-global
+                for chain_name in supported_chains:
+                    progress.update(main_task, description=f"Connecting to {chain_name}...")
 
                     try:
-                        # Connect to this chain
-                        rpc_provider = ApeRPCProvider(chain=chain_name)
-                        rpc_provider.connect()
+                        rpc_provider = get_provider(chain_name)
                         rpc_providers[chain_name] = rpc_provider
+                        rpc_provider.pin_block()
+                    except Exception as e:
+                        if debug:
+                            console.print(f"[dim]Error connecting to {chain_name}: {e}[/dim]")
+                        progress.advance(main_task)
+
+                # Scan all connected chains for activity concurrently
+                progress.update(main_task, description="Scanning chains for activity...")
+                activities = asyncio.run(_scan_chains_concurrently(address, rpc_providers, progress, main_task, debug))
+
+                # One pricing service for all chains - Chainlink feeds are read through
+                # each chain's provider and fallback prices are fetched in one batch
+                pricing = ChainlinkPricing(
+                    rpc_provider=None,
+                    fallback_pricing=defillama_pricing,
+                    rpc_providers=rpc_providers,
+                    price_cache=price_cache,
+                )
 
-                        # Create Chainlink pricing with DeFiLlama fallback for this chain
-                        pricing = ChainlinkPricing(rpc_provider=rpc_provider, fallback_pricing=defillama_pricing)
+                # Fetch positions per active chain, with that chain's network active for contract calls
+                for chain_name, activity in activities.items():
+                    if not activity.has_activity:
+                        continue
 
-                        # Scan this chain
-                        scanner = ChainScanner(rpc_provider=rpc_provider, debug=debug)
-                        aggregator = PositionAggregator(
-                            scanner=scanner,
-                            pricing_service=pricing,
-                            rpc_provider=rpc_provider,
-                            debug=debug,
-                        )
+                    progress.update(main_task, description=f"Fetching positions from {chain_name}...")
+                    rpc_provider = rpc_providers[chain_name]
 
-                        positions = aggregator.get_positions_for_chain(address, chain_name)
+                    try:
+                        scanner = ChainScanner(
+                            rpc_provider=rpc_provider, debug=debug, activity_cache=get_persistent_cache()
+                        )
+                        with (
+                            # Fetches a single chain, so one chain worker is enough
+                            PositionAggregator(
+                                scanner=scanner,
+                                pricing_service=pricing,
+                                rpc_provider=rpc_provider,
+                                debug=debug,
+                                chain_concurrency=1,
+                            ) as aggregator,
+                            rpc_provider.activate(),
+                        ):
+                            # Priced below, together with every other chain
+                            positions = aggregator.get_positions_for_activity(address, activity, enrich=False)
                         all_positions.extend(positions)
 
                         if debug:
@@ -248,14 +317,17 @@ def positions(
                             console.print(f"[dim]Error scanning {chain_name}: {e}[/dim]")
                         continue
 
-                progress.update(main_task, description="✓ Scan complete", completed=len(supported_chains))
-
-            # Build summary
-            summary = PortfolioSummary(
-                address=address,
-                positions=all_positions,
-                total_usd_value=sum((p.usd_value or Decimal("0") for p in all_positions), Decimal("0")),
-            )
+                # Price every chain's positions and build the summary in one pass
+                # (aggregators share the pricing service; pricing starts no worker threads)
+                if all_positions:
+                    progress.update(main_task, description="Fetching USD prices...")
+                    summary_scanner = ChainScanner(rpc_provider=MultiChainRPCProvider(rpc_providers), debug=debug)
+                    with PositionAggregator(
+                        scanner=summary_scanner, pricing_service=pricing, debug=debug
+                    ) as aggregator:
+                        summary = aggregator.summarize_positions(address, all_positions)
+                else:
+                    summary = PortfolioSummary(address=address, positions=all_positions)
 
         # Output results
         if format == OutputFormat.JSON:
@@ -270,13 +342,8 @@ def positions(
             raise
         raise typer.Exit(1)
     finally:
-        # Cleanup all RPC provider connections
-        for provider in rpc_providers.values():
-            try:
-                provider.disconnect()
-            except Exception:
-                pass
-        pricing.close()
+        # RPC providers are pooled and disconnected at exit
+        defillama_pricing.close()
 
 
 @app.command()
@@ -324,6 +391,7 @@ def _output_table(summary) -> None:
         title=f"Portfolio for {summary.address[:10]}...{summary.address[-8:]}",
         show_header=True,
         header_style="bold magenta",
+        row_styles=["none"],
     )
 
     table.add_column("Protocol", style="cyan")
@@ -333,18 +401,19 @@ def _output_table(summary) -> None:
     table.add_column("Balance", style="white", justify="right")
     table.add_column("USD Value", style="bold green", justify="right")
 
-    for position in summary.positions:
-        balance_str = f"{position.balance:,.4f}"
-        usd_str = f"${position.usd_value:,.2f}" if position.usd_value else "-"
-
-        table.add_row(
+    rows = [
+        (
             position.protocol,
             position.chain,
             position.position_type.value,
             position.token.symbol,
-            balance_str,
-            usd_str,
+            f"{position.balance:,.4f}",
+            f"${position.usd_value:,.2f}" if position.usd_value else "-",
         )
+        for position in summary.positions
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print("\n")
     console.print(table)
@@ -376,18 +445,11 @@ def _output_table(summary) -> None:
 
 def _output_json(summary) -> None:
     """Output portfolio as JSON."""
-
-    def decimal_default(obj):
-        if isinstance(obj, Decimal):
-            return str(obj)
-        raise TypeError
-
-    # Convert Pydantic model to dict
-    data = summary.model_dump(mode="json")
-
-    # Pretty print JSON
-    json_str = json.dumps(data, indent=2, default=decimal_default)
-    console.print(json_str)
+    # Pydantic serializes Decimals to strings natively; write straight to stdout
+    # to skip Rich's markup and highlighting pass over the whole document
+    sys.stdout.write(summary.model_dump_json(indent=2))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
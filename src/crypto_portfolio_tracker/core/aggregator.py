@@ -1,14 +1,45 @@
 """Position aggregator for orchestrating position fetching across chains and protocols."""
 
+import asyncio
+import os
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from decimal import Decimal
 from typing import Any
 
 from rich.console import Console
 
-from crypto_portfolio_tracker.core.models import PortfolioSummary, Position
-from crypto_portfolio_tracker.core.registry import ProtocolRegistry
+from crypto_portfolio_tracker.core.models import ZERO, ChainActivity, PortfolioSummary, Position
+from crypto_portfolio_tracker.core.registry import ProtocolHandlerInterface, ProtocolRegistry
 from crypto_portfolio_tracker.core.scanner import ChainScanner
+from crypto_portfolio_tracker.rpc.cache import RPCCache
+
+# Environment variables overriding the default worker pool sizes
+CHAIN_WORKERS_ENV = "CRYPTO_PORTFOLIO_CHAIN_WORKERS"
+PROTOCOL_WORKERS_ENV = "CRYPTO_PORTFOLIO_PROTOCOL_WORKERS"
+
+
+def _pool_size(env_var: str, default: int) -> int:
+    """
+    Read a worker pool size from the environment.
+
+    Parameters
+    ----------
+    env_var : str
+        Environment variable name
+    default : int
+        Size used when the variable is unset or not a positive integer
+
+    Returns
+    -------
+    int
+        Pool size
+
+    """
+    try:
+        size = int(os.getenv(env_var, ""))
+    except ValueError:
+        return default
+    return size if size > 0 else default
 
 
 class PositionAggregator:
@@ -30,30 +61,110 @@ class PositionAggregator:
         Pricing service for USD value enrichment
     rpc_provider : Any | None
         RPC provider for contract calls (optional, defaults to scanner's provider)
+    chain_concurrency : int | None
+        Chains fetched at once (default: ``CRYPTO_PORTFOLIO_CHAIN_WORKERS`` or
+        ``MAX_CHAIN_WORKERS``)
+    protocol_concurrency : int | None
+        Protocol handlers run at once across all chains (default:
+        ``CRYPTO_PORTFOLIO_PROTOCOL_WORKERS`` or ``MAX_PROTOCOL_WORKERS``)
 
     """
 
+    # Default chain-level pool size; chains mostly wait on their protocol fetches
+    MAX_CHAIN_WORKERS = 8
+
+    # Default protocol-level pool size, sized for concurrent RPC requests in
+    # flight rather than for the number of chains
+    MAX_PROTOCOL_WORKERS = 16
+
+    # Seconds to wait for a single protocol handler
+    PROTOCOL_TIMEOUT = 30
+
+    # Seconds a portfolio summary is served from cache
+    SUMMARY_CACHE_TTL = 30
+
     def __init__(
         self,
         scanner: ChainScanner,
         pricing_service: Any,
         rpc_provider: Any | None = None,
         debug: bool = False,
+        *,
+        chain_concurrency: int | None = None,
+        protocol_concurrency: int | None = None,
     ) -> None:
         self.scanner = scanner
         self.pricing_service = pricing_service
         self.rpc_provider = rpc_provider or scanner.rpc_provider
         self.debug = debug
+        # Shared console for debug error output, created only in debug mode
+        self._console = Console() if debug else None
+        if chain_concurrency is None:
+            chain_concurrency = _pool_size(CHAIN_WORKERS_ENV, self.MAX_CHAIN_WORKERS)
+        if protocol_concurrency is None:
+            protocol_concurrency = _pool_size(PROTOCOL_WORKERS_ENV, self.MAX_PROTOCOL_WORKERS)
+        # Threads start on first submit and are reused across calls
+        self._chain_executor = ThreadPoolExecutor(max_workers=chain_concurrency, thread_name_prefix="chain-")
+        self._protocol_executor = ThreadPoolExecutor(max_workers=protocol_concurrency, thread_name_prefix="protocol-")
+        self._summary_cache = RPCCache(default_ttl=self.SUMMARY_CACHE_TTL)
+        # Handler instances bound to this aggregator's provider, shared by its worker threads
+        self._handlers: dict[type[ProtocolHandlerInterface], Any] = {}
+        self._handlers_lock = threading.Lock()
 
     def get_all_positions(
         self,
         user_address: str,
         progress: Any | None = None,
         task_id: Any | None = None,
+        *,
+        force_refresh: bool = False,
     ) -> PortfolioSummary:
         """
         Get all positions for a user across all chains and protocols.
 
+        Summaries are cached per address for ``SUMMARY_CACHE_TTL`` seconds, so
+        repeated calls skip the RPC fan-out. The cached summary is shared.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+        progress : Any | None
+            Rich progress bar instance (optional)
+        task_id : Any | None
+            Task ID for progress updates (optional)
+        force_refresh : bool
+            Ignore cached summaries and chain scans and fetch fresh data
+
+        Returns
+        -------
+        PortfolioSummary
+            Complete portfolio with all positions and aggregations
+
+        """
+        cache_params = [user_address.lower()]
+        if not force_refresh:
+            cached = self._summary_cache.get("get_all_positions", cache_params)
+            if cached is not None:
+                if progress and task_id:
+                    progress.update(task_id, description="✓ Scan complete", completed=100)
+                return cached
+
+        summary = self._fetch_all_positions(user_address, progress, task_id, force_refresh=force_refresh)
+        self._summary_cache.set("get_all_positions", cache_params, summary)
+        return summary
+
+    def _fetch_all_positions(
+        self,
+        user_address: str,
+        progress: Any | None = None,
+        task_id: Any | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> PortfolioSummary:
+        """
+        Fetch all positions for a user, bypassing the summary cache.
+
         Parameters
         ----------
         user_address : str
@@ -62,6 +173,8 @@ class PositionAggregator:
             Rich progress bar instance (optional)
         task_id : Any | None
             Task ID for progress updates (optional)
+        force_refresh : bool
+            Ignore cached chain scans
 
         Returns
         -------
@@ -78,7 +191,7 @@ class PositionAggregator:
         if progress and task_id:
             progress.update(task_id, description="Scanning chains for activity...", completed=20)
 
-        chain_activities = self.scanner.scan_all_chains(user_address)
+        chain_activities = self.scanner.scan_all_chains(user_address, force_refresh=force_refresh)
 
         if self.debug:
             sum(1 for a in chain_activities if a.has_activity)
@@ -89,75 +202,150 @@ class PositionAggregator:
         if not active_chains:
             if self.debug:
                 pass
-            return PortfolioSummary(
-                address=user_address,
-                positions=[],
-                total_usd_value=Decimal(0),
-                by_chain={},
-                by_protocol={},
-                total_claimable_rewards_usd=Decimal(0),
-            )
+            return PortfolioSummary(address=user_address, positions=[])
 
         if self.debug:
             pass
 
-        # Execute chain position fetching in parallel
-        with ThreadPoolExecutor(max_workers=min(len(active_chains), 4)) as executor:
-            # Submit all chain scans
-            future_to_chain = {
-                executor.submit(
-                    self._get_chain_positions_with_debug,
-                    user_address,
-                    activity.chain,
-                    activity.protocols_detected,
-                ): activity
-                for activity in active_chains
-            }
-
-            # Collect results as they complete
-            for i, future in enumerate(as_completed(future_to_chain)):
-                activity = future_to_chain[future]
+        # Execute chain position fetching in parallel on the shared pool
+        future_to_chain = {
+            self._chain_executor.submit(
+                self._get_chain_positions_with_debug,
+                user_address,
+                activity.chain,
+                activity.protocols_detected,
+            ): activity
+            for activity in active_chains
+        }
+
+        # Collect results as they complete; chain fetching spans 20-80% of progress
+        chain_count = len(active_chains)
+        for completed, future in enumerate(as_completed(future_to_chain), start=1):
+            activity = future_to_chain[future]
+
+            if progress and task_id:
+                percent = 20 + 60 * completed // chain_count
+                progress.update(
+                    task_id,
+                    description=f"Fetching positions from {activity.chain}...",
+                    completed=percent,
+                )
 
-                if progress and task_id:
-                    percent = 20 + (60 * (i + 1) // len(active_chains))
-                    progress.update(
-                        task_id,
-                        description=f"Fetching positions from {activity.chain}...",
-                        completed=percent,
-                    )
-
-                try:
-                    chain_positions = future.result(timeout=30)
-                    all_positions.extend(chain_positions)
-                except Exception:
-                    if self.debug:
-                        pass
-                    # Continue with other chains even if one fails
+            try:
+                chain_positions = future.result(timeout=30)
+                all_positions.extend(chain_positions)
+            except Exception:
+                if self.debug:
+                    pass
+                # Continue with other chains even if one fails
 
         if self.debug:
             pass
 
-        # Enrich with USD pricing
+        # Enrich with USD pricing and build the summary in the same pass
         if progress and task_id:
             progress.update(task_id, description="Fetching USD prices...", completed=80)
 
-        enriched_positions = self._enrich_positions_with_pricing(all_positions)
-
-        # Build summary
-        if progress and task_id:
-            progress.update(task_id, description="Building portfolio summary...", completed=95)
-
-        summary = self._build_portfolio_summary(user_address, enriched_positions)
+        summary = self._build_portfolio_summary(user_address, all_positions)
 
         if progress and task_id:
             progress.update(task_id, description="✓ Scan complete", completed=100)
 
         return summary
 
+    async def aget_all_positions(self, user_address: str) -> PortfolioSummary:
+        """
+        Get all positions for a user across all chains and protocols, asynchronously.
+
+        Chains and the protocols on each chain are fanned out with
+        ``asyncio.gather``; the blocking RPC-bound handler calls run in worker
+        threads via ``asyncio.to_thread``.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+
+        Returns
+        -------
+        PortfolioSummary
+            Complete portfolio with all positions and aggregations
+
+        """
+        chain_activities = await asyncio.to_thread(self.scanner.scan_all_chains, user_address)
+        active_chains = [a for a in chain_activities if a.has_activity]
+
+        results = await asyncio.gather(
+            *(self._aget_chain_positions(user_address, a.chain, a.protocols_detected) for a in active_chains),
+            return_exceptions=True,
+        )
+
+        all_positions = []
+        for result in results:
+            if isinstance(result, BaseException):
+                if self.debug:
+                    pass
+                # Continue with other chains even if one fails
+                continue
+            all_positions.extend(result)
+
+        return await asyncio.to_thread(self._build_portfolio_summary, user_address, all_positions)
+
+    async def _aget_chain_positions(
+        self,
+        user_address: str,
+        chain: str,
+        protocols: list[str],
+    ) -> list[Position]:
+        """
+        Fetch positions from multiple protocols on a chain concurrently.
+
+        Parameters
+        ----------
+        user_address : str
+            User address
+        chain : str
+            Chain name
+        protocols : list[str]
+            Protocol names to query
+
+        Returns
+        -------
+        list[Position]
+            All positions found, in the order of ``protocols``
+
+        """
+        handlers = {}
+        for protocol_name in protocols:
+            handler_class = ProtocolRegistry.get_handler(protocol_name)
+            if not handler_class:
+                if self.debug:
+                    pass
+                continue
+            handlers[protocol_name] = self._get_handler(handler_class)
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(handler.get_positions, user_address, chain) for handler in handlers.values()),
+            return_exceptions=True,
+        )
+
+        positions = []
+        for protocol_name, result in zip(handlers, results, strict=True):
+            if isinstance(result, BaseException):
+                # Log error but continue with other protocols
+                if self._console:
+                    self._console.print(f"[red]Error fetching {protocol_name} positions on {chain}: {result}[/red]")
+                continue
+            positions.extend(result)
+
+        return positions
+
     def get_positions_for_chain(
         self,
         user_address: str,
         chain: str,
+        *,
+        enrich: bool = True,
     ) -> list[Position]:
         """
         Get all positions for a user on a specific chain.
@@ -168,6 +356,9 @@ class PositionAggregator:
             User wallet address
         chain : str
             Chain name
+        enrich : bool
+            Add USD values. Pass False to price positions from several chains
+            together with ``enrich_positions``.
 
         Returns
         -------
@@ -178,19 +369,91 @@ class PositionAggregator:
         # Scan chain for protocol activity
         activity = self.scanner.scan_chain(user_address, chain)
 
+        return self.get_positions_for_activity(user_address, activity, enrich=enrich)
+
+    def get_positions_for_activity(
+        self,
+        user_address: str,
+        activity: ChainActivity,
+        *,
+        enrich: bool = True,
+    ) -> list[Position]:
+        """
+        Get positions for a chain that has already been scanned.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+        activity : ChainActivity
+            Result of a prior chain scan
+        enrich : bool
+            Add USD values. Pass False to price positions from several chains
+            together with ``enrich_positions``.
+
+        Returns
+        -------
+        list[Position]
+            All positions from the protocols detected on this chain
+
+        """
         if not activity.has_activity:
             return []
 
         # Fetch positions from detected protocols
         positions = self._get_chain_positions(
             user_address,
-            chain,
+            activity.chain,
             activity.protocols_detected,
         )
 
+        if not enrich:
+            return positions
+
         # Enrich with pricing
         return self._enrich_positions_with_pricing(positions)
 
+    def enrich_positions(self, positions: list[Position]) -> list[Position]:
+        """
+        Add USD values to positions collected without pricing.
+
+        All tokens are priced with a single pricing service call.
+
+        Parameters
+        ----------
+        positions : list[Position]
+            Positions to enrich, possibly from several chains
+
+        Returns
+        -------
+        list[Position]
+            Positions with USD values
+
+        """
+        return self._enrich_positions_with_pricing(positions)
+
+    def summarize_positions(self, user_address: str, positions: list[Position]) -> PortfolioSummary:
+        """
+        Price positions collected without pricing and summarize them.
+
+        Totals are accumulated while each position is priced, so the
+        positions are walked once.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+        positions : list[Position]
+            Positions to price, possibly from several chains
+
+        Returns
+        -------
+        PortfolioSummary
+            Summary with USD values and aggregations
+
+        """
+        return self._build_portfolio_summary(user_address, positions)
+
     def get_positions_for_protocol(
         self,
         user_address: str,
@@ -227,15 +490,40 @@ class PositionAggregator:
         else:
             chains = handler_class.supported_chains
 
-        # Fetch from each chain
+        # Fetch from each chain with one shared handler instance
+        handler = self._get_handler(handler_class)
         for chain_name in chains:
-            handler = handler_class(rpc_provider=self.rpc_provider)
             chain_positions = handler.get_positions(user_address, chain_name)
             positions.extend(chain_positions)
 
         # Enrich with pricing
         return self._enrich_positions_with_pricing(positions)
 
+    def _get_handler(self, handler_class: type[ProtocolHandlerInterface]) -> Any:
+        """
+        Get this aggregator's instance of a handler class.
+
+        Handlers are created once per aggregator and released with it, so a
+        provider is never kept alive past the aggregator that uses it.
+
+        Parameters
+        ----------
+        handler_class : type[ProtocolHandlerInterface]
+            Handler class to instantiate
+
+        Returns
+        -------
+        Any
+            Handler instance bound to ``self.rpc_provider``
+
+        """
+        with self._handlers_lock:
+            handler = self._handlers.get(handler_class)
+            if handler is None:
+                handler = handler_class(rpc_provider=self.rpc_provider)
+                self._handlers[handler_class] = handler
+        return handler
+
     def _get_chain_positions(
         self,
         user_address: str,
@@ -245,6 +533,9 @@ class PositionAggregator:
         """
         Fetch positions from multiple protocols on a chain.
 
+        Protocol handlers are RPC-bound, so they run concurrently on the
+        shared protocol pool. Results keep the order of ``protocols``.
+
         Parameters
         ----------
         user_address : str
@@ -261,6 +552,7 @@ class PositionAggregator:
 
         """
         positions = []
+        futures = {}
 
         for protocol_name in protocols:
             if self.debug:
@@ -272,19 +564,21 @@ class PositionAggregator:
                     pass
                 continue
 
-            # Instantiate handler and fetch positions
-            handler = handler_class(rpc_provider=self.rpc_provider)
+            # Reuse the shared handler instance and fetch positions on the protocol pool
+            handler = self._get_handler(handler_class)
+            futures[protocol_name] = self._protocol_executor.submit(handler.get_positions, user_address, chain)
+
+        for protocol_name, future in futures.items():
             try:
-                protocol_positions = handler.get_positions(user_address, chain)
+                protocol_positions = future.result(timeout=self.PROTOCOL_TIMEOUT)
                 if self.debug:
                     pass
                 positions.extend(protocol_positions)
             except Exception as e:
                 # Log error but continue with other protocols
-                if self.debug:
-                    console = Console()
-                    console.print(f"[red]Error fetching {protocol_name} positions on {chain}: {e}[/red]")
-                    console.print_exception()
+                if self._console:
+                    self._console.print(f"[red]Error fetching {protocol_name} positions on {chain}: {e}[/red]")
+                    self._console.print_exception()
                 continue
 
         return positions
@@ -321,6 +615,7 @@ class PositionAggregator:
     def _enrich_positions_with_pricing(
         self,
         positions: list[Position],
+        summary: PortfolioSummary | None = None,
     ) -> list[Position]:
         """
         Add USD values to positions using pricing service.
@@ -329,6 +624,8 @@ class PositionAggregator:
         ----------
         positions : list[Position]
             Positions to enrich
+        summary : PortfolioSummary | None
+            Summary whose totals are accumulated as each position is priced
 
         Returns
         -------
@@ -339,52 +636,60 @@ class PositionAggregator:
         if not positions:
             return positions
 
-        # Collect unique tokens for price lookup
-        tokens_to_price = {}
-        for position in positions:
-            key = (position.chain, position.token.address)
-            tokens_to_price[key] = position.token
+        # Positions on one chain are priced by address alone when the service supports it
+        first_chain = positions[0].chain
+        get_prices_single_chain = getattr(self.pricing_service, "get_prices_single_chain", None)
+        single_chain = get_prices_single_chain is not None and all(p.chain == first_chain for p in positions)
 
-            if position.underlying_token:
-                key = (position.chain, position.underlying_token.address)
-                tokens_to_price[key] = position.underlying_token
+        # Single prepass: build price keys once as parallel lists
+        token_keys: list[Any] = []
+        underlying_keys: list[Any] = []
+        tokens_to_price: dict[Any, None] = {}
+        for position in positions:
+            chain = position.chain
+            token_key = position.token.address if single_chain else (chain, position.token.address)
+            token_keys.append(token_key)
+            tokens_to_price[token_key] = None
+
+            underlying_token = position.underlying_token
+            if underlying_token:
+                underlying_key = underlying_token.address if single_chain else (chain, underlying_token.address)
+                tokens_to_price[underlying_key] = None
+                underlying_keys.append(underlying_key)
+            else:
+                underlying_keys.append(None)
 
         # Fetch all prices in batch
-        prices = self.pricing_service.get_prices(list(tokens_to_price.keys()))
+        if single_chain and get_prices_single_chain is not None:
+            prices = get_prices_single_chain(first_chain, list(tokens_to_price))
+        else:
+            prices = self.pricing_service.get_prices(list(tokens_to_price))
 
         # Enrich positions
-        for position in positions:
+        for position, token_key, underlying_key in zip(positions, token_keys, underlying_keys, strict=True):
             # For vault positions with underlying tokens, price the underlying balance
             # This ensures we get USD value based on the actual underlying asset (e.g., USDC)
-            if position.underlying_token and position.underlying_balance:
-                underlying_key = (position.chain, position.underlying_token.address)
-                underlying_price = prices.get(underlying_key, Decimal("0"))
-
-                if underlying_price > 0:
-                    position.usd_value = position.underlying_balance * underlying_price
-                    if self.debug:
-                        pass
-                else:
-                    # Fallback to pricing vault shares if underlying price not available
-                    token_key = (position.chain, position.token.address)
-                    token_price = prices.get(token_key, Decimal("0"))
-                    if token_price > 0:
-                        position.usd_value = position.balance * token_price
+            # Vault positions are priced by their underlying balance when known
+            underlying_price = prices.get(underlying_key, ZERO) if underlying_key else ZERO
+            underlying_balance = position.underlying_balance
+            if underlying_price > 0 and underlying_balance:
+                position.usd_value = underlying_balance * underlying_price
             else:
-                # For non-vault positions, price the token directly
-                token_key = (position.chain, position.token.address)
-                token_price = prices.get(token_key, Decimal("0"))
-
+                # Price the token directly (also the fallback when the underlying price is unavailable)
+                token_price = prices.get(token_key, ZERO)
                 if token_price > 0:
                     position.usd_value = position.balance * token_price
 
             # Enrich rewards
             for reward in position.claimable_rewards:
-                reward_key = (position.chain, reward.token.address)
-                reward_price = prices.get(reward_key, Decimal("0"))
+                reward_key = reward.token.address if single_chain else (position.chain, reward.token.address)
+                reward_price = prices.get(reward_key, ZERO)
                 if reward_price > 0:
                     reward.usd_value = reward.amount * reward_price
 
+            if summary is not None:
+                summary.add_to_totals(position)
+
         return positions
 
     def _build_portfolio_summary(
@@ -393,14 +698,14 @@ class PositionAggregator:
         positions: list[Position],
     ) -> PortfolioSummary:
         """
-        Build aggregated portfolio summary.
+        Price positions and build the aggregated summary in a single pass.
 
         Parameters
         ----------
         user_address : str
             User address
         positions : list[Position]
-            All positions
+            All positions, not yet priced
 
         Returns
         -------
@@ -408,30 +713,19 @@ class PositionAggregator:
             Aggregated summary
 
         """
-        total_usd = Decimal("0")
-        by_chain: dict[str, Decimal] = {}
-        by_protocol: dict[str, Decimal] = {}
-        total_rewards_usd = Decimal("0")
-
-        for position in positions:
-            pos_value = position.usd_value or Decimal("0")
-            total_usd += pos_value
+        summary = PortfolioSummary(address=user_address, positions=positions)
+        self._enrich_positions_with_pricing(positions, summary=summary)
+        return summary
 
-            # Aggregate by chain
-            by_chain[position.chain] = by_chain.get(position.chain, Decimal("0")) + pos_value
+    def close(self) -> None:
+        """Shut down the shared worker pools."""
+        self._chain_executor.shutdown(wait=True)
+        self._protocol_executor.shutdown(wait=True)
 
-            # Aggregate by protocol
-            by_protocol[position.protocol] = by_protocol.get(position.protocol, Decimal("0")) + pos_value
+    def __enter__(self) -> "PositionAggregator":
+        """Context manager entry."""
+        return self
 
-            # Sum rewards
-            for reward in position.claimable_rewards:
-                total_rewards_usd += reward.usd_value or Decimal("0")
-
-        return PortfolioSummary(
-            address=user_address,
-            positions=positions,
-            total_usd_value=total_usd,
-            by_chain=by_chain,
-            by_protocol=by_protocol,
-            total_claimable_rewards_usd=total_rewards_usd,
-        )
+    def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: object) -> None:
+        """Context manager exit."""
+        self.close()
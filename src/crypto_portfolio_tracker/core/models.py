@@ -1,9 +1,59 @@
 """Data models for positions, tokens, and portfolio summaries."""
 
-from decimal import Decimal
+from dataclasses import field
+from decimal import ROUND_HALF_UP, Decimal
 from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, PrivateAttr, computed_field
+from pydantic.dataclasses import dataclass
+
+ZERO = Decimal("0")
+MICRO_USD = Decimal("0.000001")
+
+# Fixed-point scales: basis points, USDC/USD 6-decimal rates, Chainlink/Aave base currency, 18-decimal tokens
+E4 = Decimal(10**4)
+E6 = Decimal(10**6)
+E8 = Decimal(10**8)
+E18 = Decimal(10**18)
+
+
+def to_micro_usd(value: Decimal | None) -> int:
+    """
+    Convert a USD amount to integer micro-USD, rounding half up.
+
+    Parameters
+    ----------
+    value : Decimal | None
+        USD amount
+
+    Returns
+    -------
+    int
+        Amount in millionths of a dollar (0 if value is None)
+
+    """
+    if value is None:
+        return 0
+    return int(value.quantize(MICRO_USD, rounding=ROUND_HALF_UP).scaleb(6))
+
+
+def from_micro_usd(micros: int) -> Decimal:
+    """
+    Convert integer micro-USD back to a USD amount.
+
+    Parameters
+    ----------
+    micros : int
+        Amount in millionths of a dollar
+
+    Returns
+    -------
+    Decimal
+        USD amount
+
+    """
+    return Decimal(micros).scaleb(-6)
 
 
 class PositionType(StrEnum):
@@ -16,10 +66,13 @@ class PositionType(StrEnum):
     RESTAKING = "restaking"
 
 
-class Token(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Token:
     """
     Token information.
 
+    Immutable, so a single instance can be shared between positions.
+
     Attributes
     ----------
     address : str
@@ -39,7 +92,8 @@ class Token(BaseModel):
     name: str | None = None
 
 
-class Reward(BaseModel):
+@dataclass(slots=True)
+class Reward:
     """
     Claimable reward information.
 
@@ -59,7 +113,8 @@ class Reward(BaseModel):
     usd_value: Decimal | None = None
 
 
-class Position(BaseModel):
+@dataclass(slots=True)
+class Position:
     """
     Universal position model across all protocols.
 
@@ -100,10 +155,10 @@ class Position(BaseModel):
     underlying_token: Token | None = None
     underlying_balance: Decimal | None = None
     usd_value: Decimal | None = None
-    claimable_rewards: list[Reward] = Field(default_factory=list)
+    claimable_rewards: list[Reward] = field(default_factory=list)
     apy: Decimal | None = None
     health_factor: Decimal | None = None
-    metadata: dict = Field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
 
 
 class PortfolioSummary(BaseModel):
@@ -117,7 +172,7 @@ class PortfolioSummary(BaseModel):
     positions : list[Position]
         All detected positions
     total_usd_value : Decimal
-        Total portfolio value in USD
+        Net portfolio value in USD (borrows are subtracted)
     by_chain : dict[str, Decimal]
         USD value breakdown by chain
     by_protocol : dict[str, Decimal]
@@ -129,13 +184,105 @@ class PortfolioSummary(BaseModel):
 
     address: str
     positions: list[Position]
-    total_usd_value: Decimal
-    by_chain: dict[str, Decimal] = Field(default_factory=dict)
-    by_protocol: dict[str, Decimal] = Field(default_factory=dict)
-    total_claimable_rewards_usd: Decimal = Decimal("0")
+
+    # Totals are held as integer micro-USD and exposed as Decimal properties
+    _total_usd_micros: int = PrivateAttr(default=0)
+    _by_chain_micros: dict[str, int] = PrivateAttr(default_factory=dict)
+    _by_protocol_micros: dict[str, int] = PrivateAttr(default_factory=dict)
+    _total_rewards_micros: int = PrivateAttr(default=0)
+
+    def __init__(
+        self,
+        *,
+        total_usd_value: Decimal = ZERO,
+        by_chain: dict[str, Decimal] | None = None,
+        by_protocol: dict[str, Decimal] | None = None,
+        total_claimable_rewards_usd: Decimal = ZERO,
+        **data: Any,
+    ) -> None:
+        super().__init__(**data)
+        self._total_usd_micros = to_micro_usd(Decimal(total_usd_value))
+        self._by_chain_micros = {chain: to_micro_usd(Decimal(v)) for chain, v in (by_chain or {}).items()}
+        self._by_protocol_micros = {protocol: to_micro_usd(Decimal(v)) for protocol, v in (by_protocol or {}).items()}
+        self._total_rewards_micros = to_micro_usd(Decimal(total_claimable_rewards_usd))
+
+    @computed_field
+    @property
+    def total_usd_value(self) -> Decimal:
+        """Total portfolio value in USD."""
+        return from_micro_usd(self._total_usd_micros)
+
+    @computed_field
+    @property
+    def by_chain(self) -> dict[str, Decimal]:
+        """USD value breakdown by chain."""
+        return {chain: from_micro_usd(micros) for chain, micros in self._by_chain_micros.items()}
+
+    @computed_field
+    @property
+    def by_protocol(self) -> dict[str, Decimal]:
+        """USD value breakdown by protocol."""
+        return {protocol: from_micro_usd(micros) for protocol, micros in self._by_protocol_micros.items()}
+
+    @computed_field
+    @property
+    def total_claimable_rewards_usd(self) -> Decimal:
+        """Total value of all claimable rewards."""
+        return from_micro_usd(self._total_rewards_micros)
+
+    def finalize(self) -> "PortfolioSummary":
+        """
+        Compute totals and breakdowns from positions in a single pass.
+
+        Overwrites ``total_usd_value``, ``by_chain``, ``by_protocol`` and
+        ``total_claimable_rewards_usd``. Values are summed and stored as
+        integer micro-USD.
+
+        Returns
+        -------
+        PortfolioSummary
+            This summary, for chaining
+
+        """
+        self._total_usd_micros = 0
+        self._by_chain_micros = {}
+        self._by_protocol_micros = {}
+        self._total_rewards_micros = 0
+
+        for position in self.positions:
+            self.add_to_totals(position)
+        return self
+
+    def add_to_totals(self, position: Position) -> None:
+        """
+        Add one position's USD values to the totals and breakdowns.
+
+        Lets a caller that already loops over the positions (e.g. to price
+        them) build the totals in that same loop instead of calling
+        ``finalize`` afterwards.
+
+        Borrow positions are debt, so their value is subtracted: totals are
+        net portfolio value.
+
+        Parameters
+        ----------
+        position : Position
+            Position to count; it should already be in ``positions``
+
+        """
+        pos_micros = to_micro_usd(position.usd_value)
+        if position.position_type == PositionType.LENDING_BORROW:
+            pos_micros = -pos_micros
+        self._total_usd_micros += pos_micros
+        self._by_chain_micros[position.chain] = self._by_chain_micros.get(position.chain, 0) + pos_micros
+        self._by_protocol_micros[position.protocol] = self._by_protocol_micros.get(position.protocol, 0) + pos_micros
+
+        for reward in position.claimable_rewards:
+            self._total_rewards_micros += to_micro_usd(reward.usd_value)
 
 
-class ChainActivity(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ChainActivity:
     """
     Detected activity on a specific chain.
 
@@ -152,4 +299,4 @@ class ChainActivity(BaseModel):
 
     chain: str
     has_activity: bool
-    protocols_detected: list[str] = Field(default_factory=list)
+    protocols_detected: list[str] = field(default_factory=list)
@@ -1,6 +1,25 @@
 """Protocol handler registry with auto-registration pattern."""
 
-from typing import Any, Protocol
+import importlib
+import sys
+import threading
+from collections import defaultdict
+from typing import Any, ClassVar, Protocol, TypeVar
+
+from crypto_portfolio_tracker.data import get_protocol_addresses
+
+# Built-in handlers as name -> "module:class", imported on first use
+HANDLER_MANIFEST: dict[str, str] = {
+    "aave_v3": "crypto_portfolio_tracker.protocols.aave:AaveHandler",
+    "beefy": "crypto_portfolio_tracker.protocols.beefy:BeefyHandler",
+    "etherfi": "crypto_portfolio_tracker.protocols.etherfi:EtherfiHandler",
+    "lido": "crypto_portfolio_tracker.protocols.lido:LidoHandler",
+    "morpho": "crypto_portfolio_tracker.protocols.morpho:MorphoHandler",
+}
+
+# Indexed topic positions the user address is probed at when a handler does
+# not declare where the user appears in a discovery event
+DISCOVERY_TOPIC_POSITIONS = (1, 2, 3)
 
 
 class ProtocolHandlerInterface(Protocol):
@@ -25,9 +44,21 @@ class ProtocolHandlerInterface(Protocol):
 
     """
 
-    name: str
-    supported_chains: list[str]
-    discovery_events: list[str]
+    name: ClassVar[str]
+    supported_chains: ClassVar[list[str]]
+    discovery_events: ClassVar[list[str]]
+
+    def __init__(self, rpc_provider: Any | None = None) -> None:
+        """
+        Initialize the handler.
+
+        Parameters
+        ----------
+        rpc_provider : Any | None
+            RPC provider for making contract calls
+
+        """
+        ...
 
     def matches(self, contract_address: str, chain: str) -> bool:
         """
@@ -68,6 +99,10 @@ class ProtocolHandlerInterface(Protocol):
         ...
 
 
+# Handler class passed through the register decorator unchanged
+HandlerClassT = TypeVar("HandlerClassT", bound=type[ProtocolHandlerInterface])
+
+
 class ProtocolRegistry:
     """
     Registry for protocol handlers with auto-registration.
@@ -75,12 +110,29 @@ class ProtocolRegistry:
     Handlers register themselves using the @ProtocolRegistry.register decorator.
     The scanner can then query all handlers for protocol discovery.
 
+    Built-in handlers listed in ``HANDLER_MANIFEST`` are imported lazily, so a
+    lookup by name only imports that handler's module.
+
     """
 
-    _handlers: dict[str, type] = {}
+    _handlers: ClassVar[dict[str, type[ProtocolHandlerInterface]]] = {}
+
+    # Reverse index of chain -> handler classes, maintained on registration
+    _by_chain: ClassVar[defaultdict[str, list[type[ProtocolHandlerInterface]]]] = defaultdict(list)
+
+    # Discovery events and flattened probes per chain, rebuilt after any registration change
+    _discovery_events_cache: ClassVar[dict[str, dict[str, list[str]]]] = {}
+    _discovery_probes_cache: ClassVar[dict[str, dict[str, list[tuple[str, int, tuple[str, ...]]]]]] = {}
+
+    # Provider-less handler instances used for contract matching; provider-bound
+    # handlers are cached by each PositionAggregator instead
+    _instances: ClassVar[dict[type[ProtocolHandlerInterface], Any]] = {}
+
+    # Guards the registration maps and instances against concurrent lazy loads
+    _lock = threading.Lock()
 
     @classmethod
-    def register(cls, handler_class: type) -> type:
+    def register(cls, handler_class: HandlerClassT) -> HandlerClassT:
         """
         Decorator to register a protocol handler.
 
@@ -107,11 +159,36 @@ class ProtocolRegistry:
             msg = f"Handler {handler_class.__name__} must define 'name' attribute"
             raise ValueError(msg)
 
-        cls._handlers[handler_class.name] = handler_class
+        cls._add_handler(handler_class)
         return handler_class
 
     @classmethod
-    def get_handler(cls, protocol_name: str) -> type | None:
+    def _add_handler(cls, handler_class: type[ProtocolHandlerInterface]) -> None:
+        """
+        Register a handler class and index it by chain.
+
+        Parameters
+        ----------
+        handler_class : type[ProtocolHandlerInterface]
+            Handler class to register
+
+        """
+        with cls._lock:
+            previous = cls._handlers.get(handler_class.name)
+            if previous is handler_class:
+                return
+            if previous is not None:
+                for chain in previous.supported_chains:
+                    cls._by_chain[chain].remove(previous)
+
+            cls._handlers[handler_class.name] = handler_class
+            for chain in handler_class.supported_chains:
+                cls._by_chain[chain].append(handler_class)
+            cls._discovery_events_cache.clear()
+            cls._discovery_probes_cache.clear()
+
+    @classmethod
+    def get_handler(cls, protocol_name: str) -> type[ProtocolHandlerInterface] | None:
         """
         Get handler class by protocol name.
 
@@ -122,27 +199,61 @@ class ProtocolRegistry:
 
         Returns
         -------
-        type | None
+        type[ProtocolHandlerInterface] | None
             Handler class or None if not found
 
         """
-        return cls._handlers.get(protocol_name)
+        handler_class = cls._handlers.get(protocol_name)
+        if handler_class is None and protocol_name in HANDLER_MANIFEST:
+            handler_class = cls._load_handler(protocol_name)
+        return handler_class
+
+    @classmethod
+    def _load_handler(cls, protocol_name: str) -> type[ProtocolHandlerInterface]:
+        """
+        Import a built-in handler from the manifest and register it.
+
+        Parameters
+        ----------
+        protocol_name : str
+            Protocol identifier listed in ``HANDLER_MANIFEST``
+
+        Returns
+        -------
+        type[ProtocolHandlerInterface]
+            Handler class
+
+        """
+        module_name, class_name = HANDLER_MANIFEST[protocol_name].split(":")
+        # Import outside the lock: the module's decorator registers through it
+        handler_class: type[ProtocolHandlerInterface] = getattr(importlib.import_module(module_name), class_name)
+        # Register explicitly: the decorator only runs on the module's first import
+        cls._add_handler(handler_class)
+        return handler_class
+
+    @classmethod
+    def _load_all_handlers(cls) -> None:
+        """Import every built-in handler that is not registered yet."""
+        for protocol_name in HANDLER_MANIFEST:
+            if protocol_name not in cls._handlers:
+                cls._load_handler(protocol_name)
 
     @classmethod
-    def get_all_handlers(cls) -> list[type]:
+    def get_all_handlers(cls) -> list[type[ProtocolHandlerInterface]]:
         """
         Get all registered handler classes.
 
         Returns
         -------
-        list[type]
+        list[type[ProtocolHandlerInterface]]
             List of all handler classes
 
         """
+        cls._load_all_handlers()
         return list(cls._handlers.values())
 
     @classmethod
-    def get_handlers_for_chain(cls, chain: str) -> list[type]:
+    def get_handlers_for_chain(cls, chain: str) -> list[type[ProtocolHandlerInterface]]:
         """
         Get all handlers that support a specific chain.
 
@@ -153,17 +264,21 @@ class ProtocolRegistry:
 
         Returns
         -------
-        list[type]
+        list[type[ProtocolHandlerInterface]]
             List of handler classes supporting this chain
 
         """
-        return [handler_class for handler_class in cls._handlers.values() if chain in handler_class.supported_chains]
+        cls._load_all_handlers()
+        return list(cls._by_chain.get(chain, ()))
 
     @classmethod
     def get_discovery_events(cls, chain: str) -> dict[str, list[str]]:
         """
         Get all event signatures for protocol discovery on a chain.
 
+        The mapping is built once per chain and shared between callers;
+        do not mutate it.
+
         Parameters
         ----------
         chain : str
@@ -175,13 +290,69 @@ class ProtocolRegistry:
             Mapping of protocol names to event signature lists
 
         """
-        events = {}
-        for handler_class in cls.get_handlers_for_chain(chain):
-            events[handler_class.name] = handler_class.discovery_events
+        events = cls._discovery_events_cache.get(chain)
+        if events is None:
+            events = {}
+            for handler_class in cls.get_handlers_for_chain(chain):
+                events[handler_class.name] = handler_class.discovery_events
+            cls._discovery_events_cache[chain] = events
         return events
 
     @classmethod
-    def find_handler_for_contract(cls, contract_address: str, chain: str) -> type | None:
+    def get_discovery_probes(cls, chain: str) -> dict[str, list[tuple[str, int, tuple[str, ...]]]]:
+        """
+        Get the flattened discovery log probes for each protocol on a chain.
+
+        Each probe is an (event signature, topic position, contract addresses)
+        triple: one ``eth_getLogs`` query with the user address at that
+        indexed topic, restricted to the given contracts when there are any.
+        Events listed in a handler's ``discovery_topic_positions`` get a
+        single probe at the declared position; others are probed at every
+        position in ``DISCOVERY_TOPIC_POSITIONS``. Contracts come from the
+        handler's ``discovery_contracts`` resolved on this chain; events with
+        no known contract address are probed on any contract. Signatures are
+        lowercased and interned. Built once per chain and shared between
+        callers; do not mutate it.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+
+        Returns
+        -------
+        dict[str, list[tuple[str, int, tuple[str, ...]]]]
+            Mapping of protocol names to (event signature, topic position,
+            contract addresses) probes
+
+        """
+        probes = cls._discovery_probes_cache.get(chain)
+        if probes is None:
+            probes = {}
+            for handler_class in cls.get_handlers_for_chain(chain):
+                known_positions = getattr(handler_class, "discovery_topic_positions", {})
+                known_contracts = getattr(handler_class, "discovery_contracts", {})
+                protocol_addresses = get_protocol_addresses(chain, handler_class.name) if known_contracts else {}
+                probes[handler_class.name] = [
+                    (
+                        sys.intern(event_sig.lower()),
+                        position,
+                        tuple(
+                            protocol_addresses[contract].lower()
+                            for contract in known_contracts.get(event_sig, ())
+                            if contract in protocol_addresses
+                        ),
+                    )
+                    for event_sig in handler_class.discovery_events
+                    for position in (
+                        (known_positions[event_sig],) if event_sig in known_positions else DISCOVERY_TOPIC_POSITIONS
+                    )
+                ]
+            cls._discovery_probes_cache[chain] = probes
+        return probes
+
+    @classmethod
+    def find_handler_for_contract(cls, contract_address: str, chain: str) -> type[ProtocolHandlerInterface] | None:
         """
         Find handler that matches a specific contract address.
 
@@ -194,21 +365,51 @@ class ProtocolRegistry:
 
         Returns
         -------
-        type | None
+        type[ProtocolHandlerInterface] | None
             Handler class if found, None otherwise
 
         """
         for handler_class in cls.get_handlers_for_chain(chain):
-            # Instantiate handler to call matches method
-            handler = handler_class()
+            handler = cls.get_instance(handler_class)
             if handler.matches(contract_address, chain):
                 return handler_class
         return None
 
+    @classmethod
+    def get_instance(cls, handler_class: type[ProtocolHandlerInterface]) -> Any:
+        """
+        Get a shared handler instance without an RPC provider.
+
+        Used for contract matching, which needs no RPC access. Handlers that
+        query a provider are owned by the caller that holds the provider.
+
+        Parameters
+        ----------
+        handler_class : type[ProtocolHandlerInterface]
+            Handler class to instantiate
+
+        Returns
+        -------
+        Any
+            Handler instance
+
+        """
+        with cls._lock:
+            handler = cls._instances.get(handler_class)
+            if handler is None:
+                handler = handler_class(rpc_provider=None)
+                cls._instances[handler_class] = handler
+        return handler
+
     @classmethod
     def clear(cls) -> None:
-        """Clear all registered handlers (useful for testing)."""
-        cls._handlers.clear()
+        """Clear all registered handlers and cached instances (useful for testing)."""
+        with cls._lock:
+            cls._handlers.clear()
+            cls._by_chain.clear()
+            cls._discovery_events_cache.clear()
+            cls._discovery_probes_cache.clear()
+            cls._instances.clear()
 
     @classmethod
     def list_protocols(cls) -> list[str]:
@@ -221,4 +422,5 @@ class ProtocolRegistry:
             List of protocol identifiers
 
         """
+        cls._load_all_handlers()
         return list(cls._handlers.keys())
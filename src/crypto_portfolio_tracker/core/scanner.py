@@ -1,10 +1,42 @@
 """Chain scanner for discovering user positions via event logs."""
 
+import re
+import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 from crypto_portfolio_tracker.core.models import ChainActivity
 from crypto_portfolio_tracker.core.registry import ProtocolRegistry
 from crypto_portfolio_tracker.data import get_all_supported_chains
+from crypto_portfolio_tracker.rpc.cache import PersistentRPCCache, RPCCache
+from crypto_portfolio_tracker.rpc.errors import RPCError
+
+# Transfer(address,address,uint256)
+TRANSFER_TOPIC = sys.intern("0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef")
+
+# Account probe batched before any log scan: nonce, native balance, code
+ACCOUNT_PROBE_METHODS = ("eth_getTransactionCount", "eth_getBalance", "eth_getCode")
+
+# Distinct addresses whose padded topic form is kept
+PADDED_ADDRESS_CACHE_SIZE = 256
+
+# Block range a provider suggests when rejecting a query for result size
+SUGGESTED_RANGE_RE = re.compile(r"\[0x([0-9A-Fa-f]+),\s*0x([0-9A-Fa-f]+)\]")
+
+# JSON-RPC error codes providers use when rejecting eth_getLogs queries for
+# result size or block range (limit exceeded, invalid request, invalid params)
+TOO_MANY_RESULTS_CODES = frozenset({-32005, -32600, -32602})
+
+# Substrings matched in errors without a structured code (e.g., raised by Ape)
+TOO_MANY_RESULTS_MARKERS = (
+    "query returned more than 10000 results",
+    "Try with this block range",
+    "-32005",
+    "-32600",
+)
 
 
 class ChainScanner:
@@ -20,17 +52,58 @@ class ChainScanner:
         RPC provider instance for making queries
     debug : bool
         Enable debug output (default: False)
+    chain_concurrency : int
+        Chains probed at once (default: ``MAX_CHAIN_WORKERS``). Probes share
+        ``rpc_provider``, which must be thread-safe.
+    activity_cache : PersistentRPCCache | None
+        Persistent store of per-protocol discovery results, reused across runs
+        (default: None, always scan the full history)
+    activity_oracle : Any | None
+        Source that already knows where the address is active (e.g.
+        ``ZerionClient``). Its ``has_chain_activity(user_address, chain)``
+        returns True/False, or None when it cannot tell; a known answer
+        replaces the Transfer log scan for that chain.
 
     """
 
-    def __init__(self, rpc_provider: Any, debug: bool = False) -> None:
+    # Block window size for chunked eth_getLogs queries
+    LOG_CHUNK_SIZE = 10_000
+
+    # Block windows sent per JSON-RPC batch when walking a long range
+    LOG_BATCH_WINDOWS = 50
+
+    # Blocks back from the chain head probed before the older history
+    ACTIVITY_LOOKBACK_BLOCKS = 100_000
+
+    # Seconds full-scan results are reused for the same address
+    SCAN_CACHE_TTL = 15
+
+    # Default cap on chains probed concurrently
+    MAX_CHAIN_WORKERS = 8
+
+    def __init__(
+        self,
+        rpc_provider: Any,
+        debug: bool = False,
+        *,
+        chain_concurrency: int = MAX_CHAIN_WORKERS,
+        activity_cache: PersistentRPCCache | None = None,
+        activity_oracle: Any | None = None,
+    ) -> None:
         self.rpc_provider = rpc_provider
         self.debug = debug
+        self.chain_concurrency = chain_concurrency
+        self.activity_cache = activity_cache
+        self.activity_oracle = activity_oracle
+        self._scan_cache = RPCCache(default_ttl=self.SCAN_CACHE_TTL)
 
     def detect_active_chains(self, user_address: str) -> list[str]:
         """
         Detect which chains the user has activity on.
 
+        Chains are probed concurrently, so the wall time is that of the
+        slowest probe rather than the sum of all of them.
+
         Parameters
         ----------
         user_address : str
@@ -42,20 +115,138 @@ class ChainScanner:
             List of chain names with detected activity
 
         """
-        active_chains = []
         supported_chains = get_all_supported_chains()
+        if hasattr(self.rpc_provider, "provider_for"):
+            return self._detect_active_chains_multi(user_address, supported_chains)
+
+        results = self._map_chains(lambda chain: self._has_chain_activity(user_address, chain), supported_chains)
+        return [chain for chain, has_activity in zip(supported_chains, results, strict=True) if has_activity]
+
+    def _detect_active_chains_multi(self, user_address: str, chains: list[str]) -> list[str]:
+        """
+        Detect active chains through a multi-chain provider.
+
+        The account probes for every chain go out together through the
+        provider's ``batch``, one round-trip per endpoint. Only chains the
+        probes leave undecided are scanned individually.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+        chains : list[str]
+            Chain names to check
+
+        Returns
+        -------
+        list[str]
+            Chains with detected activity, in the order of ``chains``
+
+        """
+        known: dict[str, bool] = {}
+        if self.activity_oracle is not None:
+            for chain in chains:
+                answer = self.activity_oracle.has_chain_activity(user_address, chain)
+                if answer is not None:
+                    known[chain] = answer
+
+        probe_chains = [chain for chain in chains if chain not in known]
+        results = self.rpc_provider.batch(
+            [(chain, method, [user_address, "latest"]) for chain in probe_chains for method in ACCOUNT_PROBE_METHODS]
+        )
+        width = len(ACCOUNT_PROBE_METHODS)
+        undecided = []
+        for i, chain in enumerate(probe_chains):
+            account = self._parse_account(*results[i * width : (i + 1) * width])
+            if account is None:
+                undecided.append(chain)
+                continue
+            nonce, balance, has_code = account
+            if nonce == 0 and balance == 0 and not has_code:
+                known[chain] = False
+            elif nonce > 0:
+                known[chain] = True
+            else:
+                undecided.append(chain)
 
-        for chain in supported_chains:
-            if self._has_chain_activity(user_address, chain):
-                active_chains.append(chain)
+        def scan_undecided(chain: str) -> bool:
+            try:
+                provider = self.rpc_provider.provider_for(chain)
+            except KeyError:
+                return False
+            # The oracle was already asked above
+            return ChainScanner(provider, debug=self.debug)._has_chain_activity(user_address, chain)
 
-        return active_chains
+        known.update(zip(undecided, self._map_chains(scan_undecided, undecided), strict=True))
+        return [chain for chain in chains if known.get(chain)]
+
+    def _chain_scanner(self, chain: str) -> "ChainScanner":
+        """
+        Get a scanner whose provider serves a single chain.
+
+        With a multi-chain provider (one with ``provider_for``), per-chain
+        queries must go to that chain's own provider; the returned scanner
+        shares this one's settings and caches. Otherwise this scanner is
+        returned as is.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+
+        Returns
+        -------
+        ChainScanner
+            Scanner for the chain
+
+        Raises
+        ------
+        KeyError
+            If the multi-chain provider has no provider for the chain
+
+        """
+        if not hasattr(self.rpc_provider, "provider_for"):
+            return self
+
+        return ChainScanner(
+            self.rpc_provider.provider_for(chain),
+            debug=self.debug,
+            chain_concurrency=self.chain_concurrency,
+            activity_cache=self.activity_cache,
+            activity_oracle=self.activity_oracle,
+        )
+
+    def _map_chains(self, fn: Callable[[str], Any], chains: list[str]) -> list[Any]:
+        """
+        Apply a per-chain function to each chain concurrently.
+
+        Parameters
+        ----------
+        fn : Callable[[str], Any]
+            Function taking a chain name
+        chains : list[str]
+            Chain names
+
+        Returns
+        -------
+        list[Any]
+            Results in the order of ``chains``
+
+        """
+        if len(chains) <= 1:
+            return [fn(chain) for chain in chains]
+        with ThreadPoolExecutor(max_workers=min(len(chains), self.chain_concurrency)) as executor:
+            return list(executor.map(fn, chains))
 
     def _has_chain_activity(self, user_address: str, chain: str) -> bool:
         """
         Check if user has any activity on a chain.
 
-        Uses a quick Transfer event query to detect token movements.
+        An activity oracle's answer is used when it has one. Otherwise one
+        batched account probe decides most addresses: no nonce, balance or
+        code means unused, and a non-zero nonce means the address has sent
+        transactions. Only the remaining addresses (e.g. receive-only) fall
+        back to a Transfer event query.
 
         Parameters
         ----------
@@ -74,29 +265,39 @@ class ChainScanner:
             if self.debug:
                 pass
 
+            scanner = self._chain_scanner(chain)
+            if scanner is not self:
+                return scanner._has_chain_activity(user_address, chain)
+
+            if self.activity_oracle is not None:
+                known = self.activity_oracle.has_chain_activity(user_address, chain)
+                if known is not None:
+                    return known
+
+            # Cheap account probe before any eth_getLogs
+            account = self._probe_account(user_address)
+            if account is not None:
+                nonce, balance, has_code = account
+                if nonce == 0 and balance == 0 and not has_code:
+                    return False
+                if nonce > 0:
+                    return True
+
             # Query for Transfer events involving user address
             # Transfer event signature: Transfer(address,address,uint256)
             topics = [
-                "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",  # Transfer
+                TRANSFER_TOPIC,
                 None,  # from (any)
                 self._pad_address(user_address),  # to (user)
             ]
 
-            if self.debug:
-                pass
+            latest_block = self._get_latest_block()
+            lookback_start = max(latest_block - self.ACTIVITY_LOOKBACK_BLOCKS + 1, 0)
 
-            logs = self.rpc_provider.make_request(
-                "eth_getLogs",
-                [
-                    {
-                        "fromBlock": "0x0",
-                        "toBlock": "latest",
-                        "topics": topics,
-                    }
-                ],
+            # Recent blocks first, then the older history, both in batched windows
+            has_activity = self._has_logs_in_range(topics, lookback_start, latest_block) or (
+                lookback_start > 0 and self._has_logs_in_range(topics, 0, lookback_start - 1)
             )
-
-            has_activity = len(logs) > 0
             if self.debug:
                 pass
 
@@ -107,10 +308,138 @@ class ChainScanner:
                 pass
             return False
 
+    def is_unused_address(self, user_address: str) -> bool:
+        """
+        Check whether an address has never been used on the connected chain.
+
+        Batches ``eth_getTransactionCount``, ``eth_getBalance`` and
+        ``eth_getCode`` into one round-trip. An address with no outgoing
+        transactions, no native balance and no deployed code has nothing to
+        scan. Contract wallets never send transactions themselves, so any
+        address with code is treated as used and left to the log scan.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+
+        Returns
+        -------
+        bool
+            True only if nonce and balance are zero and no code is deployed;
+            False when any probe fails
+
+        """
+        account = self._probe_account(user_address)
+        if account is None:
+            return False
+
+        nonce, balance, has_code = account
+        return nonce == 0 and balance == 0 and not has_code
+
+    def _probe_account(self, user_address: str) -> tuple[int, int, bool] | None:
+        """
+        Fetch an address's nonce, native balance and code presence in one batch.
+
+        Parameters
+        ----------
+        user_address : str
+            User wallet address
+
+        Returns
+        -------
+        tuple[int, int, bool] | None
+            (nonce, balance in wei, has code), or None if any probe failed
+
+        """
+        try:
+            results = self.rpc_provider.make_batch_request(
+                [(method, [user_address, "latest"]) for method in ACCOUNT_PROBE_METHODS]
+            )
+        except Exception:
+            if self.debug:
+                pass
+            return None
+
+        return self._parse_account(*results)
+
+    @staticmethod
+    def _parse_account(nonce: str | None, balance: str | None, code: str | None) -> tuple[int, int, bool] | None:
+        """
+        Decode the results of an account probe.
+
+        Parameters
+        ----------
+        nonce : str | None
+            ``eth_getTransactionCount`` result
+        balance : str | None
+            ``eth_getBalance`` result
+        code : str | None
+            ``eth_getCode`` result
+
+        Returns
+        -------
+        tuple[int, int, bool] | None
+            (nonce, balance in wei, has code), or None if any probe failed
+
+        """
+        if nonce is None or balance is None or code is None:
+            return None
+
+        return int(nonce, 16), int(balance, 16), code not in ("0x", "0x0")
+
+    def _has_logs_in_range(self, topics: list, from_block: int, to_block: int) -> bool:
+        """
+        Check whether any logs match the topics within a block range.
+
+        The range is walked with ``_query_logs_with_chunking``, so every query
+        covers at most ``LOG_CHUNK_SIZE`` blocks and the walk stops at the
+        first matching log. A "too many results" rejection means the range
+        holds matching logs, so it counts as a hit rather than a failure.
+
+        Parameters
+        ----------
+        topics : list
+            Event topic filters
+        from_block : int
+            Starting block number
+        to_block : int
+            Ending block number (inclusive)
+
+        Returns
+        -------
+        bool
+            True if at least one matching log exists
+
+        """
+        try:
+            return next(self._query_logs_with_chunking(topics, hex(from_block), hex(to_block)), None) is not None
+        except Exception as e:
+            if self._is_too_many_results_error(e):
+                return True
+            raise
+
+    def _get_latest_block(self) -> int:
+        """
+        Get the current chain head block number.
+
+        Returns
+        -------
+        int
+            Latest block number
+
+        """
+        latest = self.rpc_provider.make_request("eth_blockNumber", [])
+        return int(latest, 16) if isinstance(latest, str) else int(latest)
+
     def discover_protocols(self, user_address: str, chain: str) -> list[str]:
         """
         Discover which protocols user has positions on via event logs.
 
+        With an activity cache, protocols already seen stay detected without
+        any query, and protocols found inactive are only re-checked over the
+        blocks mined since their last scan.
+
         Parameters
         ----------
         user_address : str
@@ -127,17 +456,44 @@ class ChainScanner:
         if self.debug:
             pass
 
+        try:
+            scanner = self._chain_scanner(chain)
+        except KeyError:
+            return []
+        if scanner is not self:
+            return scanner.discover_protocols(user_address, chain)
+
         discovered_protocols = []
-        discovery_events = ProtocolRegistry.get_discovery_events(chain)
+        discovery_probes = ProtocolRegistry.get_discovery_probes(chain)
+        activity_cache = self.activity_cache
+        latest_block = None
 
         if self.debug:
             pass
 
-        for protocol_name, event_signatures in discovery_events.items():
+        for protocol_name, probes in discovery_probes.items():
             if self.debug:
                 pass
 
-            if self._has_protocol_activity(user_address, chain, event_signatures):
+            if activity_cache is None:
+                has_activity = self._has_protocol_activity(user_address, chain, probes)
+            else:
+                cached = activity_cache.get_activity(chain, user_address, protocol_name)
+                if cached is not None and cached[0]:
+                    # Past activity never disappears
+                    has_activity = True
+                else:
+                    if latest_block is None:
+                        latest_block = self._get_latest_block()
+                    from_block = cached[1] + 1 if cached is not None else 0
+                    has_activity = self._has_protocol_activity(
+                        user_address, chain, probes, from_block=from_block, to_block=latest_block
+                    )
+                    # Inconclusive scans (failed queries) are not cached
+                    if has_activity is not None:
+                        activity_cache.set_activity(chain, user_address, protocol_name, has_activity, latest_block)
+
+            if has_activity:
                 discovered_protocols.append(protocol_name)
                 if self.debug:
                     pass
@@ -153,75 +509,144 @@ class ChainScanner:
         self,
         user_address: str,
         chain: str,
-        event_signatures: list[str],
-    ) -> bool:
+        probes: list[tuple[str, int, tuple[str, ...]]],
+        from_block: int = 0,
+        to_block: int | None = None,
+    ) -> bool | None:
         """
         Check if user has activity with specific event signatures.
 
+        Every probe is sent in one JSON-RPC batch. Probes the batch could not
+        answer (e.g., rejected for result size) are retried one at a time with
+        block range chunking.
+
         Parameters
         ----------
         user_address : str
             User address
         chain : str
             Chain name
-        event_signatures : list[str]
-            Event signature hashes to query
+        probes : list[tuple[str, int, tuple[str, ...]]]
+            (event signature, topic position, contract addresses) triples,
+            with the user address placed at the given indexed topic and the
+            query restricted to the contracts when any are given
+        from_block : int
+            First block to search (default: genesis)
+        to_block : int | None
+            Last block to search (default: latest)
 
         Returns
         -------
-        bool
-            True if any matching events found
+        bool | None
+            True if any matching events found, False if none were, None if
+            nothing was found but some queries failed
 
         """
         try:
             padded_address = self._pad_address(user_address)
 
-            for event_sig in event_signatures:
+            if not probes:
+                return False
+
+            # Topics with the user address at the probe's indexed position, plus
+            # the emitting contracts so the node can use its address index
+            probe_filters = [
+                ([event_sig, *([None] * (position - 1)), padded_address], list(addresses) or None)
+                for event_sig, position, addresses in probes
+            ]
+            from_tag = hex(from_block)
+            to_tag = "latest" if to_block is None else hex(to_block)
+
+            try:
+                results = self.rpc_provider.make_batch_request(
+                    [
+                        ("eth_getLogs", [self._log_filter(topics, from_tag, to_tag, address)])
+                        for topics, address in probe_filters
+                    ]
+                )
+            except Exception:
                 if self.debug:
                     pass
+                results = [None] * len(probe_filters)
+
+            if any(results):
+                return True
+
+            failed = False
+            for (topics, address), logs in zip(probe_filters, results, strict=True):
+                if logs is not None:
+                    continue
+                try:
+                    logs = self._query_logs_with_chunking(
+                        topics=topics,
+                        from_block=from_tag,
+                        to_block=to_tag,
+                        address=address,
+                    )
 
-                # Query logs with event signature and user address
-                # Try user address in different topic positions (indexed params vary by event)
-                for topics in [
-                    [event_sig, padded_address],  # User as first indexed param
-                    [event_sig, None, padded_address],  # User as second indexed param
-                    [event_sig, None, None, padded_address],  # User as third indexed param
-                ]:
-                    try:
-                        logs = self._query_logs_with_chunking(
-                            topics=topics,
-                            from_block="0x0",
-                            to_block="latest",
-                        )
+                    if self.debug:
+                        pass
 
+                    if next(logs, None) is not None:
                         if self.debug:
                             pass
+                        return True
 
-                        if len(logs) > 0:
-                            if self.debug:
-                                pass
-                            return True
-
-                    except Exception:
-                        if self.debug:
-                            pass
-                        continue
+                except Exception:
+                    if self.debug:
+                        pass
+                    failed = True
+                    continue
 
-            return False
+            return None if failed else False
         except Exception:
             # If query fails, assume no activity
             if self.debug:
                 pass
-            return False
+            return None
+
+    @staticmethod
+    def _log_filter(topics: list, from_block: str, to_block: str, address: list[str] | None = None) -> dict:
+        """
+        Build an ``eth_getLogs`` filter object.
+
+        Parameters
+        ----------
+        topics : list
+            Event topic filters
+        from_block : str
+            Starting block (hex)
+        to_block : str
+            Ending block (hex or 'latest')
+        address : list[str] | None
+            Contract addresses to restrict the query to (None = any contract)
+
+        Returns
+        -------
+        dict
+            Filter object
+
+        """
+        log_filter = {"fromBlock": from_block, "toBlock": to_block, "topics": topics}
+        if address:
+            log_filter["address"] = address
+        return log_filter
 
     def _query_logs_with_chunking(
         self,
         topics: list,
         from_block: str,
         to_block: str,
-    ) -> list:
+        address: list[str] | None = None,
+    ) -> Iterator[dict]:
         """
-        Query logs with automatic block range chunking on large result errors.
+        Stream logs over a block range split into fixed ``LOG_CHUNK_SIZE`` windows.
+
+        Windows are sent ``LOG_BATCH_WINDOWS`` at a time as JSON-RPC batches.
+        A window the batch could not answer is retried on its own, following
+        the provider's suggested sub-ranges if it reports too many results.
+        Logs are yielded batch by batch, so a caller that stops after the
+        first log skips the remaining windows.
 
         Parameters
         ----------
@@ -231,75 +656,120 @@ class ChainScanner:
             Starting block (hex)
         to_block : str
             Ending block (hex or 'latest')
+        address : list[str] | None
+            Contract addresses to restrict the query to (None = any contract)
 
-        Returns
-        -------
-        list
-            Combined logs from all chunks
+        Yields
+        ------
+        dict
+            Matching logs, in block order
 
         """
-        try:
-            logs = self.rpc_provider.make_request(
-                "eth_getLogs",
+        start = int(from_block, 16)
+        end = self._get_latest_block() if to_block == "latest" else int(to_block, 16)
+        windows = [
+            (window_start, min(window_start + self.LOG_CHUNK_SIZE - 1, end))
+            for window_start in range(start, end + 1, self.LOG_CHUNK_SIZE)
+        ]
+
+        for i in range(0, len(windows), self.LOG_BATCH_WINDOWS):
+            batch = windows[i : i + self.LOG_BATCH_WINDOWS]
+            results = self.rpc_provider.make_batch_request(
                 [
-                    {
-                        "fromBlock": from_block,
-                        "toBlock": to_block,
-                        "topics": topics,
-                    }
-                ],
+                    ("eth_getLogs", [self._log_filter(topics, hex(window_start), hex(window_end), address)])
+                    for window_start, window_end in batch
+                ]
             )
-            return logs
+            for (window_start, window_end), logs in zip(batch, results, strict=True):
+                if logs is None:
+                    logs = self._query_logs_in_suggested_ranges(
+                        topics, hex(window_start), hex(window_end), address=address
+                    )
+                yield from logs
 
-        except Exception as e:
-            error_msg = str(e)
+    def _query_logs_in_suggested_ranges(
+        self,
+        topics: list,
+        from_block: str,
+        to_block: str,
+        address: list[str] | None = None,
+    ) -> list:
+        """
+        Query logs, splitting on the block range a "too many results" error suggests.
 
-            # Check if error is about too many results with suggested block ranges
-            if "query returned more than 10000 results" in error_msg or "Try with this block range" in error_msg:
-                # Extract suggested block range from error message
-                # Format: "Try with this block range [0xE4E58A, 0xFEE64F]"
-                import re
+        Pending ranges are worked off an explicit queue: a rejected range is
+        replaced by the suggested sub-range plus the spans before and after
+        it. Each range is queried at most once, and logs are deduplicated by
+        (transaction hash, log index).
 
-                match = re.search(r"\[0x([0-9A-Fa-f]+),\s*0x([0-9A-Fa-f]+)\]", error_msg)
-                if match:
-                    suggested_from = f"0x{match.group(1)}"
-                    suggested_to = f"0x{match.group(2)}"
+        Parameters
+        ----------
+        topics : list
+            Event topic filters
+        from_block : str
+            Starting block (hex)
+        to_block : str
+            Ending block (hex or 'latest')
+        address : list[str] | None
+            Contract addresses to restrict the query to (None = any contract)
 
-                    if self.debug:
-                        pass
+        Returns
+        -------
+        list
+            Combined logs from all sub-ranges
 
-                    # Query the suggested range
-                    chunk_logs = self._query_logs_with_chunking(topics, suggested_from, suggested_to)
-
-                    # Also query before and after the suggested range (if there's more data)
-                    all_logs = chunk_logs
-
-                    # Query before suggested range (from original start to suggested start)
-                    if from_block != suggested_from:
-                        try:
-                            # Calculate block before suggested start
-                            suggested_from_int = int(suggested_from, 16)
-                            before_end = hex(suggested_from_int - 1)
-                            before_logs = self._query_logs_with_chunking(topics, from_block, before_end)
-                            all_logs.extend(before_logs)
-                        except Exception:
-                            pass
+        Raises
+        ------
+        Exception
+            If a query fails for any reason other than a "too many results"
+            rejection with a usable suggested range
 
-                    # Query after suggested range (from suggested end to original end)
-                    if to_block == "latest" or (to_block != suggested_to):
-                        try:
-                            # Calculate block after suggested end
-                            suggested_to_int = int(suggested_to, 16)
-                            after_start = hex(suggested_to_int + 1)
-                            after_logs = self._query_logs_with_chunking(topics, after_start, to_block)
-                            all_logs.extend(after_logs)
-                        except Exception:
-                            pass
+        """
+        end = self._get_latest_block() if to_block == "latest" else int(to_block, 16)
+        pending = deque([(int(from_block, 16), end)])
+        seen_ranges: set[tuple[int, int]] = set()
+        seen_log_ids: set[tuple[str | None, str | None]] = set()
+        all_logs = []
+
+        while pending:
+            block_range = pending.popleft()
+            range_start, range_end = block_range
+            if range_start > range_end or block_range in seen_ranges:
+                continue
+            seen_ranges.add(block_range)
+
+            try:
+                logs = self.rpc_provider.make_request(
+                    "eth_getLogs",
+                    [self._log_filter(topics, hex(range_start), hex(range_end), address)],
+                )
+            except Exception as e:
+                suggested_range = self._suggested_range(e) if self._is_too_many_results_error(e) else None
+                if suggested_range is None:
+                    raise
 
-                    return all_logs
+                # Keep the suggestion inside the rejected range
+                suggested_start = max(suggested_range[0], range_start)
+                suggested_end = min(suggested_range[1], range_end)
+                if suggested_start > suggested_end or (suggested_start, suggested_end) == block_range:
+                    raise
 
-            # Re-raise if not a "too many results" error or can't parse block range
-            raise
+                if self.debug:
+                    pass
+
+                pending.append((suggested_start, suggested_end))
+                pending.append((range_start, suggested_start - 1))
+                pending.append((suggested_end + 1, range_end))
+                continue
+
+            for log in logs:
+                log_id = (log.get("transactionHash"), log.get("logIndex"))
+                if log_id in seen_log_ids:
+                    continue
+                seen_log_ids.add(log_id)
+                all_logs.append(log)
+
+        return all_logs
 
     def scan_chain(self, user_address: str, chain: str) -> ChainActivity:
         """
@@ -335,14 +805,18 @@ class ChainScanner:
             protocols_detected=protocols,
         )
 
-    def scan_all_chains(self, user_address: str) -> list[ChainActivity]:
+    def scan_all_chains(self, user_address: str, *, force_refresh: bool = False) -> list[ChainActivity]:
         """
         Scan all supported chains for user activity.
 
+        Results are cached per address for ``SCAN_CACHE_TTL`` seconds.
+
         Parameters
         ----------
         user_address : str
             User wallet address
+        force_refresh : bool
+            Ignore a cached result and scan again
 
         Returns
         -------
@@ -350,13 +824,25 @@ class ChainScanner:
             Activity summary for each chain
 
         """
-        results = []
+        cache_params = [user_address.lower()]
+        if not force_refresh:
+            cached = self._scan_cache.get("scan_all_chains", cache_params)
+            if cached is not None:
+                return cached
+
         active_chains = self.detect_active_chains(user_address)
+        scanned = dict(
+            zip(
+                active_chains,
+                self._map_chains(lambda chain: self.scan_chain(user_address, chain), active_chains),
+                strict=True,
+            )
+        )
 
+        results = []
         for chain in get_all_supported_chains():
-            if chain in active_chains:
-                activity = self.scan_chain(user_address, chain)
-                results.append(activity)
+            if chain in scanned:
+                results.append(scanned[chain])
             else:
                 # Skip full scan for inactive chains
                 results.append(
@@ -367,13 +853,76 @@ class ChainScanner:
                     )
                 )
 
+        self._scan_cache.set("scan_all_chains", cache_params, results)
         return results
 
     @staticmethod
+    def _is_too_many_results_error(error: Exception) -> bool:
+        """
+        Check if an eth_getLogs error means the query matched too many results.
+
+        Parameters
+        ----------
+        error : Exception
+            Error raised by the RPC provider
+
+        Returns
+        -------
+        bool
+            True if the provider rejected the query for its result size
+
+        """
+        if isinstance(error, RPCError) and error.code is not None:
+            return error.code in TOO_MANY_RESULTS_CODES
+        error_msg = str(error)
+        return any(marker in error_msg for marker in TOO_MANY_RESULTS_MARKERS)
+
+    @staticmethod
+    def _suggested_range(error: Exception) -> tuple[int, int] | None:
+        """
+        Extract the block range a provider suggests in a "too many results" error.
+
+        Structured errors may carry the range as ``{"from": ..., "to": ...}``
+        in their ``data`` member; otherwise it is read from the message, e.g.
+        "Try with this block range [0xE4E58A, 0xFEE64F]".
+
+        Parameters
+        ----------
+        error : Exception
+            Error raised by the RPC provider
+
+        Returns
+        -------
+        tuple[int, int] | None
+            First and last block of the suggested range, or None if the
+            error suggests none
+
+        """
+        if isinstance(error, RPCError):
+            data = error.data
+            if isinstance(data, dict) and isinstance(data.get("from"), str) and isinstance(data.get("to"), str):
+                try:
+                    return int(data["from"], 16), int(data["to"], 16)
+                except ValueError:
+                    pass
+            error_msg = error.message
+        else:
+            error_msg = str(error)
+
+        match = SUGGESTED_RANGE_RE.search(error_msg)
+        if not match:
+            return None
+        return int(match.group(1), 16), int(match.group(2), 16)
+
+    @staticmethod
+    @lru_cache(maxsize=PADDED_ADDRESS_CACHE_SIZE)
     def _pad_address(address: str) -> str:
         """
         Pad address to 32 bytes for topic filtering.
 
+        Memoized, so a scan pads each address once rather than once per
+        chain and per discovery probe.
+
         Parameters
         ----------
         address : str
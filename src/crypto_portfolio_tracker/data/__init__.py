@@ -1,20 +1,43 @@
 """Data loading and configuration management."""
 
-from crypto_portfolio_tracker.data.addresses import (
-    CHAINLINK_PRICE_FEEDS,
-    MULTICALL3_ADDRESS,
-    PROTOCOL_ADDRESSES,
-    TOKEN_ADDRESSES,
-)
-from crypto_portfolio_tracker.data.loader import (
-    get_all_supported_chains,
-    get_chain_config,
-    get_chain_id,
-    get_event_signatures,
-    get_protocol_addresses,
-    get_rpc_endpoints,
-    load_contracts,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from crypto_portfolio_tracker.data.addresses import (
+        CHAINLINK_PRICE_FEEDS,
+        MULTICALL3_ADDRESS,
+        PROTOCOL_ADDRESSES,
+        TOKEN_ADDRESSES,
+    )
+    from crypto_portfolio_tracker.data.loader import (
+        get_all_supported_chains,
+        get_chain_config,
+        get_chain_id,
+        get_event_signatures,
+        get_protocol_address_set,
+        get_protocol_addresses,
+        get_rpc_endpoints,
+        load_contracts,
+        reload_contracts,
+    )
+
+# Public name -> submodule defining it, imported on first attribute access
+_LAZY_ATTRIBUTES = {
+    "CHAINLINK_PRICE_FEEDS": "addresses",
+    "MULTICALL3_ADDRESS": "addresses",
+    "PROTOCOL_ADDRESSES": "addresses",
+    "TOKEN_ADDRESSES": "addresses",
+    "get_all_supported_chains": "loader",
+    "get_chain_config": "loader",
+    "get_chain_id": "loader",
+    "get_event_signatures": "loader",
+    "get_protocol_address_set": "loader",
+    "get_protocol_addresses": "loader",
+    "get_rpc_endpoints": "loader",
+    "load_contracts": "loader",
+    "reload_contracts": "loader",
+}
 
 __all__ = [
     # Centralized address constants
@@ -26,8 +49,40 @@ __all__ = [
     "get_chain_config",
     "get_chain_id",
     "get_event_signatures",
+    "get_protocol_address_set",
     "get_protocol_addresses",
     "get_rpc_endpoints",
     # Loader functions
     "load_contracts",
+    "reload_contracts",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public name from its submodule on first access (PEP 562).
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    Any
+        The attribute, cached in the package namespace afterwards
+
+    Raises
+    ------
+    AttributeError
+        If the name is not part of the package
+
+    """
+    submodule = _LAZY_ATTRIBUTES.get(name)
+    if submodule is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
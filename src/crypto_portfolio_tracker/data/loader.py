@@ -1,5 +1,7 @@
 """Contract address and configuration loader."""
 
+import sys
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -7,11 +9,19 @@ import yaml
 
 from crypto_portfolio_tracker.data.addresses import PROTOCOL_ADDRESSES
 
+# libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+@cache
 def load_contracts() -> dict[str, Any]:
     """
     Load centralized contract addresses from contracts.yaml.
 
+    The file is parsed once; the returned dict is shared between callers
+    and must not be mutated. Use ``reload_contracts`` to re-read it. Event
+    signature hashes are lowercased and interned.
+
     Returns
     -------
     dict[str, Any]
@@ -20,7 +30,21 @@ def load_contracts() -> dict[str, Any]:
     """
     path = Path(__file__).parent / "contracts.yaml"
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        contracts = yaml.load(f, Loader=YAML_LOADER)  # noqa: S506 (always a safe loader)
+
+    for protocol_events in (contracts.get("event_signatures") or {}).values():
+        for event_name, signature in protocol_events.items():
+            protocol_events[event_name] = sys.intern(signature.lower())
+
+    return contracts
+
+
+def reload_contracts() -> None:
+    """Drop the parsed contracts.yaml and every lookup memoized from it."""
+    load_contracts.cache_clear()
+    get_all_supported_chains.cache_clear()
+    get_protocol_addresses.cache_clear()
+    get_protocol_address_set.cache_clear()
 
 
 def get_chain_config(chain: str) -> dict[str, Any]:
@@ -47,10 +71,14 @@ def get_chain_config(chain: str) -> dict[str, Any]:
     return contracts["chains"][chain]
 
 
+@cache
 def get_protocol_addresses(chain: str, protocol: str) -> dict[str, str]:
     """
     Get all contract addresses for a protocol on a chain.
 
+    Results are memoized per (chain, protocol); the returned dict is shared
+    between callers and must not be mutated.
+
     Parameters
     ----------
     chain : str
@@ -83,6 +111,30 @@ def get_protocol_addresses(chain: str, protocol: str) -> dict[str, str]:
         return {}
 
 
+@cache
+def get_protocol_address_set(chain: str, protocol: str) -> frozenset[str]:
+    """
+    Get the lowercased contract addresses of a protocol on a chain.
+
+    Built once per (chain, protocol) so address matching is a single set
+    membership test.
+
+    Parameters
+    ----------
+    chain : str
+        Chain name (e.g., 'ethereum', 'base')
+    protocol : str
+        Protocol name (e.g., 'aave_v3', 'lido')
+
+    Returns
+    -------
+    frozenset[str]
+        Lowercased contract addresses
+
+    """
+    return frozenset(address.lower() for address in get_protocol_addresses(chain, protocol).values())
+
+
 def get_rpc_endpoints(chain: str) -> list[str]:
     """
     Get list of RPC endpoints for a chain.
@@ -121,10 +173,14 @@ def get_event_signatures(protocol: str) -> dict[str, str]:
     return contracts.get("event_signatures", {}).get(protocol, {})
 
 
+@cache
 def get_all_supported_chains() -> list[str]:
     """
     Get list of all supported chain names.
 
+    The result is memoized; the returned list is shared between callers and
+    must not be mutated.
+
     Returns
     -------
     list[str]
@@ -1,11 +1,47 @@
 """Zerion API client for comprehensive position aggregation."""
 
+import atexit
+import re
+import threading
+from collections import OrderedDict
 from decimal import Decimal
+from importlib.util import find_spec
 from typing import Any
 
 import httpx
+import orjson
 
-from crypto_portfolio_tracker.core.models import Position, PositionType, Token
+from crypto_portfolio_tracker.core.models import ZERO, Position, PositionType, Token
+from crypto_portfolio_tracker.rpc.cache import RPCCache
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Keep connections to the API warm between requests
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+
+
+# Protocol detection patterns based on token symbols
+PROTOCOL_PATTERNS = {
+    # Aave: aTokens (aEthUSDC, aBasUSDC, etc.)
+    "aave": ["abas", "aeth", "aopt", "apol", "aarb"],
+    # Morpho: Various vault tokens (steakUSDC, sparkUSDC, etc.)
+    "morpho": ["steak", "spark", "steakhouse", "morpho"],
+    # Beefy: mooTokens
+    "beefy": ["moo"],
+    # Ether.fi: eETH, weETH, liquidUSD
+    "etherfi": ["eeth", "weeth", "liquidusd"],
+    # Lido: stETH, wstETH
+    "lido": ["steth", "wsteth"],
+}
+
+# All patterns in one regex, one named group per protocol; the leftmost match wins
+PROTOCOL_PATTERN_RE = re.compile(
+    "|".join(
+        f"(?P<{protocol}>{'|'.join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))})"
+        for protocol, patterns in PROTOCOL_PATTERNS.items()
+    )
+)
 
 
 class ZerionAPIError(Exception):
@@ -41,6 +77,12 @@ class ZerionClient:
     # Reverse mapping for converting Zerion chain IDs to our chain names
     REVERSE_CHAIN_MAPPING = {v: k for k, v in CHAIN_MAPPING.items()}
 
+    # Seconds a wallet's active chains are reused by has_chain_activity
+    ACTIVE_CHAINS_TTL = 60
+
+    # Parsed positions responses kept for conditional requests (ETag / Last-Modified)
+    CONDITIONAL_CACHE_SIZE = 32
+
     def __init__(
         self,
         api_key: str,
@@ -62,10 +104,19 @@ class ZerionClient:
         """
         self.api_key = api_key
         self.base_url = base_url
+        self.timeout = timeout
         self.client = httpx.Client(
+            transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS, retries=2),
             timeout=timeout,
             auth=(api_key, ""),  # Zerion uses HTTP basic auth with key as username
         )
+        self._async_client: httpx.AsyncClient | None = None
+        self._active_chains_cache = RPCCache(default_ttl=self.ACTIVE_CHAINS_TTL)
+        # (wallet, chain ids) -> (validator headers, parsed response), least recently used first
+        self._conditional_cache: OrderedDict[tuple[str, frozenset[str]], tuple[dict[str, str], dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._conditional_lock = threading.Lock()
 
     def get_positions(
         self,
@@ -75,6 +126,10 @@ class ZerionClient:
         """
         Fetch all positions for a wallet across specified chains.
 
+        Repeated requests are conditional: when the API answers
+        ``304 Not Modified`` the previously parsed response is returned.
+        It is shared between calls; do not mutate it.
+
         Parameters
         ----------
         wallet_address : str
@@ -92,6 +147,83 @@ class ZerionClient:
         ZerionAPIError
             If the API request fails
 
+        """
+        url, params = self._positions_request(wallet_address, chains)
+        cache_key, headers = self._conditional_headers(wallet_address, params)
+
+        try:
+            response = self.client.get(url, params=params, headers=headers)
+            return self._parse_positions_response(cache_key, response)
+        except httpx.HTTPError as e:
+            raise self._api_error(e) from e
+        except orjson.JSONDecodeError as e:
+            msg = f"Invalid JSON response: {e}"
+            raise ZerionAPIError(msg) from e
+
+    async def get_positions_async(
+        self,
+        wallet_address: str,
+        chains: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch all positions for a wallet asynchronously.
+
+        Requests share one pooled ``httpx.AsyncClient``, so several wallets
+        can be queried concurrently with ``asyncio.gather``.
+
+        Parameters
+        ----------
+        wallet_address : str
+            Wallet address
+        chains : list[str] | None
+            List of chain names to query (None = all supported chains)
+
+        Returns
+        -------
+        dict[str, Any]
+            Raw Zerion API response with positions
+
+        Raises
+        ------
+        ZerionAPIError
+            If the API request fails
+
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS, retries=2),
+                timeout=self.timeout,
+                auth=(self.api_key, ""),
+            )
+
+        url, params = self._positions_request(wallet_address, chains)
+        cache_key, headers = self._conditional_headers(wallet_address, params)
+
+        try:
+            response = await self._async_client.get(url, params=params, headers=headers)
+            return self._parse_positions_response(cache_key, response)
+        except httpx.HTTPError as e:
+            raise self._api_error(e) from e
+        except orjson.JSONDecodeError as e:
+            msg = f"Invalid JSON response: {e}"
+            raise ZerionAPIError(msg) from e
+
+    def _positions_request(self, wallet_address: str, chains: list[str] | None) -> tuple[str, dict[str, str]]:
+        """
+        Build the URL and query parameters for a positions request.
+
+        Parameters
+        ----------
+        wallet_address : str
+            Wallet address
+        chains : list[str] | None
+            List of chain names to query (None = all supported chains)
+
+        Returns
+        -------
+        tuple[str, dict[str, str]]
+            Request URL and query parameters
+
         """
         # Convert chain names to Zerion chain IDs
         chain_ids = []
@@ -110,21 +242,156 @@ class ZerionClient:
             "currency": "usd",
         }
 
-        try:
-            url = f"{self.base_url}/wallets/{wallet_address}/positions/"
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        return f"{self.base_url}/wallets/{wallet_address}/positions/", params
 
-        except httpx.TimeoutException as e:
-            msg = f"Request timeout: {e}"
-            raise ZerionAPIError(msg) from e
-        except httpx.HTTPStatusError as e:
-            msg = f"HTTP error {e.response.status_code}: {e}"
-            raise ZerionAPIError(msg) from e
-        except httpx.HTTPError as e:
-            msg = f"HTTP request failed: {e}"
-            raise ZerionAPIError(msg) from e
+    def _conditional_headers(
+        self,
+        wallet_address: str,
+        params: dict[str, str],
+    ) -> tuple[tuple[str, frozenset[str]], dict[str, str]]:
+        """
+        Build the conditional request headers for a positions request.
+
+        Parameters
+        ----------
+        wallet_address : str
+            Wallet address
+        params : dict[str, str]
+            Query parameters from ``_positions_request``
+
+        Returns
+        -------
+        tuple[tuple[str, frozenset[str]], dict[str, str]]
+            Conditional cache key and the If-None-Match / If-Modified-Since
+            headers (empty when nothing is cached)
+
+        """
+        cache_key = (wallet_address.lower(), frozenset(params["filter[chain_ids]"].split(",")))
+        with self._conditional_lock:
+            cached = self._conditional_cache.get(cache_key)
+        if cached is None:
+            return cache_key, {}
+
+        validators, _ = cached
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last-modified" in validators:
+            headers["If-Modified-Since"] = validators["last-modified"]
+        return cache_key, headers
+
+    def _parse_positions_response(
+        self,
+        cache_key: tuple[str, frozenset[str]],
+        response: httpx.Response,
+    ) -> dict[str, Any]:
+        """
+        Parse a positions response, reusing the cached body on 304.
+
+        Parameters
+        ----------
+        cache_key : tuple[str, frozenset[str]]
+            Conditional cache key from ``_conditional_headers``
+        response : httpx.Response
+            API response
+
+        Returns
+        -------
+        dict[str, Any]
+            Parsed positions response
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            If the API returned an error status
+        orjson.JSONDecodeError
+            If the body is not valid JSON
+
+        """
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            with self._conditional_lock:
+                cached = self._conditional_cache.get(cache_key)
+                if cached is not None:
+                    self._conditional_cache.move_to_end(cache_key)
+                    return cached[1]
+
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        validators = {name: response.headers[name] for name in ("etag", "last-modified") if name in response.headers}
+        with self._conditional_lock:
+            if validators:
+                self._conditional_cache[cache_key] = (validators, data)
+                self._conditional_cache.move_to_end(cache_key)
+                if len(self._conditional_cache) > self.CONDITIONAL_CACHE_SIZE:
+                    self._conditional_cache.popitem(last=False)
+            else:
+                self._conditional_cache.pop(cache_key, None)
+        return data
+
+    @staticmethod
+    def _api_error(error: httpx.HTTPError) -> ZerionAPIError:
+        """
+        Wrap an httpx error in a ZerionAPIError.
+
+        Parameters
+        ----------
+        error : httpx.HTTPError
+            Error raised by the HTTP client
+
+        Returns
+        -------
+        ZerionAPIError
+            Error to raise
+
+        """
+        if isinstance(error, httpx.TimeoutException):
+            msg = f"Request timeout: {error}"
+        elif isinstance(error, httpx.HTTPStatusError):
+            msg = f"HTTP error {error.response.status_code}: {error}"
+        else:
+            msg = f"HTTP request failed: {error}"
+        return ZerionAPIError(msg)
+
+    def has_chain_activity(self, wallet_address: str, chain: str) -> bool | None:
+        """
+        Tell whether a wallet holds any position on a chain.
+
+        Lets ``ChainScanner`` use Zerion as an activity oracle: one positions
+        request per wallet answers every chain.
+
+        Parameters
+        ----------
+        wallet_address : str
+            Wallet address
+        chain : str
+            Chain name
+
+        Returns
+        -------
+        bool | None
+            True if Zerion reports positions on the chain, False if not, None
+            if the chain is unsupported or the request failed
+
+        """
+        if chain not in self.CHAIN_MAPPING:
+            return None
+
+        cache_params = [wallet_address.lower()]
+        active_chains = self._active_chains_cache.get("active_chains", cache_params)
+        if active_chains is None:
+            try:
+                raw_data = self.get_positions(wallet_address)
+            except ZerionAPIError:
+                return None
+            active_chains = {
+                self.REVERSE_CHAIN_MAPPING.get(chain_id, chain_id)
+                for item in raw_data.get("data", [])
+                if (chain_id := item.get("relationships", {}).get("chain", {}).get("data", {}).get("id"))
+            }
+            self._active_chains_cache.set("active_chains", cache_params, active_chains)
+
+        return chain in active_chains
 
     def get_positions_as_models(
         self,
@@ -149,15 +416,21 @@ class ZerionClient:
         """
         raw_data = self.get_positions(wallet_address, chains)
         positions = []
+        # Token address per chain for each fungible_info dict; ids stay valid while raw_data is alive
+        addresses_cache: dict[int, dict[str, str]] = {}
 
         for item in raw_data.get("data", []):
-            position = self._parse_position(item)
+            position = self._parse_position(item, addresses_cache)
             if position:
                 positions.append(position)
 
         return positions
 
-    def _parse_position(self, item: dict[str, Any]) -> Position | None:
+    def _parse_position(
+        self,
+        item: dict[str, Any],
+        addresses_cache: dict[int, dict[str, str]] | None = None,
+    ) -> Position | None:
         """
         Parse a Zerion position into a Position model.
 
@@ -165,6 +438,9 @@ class ZerionClient:
         ----------
         item : dict[str, Any]
             Raw position data from Zerion
+        addresses_cache : dict[int, dict[str, str]] | None
+            Token addresses by Zerion chain id, keyed by ``id(fungible_info)``.
+            Must only be shared between items of the same response.
 
         Returns
         -------
@@ -174,26 +450,34 @@ class ZerionClient:
         """
         try:
             attributes = item.get("attributes", {})
+            attr_get = attributes.get
             relationships = item.get("relationships", {})
 
             # Extract basic position info
-            position_type_str = attributes.get("position_type", "wallet")
-            quantity_data = attributes.get("quantity", {})
+            position_type_str = attr_get("position_type", "wallet")
+            quantity_data = attr_get("quantity", {})
+            quantity_get = quantity_data.get
 
             # Handle quantity - use numeric or float
-            quantity_str = quantity_data.get("numeric") or str(quantity_data.get("float", 0))
-            quantity = Decimal(quantity_str) if quantity_str else Decimal(0)
+            quantity_str = quantity_get("numeric") or str(quantity_get("float", 0))
+            quantity = Decimal(quantity_str) if quantity_str else ZERO
 
             # Handle value_usd - it might be None or a complex object
             # Keep full precision, formatting will be done at display time
-            value_raw = attributes.get("value", 0)
+            value_raw = attr_get("value", 0)
             try:
-                value_usd = Decimal(str(value_raw)) if value_raw is not None else Decimal(0)
-            except (ValueError, TypeError):
-                value_usd = Decimal(0)
+                if value_raw is None:
+                    value_usd = ZERO
+                elif isinstance(value_raw, int | str):
+                    value_usd = Decimal(value_raw)
+                else:
+                    # Floats go through str to keep their short decimal form
+                    value_usd = Decimal(str(value_raw))
+            except (ValueError, TypeError, ArithmeticError):
+                value_usd = ZERO
 
             # Skip positions with zero value (unless it's a protocol position with quantity)
-            if value_usd == 0 and quantity == 0:
+            if not value_usd and not quantity:
                 return None
 
             # Extract chain info
@@ -202,21 +486,24 @@ class ZerionClient:
             chain = self.REVERSE_CHAIN_MAPPING.get(zerion_chain_id, zerion_chain_id)
 
             # Extract fungible (token) info from attributes.fungible_info
-            fungible_info = attributes.get("fungible_info", {})
-
-            # Get token address for this chain
-            token_address = ""
-            implementations = fungible_info.get("implementations", [])
-            for impl in implementations:
-                if impl.get("chain_id") == zerion_chain_id:
-                    token_address = impl.get("address") or ""
-                    break
+            fungible_info = attr_get("fungible_info", {})
+            fungible_get = fungible_info.get
+
+            # Get token address for this chain; the first implementation per chain wins
+            addresses_by_chain = addresses_cache.get(id(fungible_info)) if addresses_cache is not None else None
+            if addresses_by_chain is None:
+                addresses_by_chain = {}
+                for impl in fungible_get("implementations", []):
+                    addresses_by_chain.setdefault(impl.get("chain_id"), impl.get("address") or "")
+                if addresses_cache is not None:
+                    addresses_cache[id(fungible_info)] = addresses_by_chain
+            token_address = addresses_by_chain.get(zerion_chain_id, "")
 
             token = Token(
-                address=token_address or "",  # Ensure not None
-                symbol=fungible_info.get("symbol", "UNKNOWN"),
-                decimals=quantity_data.get("decimals", 18),
-                name=fungible_info.get("name", ""),
+                address=token_address,
+                symbol=fungible_get("symbol", "UNKNOWN"),
+                decimals=quantity_get("decimals", 18),
+                name=fungible_get("name", ""),
             )
 
             # Determine position type
@@ -237,8 +524,9 @@ class ZerionClient:
                 metadata["position_name"] = attributes["name"]
 
             # Add parent info if available (for nested positions like LP tokens in vaults)
-            if attributes.get("parent"):
-                metadata["parent"] = attributes["parent"]
+            parent = attr_get("parent")
+            if parent:
+                metadata["parent"] = parent
 
             return Position(
                 protocol=protocol_name,
@@ -318,34 +606,13 @@ class ZerionClient:
             return attributes["protocol"]
 
         # Get token symbol and position name for inference
-        token_symbol = fungible_info.get("symbol", "").lower()
-        position_name = attributes.get("name", "").lower()
-
-        # Protocol detection patterns based on token symbols
-        protocol_patterns = {
-            # Aave: aTokens (aEthUSDC, aBasUSDC, etc.)
-            "aave": ["abas", "aeth", "aopt", "apol", "aarb"],
-            # Morpho: Various vault tokens (steakUSDC, sparkUSDC, etc.)
-            "morpho": ["steak", "spark", "steakhouse", "morpho"],
-            # Beefy: mooTokens
-            "beefy": ["moo"],
-            # Ether.fi: eETH, weETH, liquidUSD
-            "etherfi": ["eeth", "weeth", "liquidusd"],
-            # Lido: stETH, wstETH
-            "lido": ["steth", "wsteth"],
-        }
-
-        # Check token symbol against patterns
-        for protocol, patterns in protocol_patterns.items():
-            for pattern in patterns:
-                if pattern in token_symbol:
-                    return protocol
+        token_symbol: str = fungible_info.get("symbol", "").lower()
+        position_name: str = attributes.get("name", "").lower()
 
-        # Check position name against patterns
-        for protocol, patterns in protocol_patterns.items():
-            for pattern in patterns:
-                if pattern in position_name:
-                    return protocol
+        # Check token symbol, then position name, against all patterns at once
+        match = PROTOCOL_PATTERN_RE.search(token_symbol) or PROTOCOL_PATTERN_RE.search(position_name)
+        if match and match.lastgroup:
+            return match.lastgroup
 
         # Check for generic protocol indicators in position name
         if "vault" in position_name or "pool" in position_name:
@@ -354,17 +621,29 @@ class ZerionClient:
             words = position_name.split()
             if len(words) > 0:
                 first_word = words[0].lower()
-                # Check if first word matches a known protocol
-                for protocol, patterns in protocol_patterns.items():
-                    if first_word in patterns or first_word == protocol:
-                        return protocol
+                # Check if first word names a known protocol
+                if first_word in PROTOCOL_PATTERNS:
+                    return first_word
 
         # Default to wallet if can't determine protocol
         return "wallet"
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """
+        Close the HTTP client.
+
+        The async client cannot be closed from synchronous code; callers that
+        used ``get_positions_async`` must call ``aclose`` instead.
+
+        """
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients, including the async one if it was opened."""
         self.client.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def __enter__(self) -> "ZerionClient":
         """Context manager entry."""
@@ -378,3 +657,45 @@ class ZerionClient:
     ) -> None:
         """Context manager exit."""
         self.close()
+
+
+# Process-wide clients per API key, so handlers reuse pooled connections and conditional-request state
+_SHARED_CLIENTS: dict[str, ZerionClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_client(api_key: str) -> ZerionClient:
+    """
+    Get the Zerion client shared by all callers using an API key.
+
+    Reusing one client keeps its connections open and its ETag /
+    Last-Modified validators warm between handler calls. Do not close it;
+    shared clients are closed at interpreter exit.
+
+    Parameters
+    ----------
+    api_key : str
+        Zerion API key
+
+    Returns
+    -------
+    ZerionClient
+        Shared client for the key
+
+    """
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(api_key)
+        if client is None or client.client.is_closed:
+            client = _SHARED_CLIENTS[api_key] = ZerionClient(api_key)
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close every shared Zerion client."""
+    with _SHARED_CLIENTS_LOCK:
+        for client in _SHARED_CLIENTS.values():
+            client.close()
+        _SHARED_CLIENTS.clear()
+
+
+atexit.register(close_shared_clients)
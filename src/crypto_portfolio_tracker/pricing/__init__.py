@@ -1,9 +1,49 @@
 """Pricing services for token USD value enrichment."""
 
-from crypto_portfolio_tracker.pricing.chainlink import ChainlinkPricing
-from crypto_portfolio_tracker.pricing.defillama import DeFiLlamaPricing
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from crypto_portfolio_tracker.pricing.chainlink import ChainlinkPricing
+    from crypto_portfolio_tracker.pricing.defillama import DeFiLlamaPricing
+
+# Public name -> submodule defining it, imported on first attribute access
+_LAZY_ATTRIBUTES = {
+    "ChainlinkPricing": "chainlink",
+    "DeFiLlamaPricing": "defillama",
+}
 
 __all__ = [
     "ChainlinkPricing",
     "DeFiLlamaPricing",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a pricing service from its submodule on first access (PEP 562).
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    Any
+        The attribute, cached in the package namespace afterwards
+
+    Raises
+    ------
+    AttributeError
+        If the name is not part of the package
+
+    """
+    submodule = _LAZY_ATTRIBUTES.get(name)
+    if submodule is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,25 @@
 """Chainlink pricing service for fetching on-chain token USD prices."""
 
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any
 
+from crypto_portfolio_tracker.core.models import E8, ZERO
 from crypto_portfolio_tracker.data.addresses import CHAINLINK_PRICE_FEEDS
-from crypto_portfolio_tracker.rpc.multicall import MulticallBatcher
+from crypto_portfolio_tracker.rpc.cache import PersistentRPCCache
+from crypto_portfolio_tracker.rpc.multicall import CoalescingRPCClient, aggregate3
+
+# latestRoundData() -> (uint80 roundId, int256 answer, uint256 startedAt, uint256 updatedAt, uint80 answeredInRound)
+LATEST_ROUND_DATA_SELECTOR = bytes.fromhex("feaf968c")
+
+# Price feed per (lowercased chain, lowercased token address), so lookups ignore address casing
+FEED_INDEX = {
+    (chain.lower(), token_address.lower()): feed_address
+    for chain, feeds in CHAINLINK_PRICE_FEEDS.items()
+    for token_address, feed_address in feeds.items()
+}
 
 
 class ChainlinkPricing:
@@ -20,6 +35,17 @@ class ChainlinkPricing:
         RPC provider for contract calls
     fallback_pricing : Any | None
         Fallback pricing service (e.g., DeFiLlama) for tokens without Chainlink feeds
+    rpc_providers : dict[str, Any] | None
+        Per-chain RPC providers, so one instance can price tokens on several chains
+    price_cache : PersistentRPCCache | None
+        On-disk cache of recent feed prices, reused across process restarts
+    price_ttl : int
+        Seconds a stored feed price is reused
+    backup_rpc_providers : dict[str, list[Any]] | None
+        Extra RPC providers per chain, tried in order when a feed read fails
+    coalesce_ms : float | None
+        When set, single-token feed reads from concurrent callers are
+        coalesced into shared multicalls sent every ``coalesce_ms``
 
     """
 
@@ -27,6 +53,11 @@ class ChainlinkPricing:
         self,
         rpc_provider: Any,
         fallback_pricing: Any | None = None,
+        rpc_providers: dict[str, Any] | None = None,
+        price_cache: PersistentRPCCache | None = None,
+        price_ttl: int = 60,
+        backup_rpc_providers: dict[str, list[Any]] | None = None,
+        coalesce_ms: float | None = None,
     ) -> None:
         """
         Initialize Chainlink pricing service.
@@ -37,10 +68,29 @@ class ChainlinkPricing:
             RPC provider for contract calls
         fallback_pricing : Any | None
             Fallback pricing service for tokens without Chainlink feeds
+        rpc_providers : dict[str, Any] | None
+            Per-chain RPC providers; chains not listed use ``rpc_provider``
+        price_cache : PersistentRPCCache | None
+            On-disk cache checked before reading feeds and written through
+        price_ttl : int
+            Seconds a stored feed price is reused
+        backup_rpc_providers : dict[str, list[Any]] | None
+            Extra RPC providers per chain, tried in order after the chain's
+            primary provider fails
+        coalesce_ms : float | None
+            Batching window for single-token feed reads; None reads each feed
+            with its own ``eth_call``
 
         """
         self.rpc_provider = rpc_provider
         self.fallback_pricing = fallback_pricing
+        self.rpc_providers = rpc_providers or {}
+        self.price_cache = price_cache
+        self.price_ttl = price_ttl
+        self.backup_rpc_providers = backup_rpc_providers or {}
+        self.coalesce_ms = coalesce_ms
+        self._coalescers: dict[int, CoalescingRPCClient] = {}
+        self._coalescers_lock = threading.Lock()
 
     def get_prices(
         self,
@@ -50,6 +100,7 @@ class ChainlinkPricing:
         Fetch USD prices for multiple tokens.
 
         Uses Chainlink feeds when available, falls back to DeFiLlama otherwise.
+        The Chainlink reads and the fallback request run concurrently.
 
         Parameters
         ----------
@@ -67,18 +118,33 @@ class ChainlinkPricing:
 
         prices = {}
 
-        # Separate tokens with Chainlink feeds from those without
+        # Separate tokens with Chainlink feeds from those without; repeated tokens are priced once
         chainlink_tokens = []
         fallback_tokens = []
 
-        for chain, address in tokens:
+        for chain, address in dict.fromkeys(tokens):
             feed_address = self._get_feed_address(chain, address)
             if feed_address:
                 chainlink_tokens.append((chain, address, feed_address))
             else:
                 fallback_tokens.append((chain, address))
 
-        # Fetch prices from Chainlink using multicall
+        # Feed prices stored by a recent run need no RPC call
+        if chainlink_tokens and self.price_cache is not None:
+            stored = self.price_cache.get_prices(
+                "chainlink", [(chain, address) for chain, address, _ in chainlink_tokens], self.price_ttl
+            )
+            prices.update(stored)
+            chainlink_tokens = [token for token in chainlink_tokens if (token[0], token[1]) not in stored]
+
+        # Fetch prices from Chainlink using multicall, overlapping the independent fallback request
+        if chainlink_tokens and fallback_tokens and self.fallback_pricing:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                fallback_future = executor.submit(self.fallback_pricing.get_prices, fallback_tokens)
+                prices.update(self._fetch_chainlink_prices(chainlink_tokens))
+                prices.update(fallback_future.result())
+            return prices
+
         if chainlink_tokens:
             chainlink_prices = self._fetch_chainlink_prices(chainlink_tokens)
             prices.update(chainlink_prices)
@@ -90,14 +156,38 @@ class ChainlinkPricing:
         elif fallback_tokens:
             # No fallback, return 0 for unknown tokens
             for chain, address in fallback_tokens:
-                prices[chain, address] = Decimal("0")
+                prices[chain, address] = ZERO
 
         return prices
 
+    def get_prices_single_chain(self, chain: str, addresses: list[str]) -> dict[str, Decimal]:
+        """
+        Fetch USD prices for tokens that are all on one chain.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+        addresses : list[str]
+            Token contract addresses
+
+        Returns
+        -------
+        dict[str, Decimal]
+            Mapping of address to USD price
+
+        """
+        prices = self.get_prices([(chain, address) for address in addresses])
+        return {address: price for (_, address), price in prices.items()}
+
     def get_price(self, chain: str, address: str) -> Decimal:
         """
         Fetch USD price for a single token.
 
+        Reads the feed with one direct ``eth_call`` instead of a multicall
+        (or through a shared batch when ``coalesce_ms`` is set), and asks the
+        fallback service directly for tokens without a feed.
+
         Parameters
         ----------
         chain : str
@@ -111,8 +201,81 @@ class ChainlinkPricing:
             USD price
 
         """
-        prices = self.get_prices([(chain, address)])
-        return prices.get((chain, address), Decimal("0"))
+        feed_address = self._get_feed_address(chain, address)
+        if feed_address is None:
+            return self.fallback_pricing.get_price(chain, address) if self.fallback_pricing else ZERO
+
+        if self.price_cache is not None:
+            stored = self.price_cache.get_prices("chainlink", [(chain, address)], self.price_ttl)
+            if stored:
+                return stored[chain, address]
+
+        for provider in self._providers_for(chain):
+            try:
+                price = self._decode_answer(self._read_feed(provider, feed_address))
+                break
+            except Exception:
+                # Try the next endpoint for this chain
+                continue
+        else:
+            return ZERO
+
+        if price and self.price_cache is not None:
+            self.price_cache.set_prices("chainlink", {(chain, address): price})
+        return price
+
+    def _read_feed(self, provider: Any, feed_address: str) -> bytes | None:
+        """
+        Read ``latestRoundData()`` from one feed.
+
+        Parameters
+        ----------
+        provider : Any
+            RPC provider with ``make_request``
+        feed_address : str
+            Price feed address
+
+        Returns
+        -------
+        bytes | None
+            ABI-encoded return data (None if the coalesced call reverted)
+
+        """
+        if self.coalesce_ms is None:
+            result = provider.make_request(
+                "eth_call",
+                [{"to": feed_address, "data": "0x" + LATEST_ROUND_DATA_SELECTOR.hex()}, "latest"],
+            )
+            return bytes.fromhex(result[2:])
+
+        with self._coalescers_lock:
+            coalescer = self._coalescers.get(id(provider))
+            if coalescer is None:
+                coalescer = CoalescingRPCClient(provider, stall_ms=self.coalesce_ms)
+                self._coalescers[id(provider)] = coalescer
+        return coalescer.call(feed_address, LATEST_ROUND_DATA_SELECTOR)
+
+    @staticmethod
+    def _decode_answer(return_data: bytes | None) -> Decimal:
+        """
+        Decode the USD price from ``latestRoundData()`` return data.
+
+        Parameters
+        ----------
+        return_data : bytes | None
+            ABI-encoded return data (None if the call reverted)
+
+        Returns
+        -------
+        Decimal
+            USD price, or 0 if the read failed or the answer is not positive
+
+        """
+        # answer is the second 32-byte word, a signed int256
+        price_raw = int.from_bytes(return_data[32:64], "big", signed=True) if return_data else 0
+
+        # Chainlink price feeds return prices in 8 decimals
+        return Decimal(price_raw) / E8 if price_raw > 0 else ZERO
 
     def _fetch_chainlink_prices(
         self,
@@ -121,6 +284,11 @@ class ChainlinkPricing:
         """
         Fetch prices from Chainlink price feeds using multicall.
 
+        All ``latestRoundData()`` reads for a chain are sent as one
+        ``Multicall3.aggregate3`` call, so pricing costs one round-trip per
+        chain regardless of the number of feeds. Chains are queried
+        concurrently.
+
         Parameters
         ----------
         tokens : list[tuple[str, str, str]]
@@ -135,47 +303,83 @@ class ChainlinkPricing:
         prices = {}
 
         # Group by chain to batch calls
-        by_chain: dict[str, list[tuple[str, str]]] = {}
+        by_chain: defaultdict[str, list[tuple[str, str]]] = defaultdict(list)
         for chain, token_address, feed_address in tokens:
-            if chain not in by_chain:
-                by_chain[chain] = []
             by_chain[chain].append((token_address, feed_address))
 
-        # Fetch prices per chain
-        for chain, chain_tokens in by_chain.items():
-            try:
-                multicall = MulticallBatcher(self.rpc_provider)
-
-                # Add all latestAnswer() calls to multicall
-                indices = {}
-                for token_address, feed_address in chain_tokens:
-                    idx = multicall.call_count
-                    multicall.add_call(feed_address, "latestAnswer", [])
-                    indices[token_address] = idx
-
-                # Execute batch
-                results = multicall.execute()
-
-                # Process results
-                for token_address, feed_address in chain_tokens:
-                    idx = indices[token_address]
-                    price_raw = results[idx]
-
-                    if price_raw and price_raw > 0:
-                        # Chainlink price feeds return prices in 8 decimals
-                        price = Decimal(str(price_raw)) / Decimal(10**8)
-                        prices[chain, token_address] = price
-                    else:
-                        prices[chain, token_address] = Decimal("0")
+        # Fetch prices per chain; each chain is one independent RPC round-trip
+        if len(by_chain) == 1:
+            chain_prices = [self._fetch_chain_prices(*next(iter(by_chain.items())))]
+        else:
+            with ThreadPoolExecutor(max_workers=len(by_chain)) as executor:
+                chain_prices = list(executor.map(self._fetch_chain_prices, by_chain.keys(), by_chain.values()))
 
-            except Exception:
-                # Silently fail and return 0 for all tokens on this chain
-                # Fallback pricing will be used
-                for token_address, _ in chain_tokens:
-                    prices[chain, token_address] = Decimal("0")
+        for result in chain_prices:
+            prices.update(result)
+
+        # Failed or non-positive reads are left out so the next run retries them
+        if self.price_cache is not None:
+            self.price_cache.set_prices("chainlink", {token: price for token, price in prices.items() if price})
 
         return prices
 
+    def _fetch_chain_prices(
+        self,
+        chain: str,
+        chain_tokens: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], Decimal]:
+        """
+        Fetch Chainlink prices for the tokens on one chain with one multicall.
+
+        A failed multicall is retried on the chain's backup providers before
+        the tokens are left to fallback pricing.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+        chain_tokens : list[tuple[str, str]]
+            List of (token_address, feed_address) tuples
+
+        Returns
+        -------
+        dict[tuple[str, str], Decimal]
+            Mapping of (chain, address) to USD price (0 if the read failed)
+
+        """
+        calls = [(feed_address, LATEST_ROUND_DATA_SELECTOR) for _, feed_address in chain_tokens]
+        for provider in self._providers_for(chain):
+            try:
+                results = aggregate3(provider, calls)
+            except Exception:
+                # Try the next endpoint for this chain
+                continue
+
+            return {
+                (chain, token_address): self._decode_answer(return_data)
+                for (token_address, _), return_data in zip(chain_tokens, results, strict=True)
+            }
+
+        # Every endpoint failed: return 0 for all tokens on this chain so fallback pricing is used
+        return {(chain, token_address): ZERO for token_address, _ in chain_tokens}
+
+    def _providers_for(self, chain: str) -> list[Any]:
+        """
+        Get the RPC providers to read a chain's feeds from, in failover order.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+
+        Returns
+        -------
+        list[Any]
+            The chain's primary provider followed by its backup providers
+
+        """
+        return [self.rpc_providers.get(chain, self.rpc_provider), *self.backup_rpc_providers.get(chain, ())]
+
     def _get_feed_address(self, chain: str, token_address: str) -> str | None:
         """
         Get Chainlink price feed address for a token.
@@ -193,16 +397,14 @@ class ChainlinkPricing:
             Price feed address, or None if not available
 
         """
-        chain_feeds = CHAINLINK_PRICE_FEEDS.get(chain.lower())
-        if not chain_feeds:
-            return None
-
-        # Normalize address to checksum format
-        normalized_address = token_address
-        return chain_feeds.get(normalized_address)
+        return FEED_INDEX.get((chain.lower(), token_address.lower()))
 
     def close(self) -> None:
         """Close pricing service (delegate to fallback if available)."""
+        with self._coalescers_lock:
+            coalescers, self._coalescers = list(self._coalescers.values()), {}
+        for coalescer in coalescers:
+            coalescer.close()
         if self.fallback_pricing and hasattr(self.fallback_pricing, "close"):
             self.fallback_pricing.close()
 
@@ -1,9 +1,29 @@
 """DeFiLlama pricing service for fetching token USD prices."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from importlib.util import find_spec
 
 import httpx
 
+from crypto_portfolio_tracker.__about__ import __version__
+from crypto_portfolio_tracker.core.models import ZERO
+from crypto_portfolio_tracker.rpc.cache import PersistentRPCCache, RPCCache
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Keep connections to the API warm between price requests
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0)
+
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+HTTP_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": f"crypto-portfolio-tracker/{__version__}"}
+
+# Concurrent requests when coin ids are split over several URLs
+MAX_CHUNK_WORKERS = 8
+
 
 class DeFiLlamaPricing:
     """
@@ -12,16 +32,43 @@ class DeFiLlamaPricing:
     DeFiLlama provides free, decentralized price data for thousands of tokens
     across multiple chains.
 
+    Prices are cached per coin for ``ttl_seconds``, so repeated lookups of
+    the same tokens only request the ones not seen recently. With a
+    persistent cache, prices also survive process restarts for that long.
+
     Parameters
     ----------
     base_url : str
         DeFiLlama API base URL
+    ttl_seconds : int
+        Seconds a fetched price is reused
+    chunk_size : int
+        Maximum coin ids per request URL; larger batches are split and
+        fetched concurrently
+    price_cache : PersistentRPCCache | None
+        On-disk cache checked after the in-memory one and written through
+        on every fetch
 
     """
 
-    def __init__(self, base_url: str = "https://coins.llama.fi") -> None:
+    def __init__(
+        self,
+        base_url: str = "https://coins.llama.fi",
+        ttl_seconds: int = 60,
+        chunk_size: int = 100,
+        price_cache: PersistentRPCCache | None = None,
+    ) -> None:
         self.base_url = base_url
-        self.client = httpx.Client(timeout=30.0)
+        self.chunk_size = chunk_size
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS),
+            timeout=HTTP_TIMEOUT,
+            headers=HTTP_HEADERS,
+        )
+        self._async_client: httpx.AsyncClient | None = None
+        self.ttl_seconds = ttl_seconds
+        self._price_cache = RPCCache(default_ttl=ttl_seconds)
+        self.price_cache = price_cache
 
     def get_prices(
         self,
@@ -53,22 +100,162 @@ class DeFiLlamaPricing:
         if not tokens:
             return {}
 
-        # Build coin identifiers in DeFiLlama format: "chain:address"
-        coin_ids = [self._format_coin_id(chain, addr) for chain, addr in tokens]
+        tokens, coin_ids = self._coin_ids(tokens)
+        prices, misses = self._cached_prices(coin_ids)
+        if misses:
+            self._store_prices(misses, self._fetch_batch_prices(misses), prices)
+        return self._map_prices(tokens, coin_ids, prices)
 
-        # Fetch prices in batch
-        prices_data = self._fetch_batch_prices(coin_ids)
+    async def get_prices_async(
+        self,
+        tokens: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], Decimal]:
+        """
+        Fetch USD prices for multiple tokens asynchronously.
 
-        # Map back to original format
-        result = {}
-        for (chain, address), coin_id in zip(tokens, coin_ids, strict=False):
+        Uses the same caches as ``get_prices``. Chunks of coin ids are
+        requested concurrently over one pooled ``httpx.AsyncClient``.
+
+        Parameters
+        ----------
+        tokens : list[tuple[str, str]]
+            List of (chain, address) tuples
+
+        Returns
+        -------
+        dict[tuple[str, str], Decimal]
+            Mapping of (chain, address) to USD price
+
+        """
+        if not tokens:
+            return {}
+
+        tokens, coin_ids = self._coin_ids(tokens)
+        prices, misses = self._cached_prices(coin_ids)
+        if misses:
+            client = self._async_client
+            if client is None:
+                client = self._async_client = httpx.AsyncClient(
+                    transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS),
+                    timeout=HTTP_TIMEOUT,
+                    headers=HTTP_HEADERS,
+                )
+            chunks_data = await asyncio.gather(
+                *(self._fetch_chunk_prices_async(client, chunk) for chunk in self._chunks(misses))
+            )
+            prices_data = {}
+            for chunk_data in chunks_data:
+                prices_data.update(chunk_data)
+            self._store_prices(misses, prices_data, prices)
+        return self._map_prices(tokens, coin_ids, prices)
+
+    def _coin_ids(self, tokens: list[tuple[str, str]]) -> tuple[list[tuple[str, str]], list[str]]:
+        """
+        Deduplicate tokens and build their DeFiLlama coin identifiers.
+
+        Parameters
+        ----------
+        tokens : list[tuple[str, str]]
+            List of (chain, address) tuples
+
+        Returns
+        -------
+        tuple[list[tuple[str, str]], list[str]]
+            Distinct tokens and their "chain:address" coin ids, in order
+
+        """
+        tokens = list(dict.fromkeys(tokens))
+        return tokens, [self._format_coin_id(chain, addr) for chain, addr in tokens]
+
+    def _cached_prices(self, coin_ids: list[str]) -> tuple[dict[str, Decimal], list[str]]:
+        """
+        Look coin ids up in the in-memory cache, then the persistent one.
+
+        Parameters
+        ----------
+        coin_ids : list[str]
+            Coin identifiers in "chain:address" format
+
+        Returns
+        -------
+        tuple[dict[str, Decimal], list[str]]
+            Cached prices by coin id, and the distinct coin ids still to fetch
+
+        """
+        prices: dict[str, Decimal] = {}
+        misses = []
+        for coin_id in dict.fromkeys(coin_ids):
+            cached = self._price_cache.get("price", [coin_id])
+            if cached is not None:
+                prices[coin_id] = cached
+            else:
+                misses.append(coin_id)
+
+        if misses and self.price_cache is not None:
+            tokens = []
+            for coin_id in misses:
+                llama_chain, address = coin_id.split(":", 1)
+                tokens.append((llama_chain, address))
+            stored = self.price_cache.get_prices("defillama", tokens, self.ttl_seconds)
+            for (llama_chain, address), price in stored.items():
+                coin_id = f"{llama_chain}:{address}"
+                prices[coin_id] = price
+                self._price_cache.set("price", [coin_id], price)
+            misses = [coin_id for coin_id in misses if coin_id not in prices]
+
+        return prices, misses
+
+    def _store_prices(self, coin_ids: list[str], prices_data: dict, prices: dict[str, Decimal]) -> None:
+        """
+        Parse fetched prices into ``prices`` and write them to the caches.
+
+        Parameters
+        ----------
+        coin_ids : list[str]
+            Coin identifiers that were requested
+        prices_data : dict
+            Raw API ``coins`` mapping
+        prices : dict[str, Decimal]
+            Prices by coin id, updated in place
+
+        """
+        fetched: dict[tuple[str, str], Decimal] = {}
+        for coin_id in coin_ids:
             price_info = prices_data.get(coin_id)
             if price_info and "price" in price_info:
-                result[chain, address] = Decimal(str(price_info["price"]))
-            else:
-                result[chain, address] = Decimal("0")
+                price = Decimal(str(price_info["price"]))
+                prices[coin_id] = price
+                llama_chain, address = coin_id.split(":", 1)
+                fetched[llama_chain, address] = price
+                self._price_cache.set("price", [coin_id], price)
+        if self.price_cache is not None:
+            self.price_cache.set_prices("defillama", fetched)
+
+    @staticmethod
+    def _map_prices(
+        tokens: list[tuple[str, str]],
+        coin_ids: list[str],
+        prices: dict[str, Decimal],
+    ) -> dict[tuple[str, str], Decimal]:
+        """
+        Map prices by coin id back to (chain, address) keys.
+
+        Parameters
+        ----------
+        tokens : list[tuple[str, str]]
+            List of (chain, address) tuples
+        coin_ids : list[str]
+            Coin ids matching ``tokens``
+        prices : dict[str, Decimal]
+            Prices by coin id
+
+        Returns
+        -------
+        dict[tuple[str, str], Decimal]
+            Mapping of (chain, address) to USD price (0 if unknown)
 
-        return result
+        """
+        return {token: prices.get(coin_id, ZERO) for token, coin_id in zip(tokens, coin_ids, strict=True)}
 
     def get_price(self, chain: str, address: str) -> Decimal:
         """
@@ -87,13 +274,20 @@ class DeFiLlamaPricing:
             USD price
 
         """
-        prices = self.get_prices([(chain, address)])
-        return prices.get((chain, address), Decimal("0"))
+        # One coin needs no deduplication, chunking or thread pool
+        coin_id = self._format_coin_id(chain, address)
+        prices, misses = self._cached_prices([coin_id])
+        if misses:
+            self._store_prices(misses, self._fetch_chunk_prices(misses), prices)
+        return prices.get(coin_id, ZERO)
 
     def _fetch_batch_prices(self, coin_ids: list[str]) -> dict:
         """
         Fetch prices from DeFiLlama API.
 
+        Coin ids are sent ``chunk_size`` per request so URLs stay short;
+        several chunks are fetched concurrently.
+
         Parameters
         ----------
         coin_ids : list[str]
@@ -104,6 +298,48 @@ class DeFiLlamaPricing:
         dict
             Raw API response with price data
 
+        """
+        chunks = self._chunks(coin_ids)
+        if len(chunks) <= 1:
+            return self._fetch_chunk_prices(coin_ids)
+
+        prices_data = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_CHUNK_WORKERS, len(chunks))) as executor:
+            for chunk_data in executor.map(self._fetch_chunk_prices, chunks):
+                prices_data.update(chunk_data)
+        return prices_data
+
+    def _chunks(self, coin_ids: list[str]) -> list[list[str]]:
+        """
+        Split coin ids into request-sized chunks.
+
+        Parameters
+        ----------
+        coin_ids : list[str]
+            Coin identifiers in "chain:address" format
+
+        Returns
+        -------
+        list[list[str]]
+            Chunks of at most ``chunk_size`` coin ids
+
+        """
+        return [coin_ids[i : i + self.chunk_size] for i in range(0, len(coin_ids), self.chunk_size)]
+
+    def _fetch_chunk_prices(self, coin_ids: list[str]) -> dict:
+        """
+        Fetch prices for one chunk of coin ids with a single request.
+
+        Parameters
+        ----------
+        coin_ids : list[str]
+            Coin identifiers in "chain:address" format
+
+        Returns
+        -------
+        dict
+            Raw API response with price data (empty if the request failed)
+
         """
         try:
             # DeFiLlama batch price endpoint
@@ -121,6 +357,35 @@ class DeFiLlamaPricing:
         except Exception:
             return {}
 
+    async def _fetch_chunk_prices_async(self, client: httpx.AsyncClient, coin_ids: list[str]) -> dict:
+        """
+        Fetch prices for one chunk of coin ids with the async client.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+            Pooled async HTTP client
+        coin_ids : list[str]
+            Coin identifiers in "chain:address" format
+
+        Returns
+        -------
+        dict
+            Raw API response with price data (empty if the request failed)
+
+        """
+        try:
+            url = f"{self.base_url}/prices/current/{','.join(coin_ids)}"
+
+            response = await client.get(url)
+            response.raise_for_status()
+
+            coins: dict = response.json().get("coins", {})
+            return coins
+
+        except Exception:
+            return {}
+
     def _format_coin_id(self, chain: str, address: str) -> str:
         """
         Format coin identifier for DeFiLlama API.
@@ -152,6 +417,13 @@ class DeFiLlamaPricing:
         """Close HTTP client."""
         self.client.close()
 
+    async def aclose(self) -> None:
+        """Close the HTTP clients, including the async one if it was opened."""
+        self.client.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def __enter__(self) -> "DeFiLlamaPricing":
         """Context manager entry."""
         return self
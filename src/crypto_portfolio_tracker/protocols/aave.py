@@ -1,10 +1,40 @@
 """Aave v3 lending protocol handler."""
 
 from decimal import Decimal
+from typing import Any
 
-from crypto_portfolio_tracker.core.models import Position, PositionType, Reward, Token
+from eth_abi import decode, encode
+
+from crypto_portfolio_tracker.core.models import E4, E8, E18, ZERO, Position, PositionType, Reward, Token
 from crypto_portfolio_tracker.core.registry import ProtocolRegistry
 from crypto_portfolio_tracker.protocols.base import BaseProtocolHandler
+from crypto_portfolio_tracker.rpc.multicall import aggregate3
+
+# Aave's base currency (USD, 8 decimals), the token of summary positions
+USD_BASE_TOKEN = Token(address="", symbol="USD", decimals=8, name="USD Base Currency")
+
+# PoolDataProvider and Pool read selectors
+GET_ALL_RESERVES_TOKENS_SELECTOR = bytes.fromhex("b316ff89")
+GET_RESERVE_CONFIGURATION_DATA_SELECTOR = bytes.fromhex("3e150141")
+GET_RESERVE_TOKENS_ADDRESSES_SELECTOR = bytes.fromhex("d2493b6c")
+GET_USER_ACCOUNT_DATA_SELECTOR = bytes.fromhex("bf92857c")
+GET_USER_RESERVE_DATA_SELECTOR = bytes.fromhex("28dd2d01")
+
+# ABI return types of the reads above
+ALL_RESERVES_TOKENS_TYPES = ["(string,address)[]"]
+RESERVE_CONFIG_TYPES = ["uint256"] * 5 + ["bool"] * 5
+RESERVE_ADDRESSES_TYPES = ["address"] * 3
+USER_ACCOUNT_DATA_TYPES = ["uint256"] * 6
+USER_RESERVE_DATA_TYPES = ["uint256"] * 7 + ["uint40", "bool"]
+
+# Reads per Multicall3 aggregate3 request
+MULTICALL_BATCH_SIZE = 500
+
+# Debt kinds as (index in getUserReserveData, reserve key of the debt token, symbol prefix, name prefix)
+DEBT_KINDS = (
+    (1, "stable_debt_token", "stableDebt", "Aave Stable Debt"),
+    (2, "variable_debt_token", "variableDebt", "Aave Variable Debt"),
+)
 
 
 @ProtocolRegistry.register
@@ -25,6 +55,18 @@ class AaveHandler(BaseProtocolHandler):
         "0xb3d084820fb1a9decffb176436bd02558d15fac9b0ddfed8c465bc7359d7dce0",  # Borrow
     ]
 
+    # User is the indexed onBehalfOf (second indexed topic) in both events
+    discovery_topic_positions = {
+        "0x2b627736bca15cd5381dcf80b0bf11fd197d01a037c52b927a881a10fb73ba61": 2,
+        "0xb3d084820fb1a9decffb176436bd02558d15fac9b0ddfed8c465bc7359d7dce0": 2,
+    }
+
+    # Both events are emitted by the Pool
+    discovery_contracts = {
+        "0x2b627736bca15cd5381dcf80b0bf11fd197d01a037c52b927a881a10fb73ba61": ("pool",),
+        "0xb3d084820fb1a9decffb176436bd02558d15fac9b0ddfed8c465bc7359d7dce0": ("pool",),
+    }
+
     def get_positions(self, user_address: str, chain: str) -> list[Position]:
         """
         Fetch Aave positions for a user.
@@ -42,27 +84,182 @@ class AaveHandler(BaseProtocolHandler):
             List of Aave positions (supplies and borrows)
 
         """
-        if chain not in self.supported_chains:
-            return []
+        return self.get_positions_multi([user_address], chain).get(user_address, [])
+
+    def get_positions_multi(self, user_addresses: list[str], chain: str) -> dict[str, list[Position]]:
+        """
+        Fetch Aave positions for several users in two batched round-trips.
+
+        The first round-trip reads the reserve list. The second sends every
+        remaining read through ``Multicall3.aggregate3`` (split every
+        ``MULTICALL_BATCH_SIZE`` reads): reserve configuration and token
+        addresses, then ``getUserAccountData`` and per-reserve balances for
+        each user. The supply and borrow builders only shape the results.
+
+        Parameters
+        ----------
+        user_addresses : list[str]
+            User wallet addresses
+        chain : str
+            Chain name
+
+        Returns
+        -------
+        dict[str, list[Position]]
+            Mapping of user address to its Aave positions (supplies and borrows)
+
+        """
+        positions: dict[str, list[Position]] = {user_address: [] for user_address in user_addresses}
+        rpc_provider = self.rpc_provider
+        if chain not in self.supported_chains or rpc_provider is None:
+            return positions
 
-        positions = []
         addresses = self.get_contract_addresses(chain)
+        pool_address = addresses.get("pool")
+        data_provider = addresses.get("pool_data_provider")
+        if not pool_address or not data_provider:
+            return positions
+
+        reserve_tokens = self._get_reserve_tokens(rpc_provider, data_provider)
+
+        calls: list[tuple[str, bytes, list[str]]] = []
+        for _, asset_address in reserve_tokens:
+            asset_arg = encode(["address"], [asset_address])
+            calls.append((data_provider, GET_RESERVE_CONFIGURATION_DATA_SELECTOR + asset_arg, RESERVE_CONFIG_TYPES))
+            calls.append((data_provider, GET_RESERVE_TOKENS_ADDRESSES_SELECTOR + asset_arg, RESERVE_ADDRESSES_TYPES))
+        for user_address in positions:
+            user_arg = encode(["address"], [user_address])
+            calls.append((pool_address, GET_USER_ACCOUNT_DATA_SELECTOR + user_arg, USER_ACCOUNT_DATA_TYPES))
+            for _, asset_address in reserve_tokens:
+                calldata = GET_USER_RESERVE_DATA_SELECTOR + encode(["address"] * 2, [asset_address, user_address])
+                calls.append((data_provider, calldata, USER_RESERVE_DATA_TYPES))
+        results = self._multicall(rpc_provider, calls)
+
+        # Results are laid out as [config, token addresses] per reserve, then per user
+        # [account data, user reserve data per reserve]
+        reserve_count = len(reserve_tokens)
+        reserves = [
+            self._parse_reserve(symbol, asset_address, results[2 * i], results[2 * i + 1])
+            for i, (symbol, asset_address) in enumerate(reserve_tokens)
+        ]
+        offset = 2 * reserve_count
+
+        for user_address in positions:
+            account_data = self._parse_account_data(results[offset])
+            user_reserve_results = results[offset + 1 : offset + 1 + reserve_count]
+            offset += 1 + reserve_count
+            if not account_data:
+                continue
+
+            if reserve_tokens:
+                account_data["reserves"] = [
+                    (reserve, user_reserve)
+                    for reserve, user_reserve in zip(reserves, user_reserve_results, strict=True)
+                    if reserve is not None and user_reserve is not None
+                ]
+
+            user_positions = positions[user_address]
+            user_positions.extend(self._get_supply_positions(user_address, addresses, chain, account_data))
+            user_positions.extend(self._get_borrow_positions(user_address, addresses, chain, account_data))
 
-        # Get user account data
-        account_data = self._get_user_account_data(user_address, addresses, chain)
+        return positions
+
+    @staticmethod
+    def _get_reserve_tokens(rpc_provider: Any, data_provider: str) -> list[tuple[str, str]]:
+        """
+        Get the reserves listed on the Aave pool.
+
+        Parameters
+        ----------
+        rpc_provider : Any
+            RPC provider with ``make_request``
+        data_provider : str
+            PoolDataProvider address
 
-        if not account_data:
+        Returns
+        -------
+        list[tuple[str, str]]
+            List of (symbol, asset address) tuples, empty if the call failed
+
+        """
+        try:
+            result = rpc_provider.make_request(
+                "eth_call",
+                [{"to": data_provider, "data": "0x" + GET_ALL_RESERVES_TOKENS_SELECTOR.hex()}, "latest"],
+            )
+            (tokens,) = decode(ALL_RESERVES_TOKENS_TYPES, bytes.fromhex(result[2:]))
+        except Exception:
             return []
 
-        # Get supplied positions
-        supply_positions = self._get_supply_positions(user_address, addresses, chain, account_data)
-        positions.extend(supply_positions)
+        return [(symbol, asset_address) for symbol, asset_address in tokens]
 
-        # Get borrow positions
-        borrow_positions = self._get_borrow_positions(user_address, addresses, chain, account_data)
-        positions.extend(borrow_positions)
+    @staticmethod
+    def _multicall(rpc_provider: Any, calls: list[tuple[str, bytes, list[str]]]) -> list[tuple | None]:
+        """
+        Run read-only calls as ``aggregate3`` batches and decode their results.
 
-        return positions
+        Parameters
+        ----------
+        rpc_provider : Any
+            RPC provider with ``make_request``
+        calls : list[tuple[str, bytes, list[str]]]
+            List of (target address, calldata, ABI return types) tuples
+
+        Returns
+        -------
+        list[tuple | None]
+            Decoded result per call in order (None if the call or its batch failed)
+
+        """
+        results: list[tuple | None] = []
+        for start in range(0, len(calls), MULTICALL_BATCH_SIZE):
+            batch = calls[start : start + MULTICALL_BATCH_SIZE]
+            try:
+                return_data = aggregate3(rpc_provider, [(target, calldata) for target, calldata, _ in batch])
+            except Exception:
+                results.extend([None] * len(batch))
+                continue
+
+            for (_, _, types), data in zip(batch, return_data, strict=True):
+                try:
+                    results.append(None if data is None else decode(types, data))
+                except Exception:
+                    results.append(None)
+        return results
+
+    @staticmethod
+    def _parse_reserve(symbol: str, asset_address: str, config: Any, token_addresses: Any) -> dict | None:
+        """
+        Combine the static reads for one reserve.
+
+        Parameters
+        ----------
+        symbol : str
+            Reserve asset symbol
+        asset_address : str
+            Reserve asset address
+        config : Any
+            ``getReserveConfigurationData`` result, or None if the call failed
+        token_addresses : Any
+            ``getReserveTokensAddresses`` result, or None if the call failed
+
+        Returns
+        -------
+        dict | None
+            Reserve token and its aToken / debt token addresses, or None if unavailable
+
+        """
+        if config is None or token_addresses is None:
+            return None
+
+        # config: (decimals, ltv, liquidationThreshold, ...)
+        # token_addresses: (aTokenAddress, stableDebtTokenAddress, variableDebtTokenAddress)
+        return {
+            "token": Token(address=asset_address, symbol=symbol, decimals=int(config[0])),
+            "atoken": token_addresses[0],
+            "stable_debt_token": token_addresses[1],
+            "variable_debt_token": token_addresses[2],
+        }
 
     def _get_user_account_data(
         self,
@@ -100,26 +297,51 @@ class AaveHandler(BaseProtocolHandler):
                 [user_address],
                 chain,
             )
+        except Exception:
+            return None
+
+        return self._parse_account_data(result)
+
+    @staticmethod
+    def _parse_account_data(result: Any) -> dict | None:
+        """
+        Convert a raw ``getUserAccountData`` result into an account summary.
+
+        Parameters
+        ----------
+        result : Any
+            Tuple returned by the Pool, or None if the call failed
+
+        Returns
+        -------
+        dict | None
+            Account data including total collateral, debt, health factor
+
+        """
+        if result is None:
+            return None
+
+        try:
             # Returns tuple: (totalCollateralBase, totalDebtBase, availableBorrowsBase,
             #                 currentLiquidationThreshold, ltv, healthFactor)
 
-            total_collateral_base = Decimal(str(result[0])) / Decimal(10**8)  # Base currency has 8 decimals
-            total_debt_base = Decimal(str(result[1])) / Decimal(10**8)
-            available_borrows_base = Decimal(str(result[2])) / Decimal(10**8)
+            total_collateral_base = Decimal(result[0]) / E8  # Base currency has 8 decimals
+            total_debt_base = Decimal(result[1]) / E8
+            available_borrows_base = Decimal(result[2]) / E8
             health_factor_raw = result[5]
 
             # Health factor is in WAD (10^18), but 0 means infinite (no debt)
-            if total_debt_base == 0:
+            if total_debt_base.is_zero():
                 health_factor = None
             else:
-                health_factor = Decimal(str(health_factor_raw)) / Decimal(10**18)
+                health_factor = Decimal(health_factor_raw) / E18
 
             return {
                 "total_collateral": total_collateral_base,
                 "total_debt": total_debt_base,
                 "available_borrows": available_borrows_base,
                 "health_factor": health_factor,
-                "ltv": Decimal(str(result[4])) / Decimal(10**4),  # LTV in basis points
+                "ltv": Decimal(result[4]) / E4,  # LTV in basis points
             }
 
         except Exception:
@@ -135,6 +357,9 @@ class AaveHandler(BaseProtocolHandler):
         """
         Get all supply positions from Aave.
 
+        Builds one position per reserve from already-fetched balances, or a
+        single summary position when per-reserve data is unavailable.
+
         Parameters
         ----------
         user_address : str
@@ -144,7 +369,7 @@ class AaveHandler(BaseProtocolHandler):
         chain : str
             Chain name
         account_data : dict
-            User account summary data
+            User account summary data, with optional ``reserves`` balances
 
         Returns
         -------
@@ -155,33 +380,44 @@ class AaveHandler(BaseProtocolHandler):
         positions = []
 
         # If user has collateral, they have supply positions
-        if account_data.get("total_collateral", 0) == 0:
+        if account_data.get("total_collateral", ZERO).is_zero():
             return positions
 
-        # Create a summary position showing total collateral value
-        # TODO: Implement detailed per-asset positions by querying pool_data_provider
-        summary_token = Token(
-            address="",
-            symbol="USD",
-            decimals=8,
-            name="USD Base Currency",
-        )
-
+        if "reserves" in account_data:
+            for reserve, user_reserve in account_data["reserves"]:
+                # user_reserve: (currentATokenBalance, ..., usageAsCollateralEnabled)
+                if not user_reserve[0]:
+                    continue
+                reserve_token = reserve["token"]
+                positions.append(
+                    self._create_supply_position(
+                        reserve_token,
+                        reserve["atoken"],
+                        Decimal(user_reserve[0]) / Decimal(10**reserve_token.decimals),
+                        chain,
+                        account_data,
+                        bool(user_reserve[8]),
+                    )
+                )
+            if positions:
+                return positions
+
+        # Without per-reserve data, create a summary position showing total collateral value
         summary_position = Position(
             protocol=self.name,
             chain=chain,
             position_type=PositionType.LENDING_SUPPLY,
-            token=summary_token,
+            token=USD_BASE_TOKEN,
             balance=account_data["total_collateral"],
             underlying_token=None,
             underlying_balance=None,
             usd_value=account_data["total_collateral"],
             health_factor=account_data.get("health_factor"),
             metadata={
+                # Collateral and health factor are already on the position; Decimals serialize as-is
                 "is_summary": True,
-                "total_collateral_usd": float(account_data["total_collateral"]),
-                "total_debt_usd": float(account_data.get("total_debt", 0)),
-                "ltv": float(account_data.get("ltv", 0)),
+                "total_debt_usd": account_data.get("total_debt", ZERO),
+                "ltv": account_data.get("ltv", ZERO),
                 "note": "Summary position - individual assets not yet fetched",
             },
         )
@@ -199,6 +435,9 @@ class AaveHandler(BaseProtocolHandler):
         """
         Get all borrow positions from Aave.
 
+        Builds one position per reserve and debt token (stable and variable)
+        from already-fetched balances.
+
         Parameters
         ----------
         user_address : str
@@ -208,7 +447,7 @@ class AaveHandler(BaseProtocolHandler):
         chain : str
             Chain name
         account_data : dict
-            User account summary data
+            User account summary data, with optional ``reserves`` balances
 
         Returns
         -------
@@ -218,8 +457,37 @@ class AaveHandler(BaseProtocolHandler):
         """
         positions = []
 
-        # TODO: Similar to supply positions, query debt tokens
-        # Borrow positions will have negative USD values or be marked differently
+        if account_data.get("total_debt", ZERO).is_zero():
+            return positions
+
+        for reserve, user_reserve in account_data.get("reserves", []):
+            # user_reserve: (currentATokenBalance, currentStableDebt, currentVariableDebt, ...)
+            reserve_token = reserve["token"]
+            for index, token_key, symbol_prefix, name_prefix in DEBT_KINDS:
+                debt_raw = user_reserve[index]
+                if not debt_raw:
+                    continue
+                debt_token = Token(
+                    address=reserve[token_key],
+                    symbol=f"{symbol_prefix}{reserve_token.symbol}",
+                    decimals=reserve_token.decimals,
+                    name=f"{name_prefix} {reserve_token.symbol}",
+                )
+                balance = Decimal(debt_raw) / Decimal(10**reserve_token.decimals)
+
+                positions.append(
+                    Position(
+                        protocol=self.name,
+                        chain=chain,
+                        position_type=PositionType.LENDING_BORROW,
+                        token=debt_token,
+                        balance=balance,
+                        underlying_token=reserve_token,
+                        underlying_balance=balance,
+                        health_factor=account_data.get("health_factor"),
+                        metadata={"contract_address": reserve[token_key]},
+                    )
+                )
 
         return positions
 
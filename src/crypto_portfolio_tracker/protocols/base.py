@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Any, ClassVar
 
 from crypto_portfolio_tracker.core.models import Position
-from crypto_portfolio_tracker.data import get_protocol_addresses
+from crypto_portfolio_tracker.data import get_protocol_address_set, get_protocol_addresses
 
 
 class BaseProtocolHandler(ABC):
@@ -22,12 +22,21 @@ class BaseProtocolHandler(ABC):
         Chains where protocol is deployed (must be set in subclass)
     discovery_events : list[str]
         Event signatures for position discovery (must be set in subclass)
+    discovery_topic_positions : dict[str, int]
+        Indexed topic position (1-3) of the user address for each discovery
+        event; events not listed are probed at every position
+    discovery_contracts : dict[str, tuple[str, ...]]
+        Names of the protocol contracts (keys of ``get_protocol_addresses``)
+        emitting each discovery event; events not listed are probed on any
+        contract
 
     """
 
     name: ClassVar[str] = ""
     supported_chains: ClassVar[list[str]] = []
     discovery_events: ClassVar[list[str]] = []
+    discovery_topic_positions: ClassVar[dict[str, int]] = {}
+    discovery_contracts: ClassVar[dict[str, tuple[str, ...]]] = {}
 
     def __init__(self, rpc_provider: Any | None = None) -> None:
         """
@@ -87,10 +96,8 @@ class BaseProtocolHandler(ABC):
         if chain not in self.supported_chains:
             return False
 
-        addresses = self.get_contract_addresses(chain)
-        # Case-insensitive comparison
-        contract_lower = contract_address.lower()
-        return any(addr.lower() == contract_lower for addr in addresses.values())
+        # Case-insensitive comparison against the memoized lowercase address set
+        return contract_address.lower() in get_protocol_address_set(chain, self.name)
 
     @abstractmethod
     def get_positions(self, user_address: str, chain: str) -> list[Position]:
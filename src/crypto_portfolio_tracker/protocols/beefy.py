@@ -1,12 +1,14 @@
 """Beefy Finance yield optimizer protocol handler."""
 
 import os
+from typing import Any
 
 from crypto_portfolio_tracker.core.models import Position
 from crypto_portfolio_tracker.core.registry import ProtocolRegistry
-from crypto_portfolio_tracker.integrations.zerion import ZerionAPIError, ZerionClient
+from crypto_portfolio_tracker.integrations.zerion import ZerionAPIError, get_shared_client
 from crypto_portfolio_tracker.protocols.base import BaseProtocolHandler
 from crypto_portfolio_tracker.protocols.beefy_api import BeefyAPIClient, BeefyAPIError
+from crypto_portfolio_tracker.rpc.cache import RPCCache
 
 
 @ProtocolRegistry.register
@@ -17,6 +19,13 @@ class BeefyHandler(BaseProtocolHandler):
     Beefy has hundreds of vaults across multiple chains, so position
     discovery will rely heavily on event scanning.
 
+    Parameters
+    ----------
+    rpc_provider : Any | None
+        RPC provider for making contract calls
+    cache_ttl : int
+        Seconds a user's Zerion Beefy positions on a chain are reused
+
     """
 
     name = "beefy"
@@ -27,11 +36,32 @@ class BeefyHandler(BaseProtocolHandler):
         "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",  # Transfer (vault tokens)
     ]
 
+    # User receives vault shares as Transfer `to`
+    discovery_topic_positions = {
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef": 2,
+    }
+
+    def __init__(self, rpc_provider: Any | None = None, cache_ttl: int = 60) -> None:
+        """
+        Initialize the Beefy handler.
+
+        Parameters
+        ----------
+        rpc_provider : Any | None
+            RPC provider for making contract calls
+        cache_ttl : int
+            Seconds a user's Zerion Beefy positions on a chain are reused
+
+        """
+        super().__init__(rpc_provider)
+        self._zerion_cache = RPCCache(default_ttl=cache_ttl)
+
     def get_positions(self, user_address: str, chain: str) -> list[Position]:
         """
         Fetch Beefy vault positions for a user.
 
-        Uses Zerion API first (fast, includes USD values).
+        Uses Zerion API first (fast, includes USD values); its answer is
+        cached per (user, chain) for ``cache_ttl`` seconds.
         Falls back to Beefy API + RPC if Zerion doesn't return positions.
 
         Parameters
@@ -50,27 +80,32 @@ class BeefyHandler(BaseProtocolHandler):
         if chain not in self.supported_chains:
             return []
 
-        # Try Zerion API first
+        # Try Zerion API first; a recent answer (even an empty one) is reused without HTTP
         api_key = os.getenv("ZERION_API_KEY")
-        if api_key:
+        user_address = user_address.lower()
+        cache_key = [user_address, chain]
+        beefy_positions = self._zerion_cache.get("zerion_beefy", cache_key) if api_key else None
+        if api_key and beefy_positions is None:
             try:
-                with ZerionClient(api_key) as client:
-                    # Fetch all positions from Zerion
-                    all_positions = client.get_positions_as_models(user_address, [chain])
+                # Shared client: keeps connections and ETag validators between calls
+                zerion = get_shared_client(api_key)
+                # Fetch all positions from Zerion
+                all_positions = zerion.get_positions_as_models(user_address, [chain])
 
-                    # Filter for Beefy positions only
-                    beefy_positions = [
-                        pos for pos in all_positions if pos.protocol.lower() == "beefy" and pos.chain == chain
-                    ]
-
-                    if beefy_positions:
-                        return beefy_positions
+                # Filter for Beefy positions only
+                beefy_positions = [
+                    pos for pos in all_positions if pos.protocol.lower() == "beefy" and pos.chain == chain
+                ]
+                self._zerion_cache.set("zerion_beefy", cache_key, beefy_positions)
 
             except ZerionAPIError:
                 pass
             except Exception:
                 pass
 
+        if beefy_positions:
+            return list(beefy_positions)
+
         # Fallback to Beefy API + RPC
         if not self.rpc_provider:
             return []
@@ -1,17 +1,164 @@
 """Beefy Finance REST API client."""
 
+import atexit
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from decimal import Decimal
+from importlib.util import find_spec
 from typing import Any
 
 import httpx
+import orjson
+from eth_abi import encode
 
+from crypto_portfolio_tracker.__about__ import __version__
 from crypto_portfolio_tracker.core.models import Position, PositionType, Token
+from crypto_portfolio_tracker.rpc.cache import RPCCache
+from crypto_portfolio_tracker.rpc.multicall import aggregate3
+
+# balanceOf(address) and getPricePerFullShare() selectors
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+GET_PRICE_PER_FULL_SHARE_SELECTOR = bytes.fromhex("77c7b8fc")
+
+# getPricePerFullShare() is scaled by 1e18
+PRICE_PER_SHARE_SCALE = 10**18
+
+# Chains served by the API; Beefy uses our chain names, so no mapping is needed
+SUPPORTED_CHAINS = frozenset({"ethereum", "base", "arbitrum", "optimism", "polygon"})
+
+# Vault reads per Multicall3 aggregate3 request, and batches sent at once
+MULTICALL_BATCH_SIZE = 250
+MAX_VAULT_WORKERS = 8
+
+# Seconds API responses are reused: vault metadata changes slowly, prices and APYs more often
+VAULTS_TTL = 900
+PRICES_TTL = 300
+APY_TTL = 300
+
+# Responses are the same for every user, so clients share one cache by default
+API_CACHE = RPCCache(default_ttl=PRICES_TTL)
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Keep connections to the API warm between clients
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=20, keepalive_expiry=60.0)
+
+# Vault and price lists are large JSON documents; ask for them compressed
+HTTP_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": f"crypto-portfolio-tracker/{__version__}"}
+
+# Process-wide HTTP client, created on first use and shared by every BeefyAPIClient
+_SHARED_CLIENT: httpx.Client | None = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def get_shared_client() -> httpx.Client:
+    """
+    Get the HTTP client shared by all Beefy API clients.
+
+    Reusing one client keeps TLS connections to the API open between
+    handler calls instead of handshaking for every new ``BeefyAPIClient``.
+
+    Returns
+    -------
+    httpx.Client
+        Shared HTTP client
+
+    """
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+            _SHARED_CLIENT = httpx.Client(
+                transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS, retries=1),
+                headers=HTTP_HEADERS,
+            )
+        return _SHARED_CLIENT
+
+
+def close_shared_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is not None:
+            _SHARED_CLIENT.close()
+            _SHARED_CLIENT = None
+
+
+atexit.register(close_shared_client)
 
 
 class BeefyAPIError(Exception):
     """Exception raised for Beefy API errors."""
 
 
+@dataclass(frozen=True, slots=True)
+class BeefyVault:
+    """
+    Beefy vault, reduced to the fields used to build positions.
+
+    Addresses are lowercased and interned once at ingest, so joins against
+    them never re-normalize.
+
+    Attributes
+    ----------
+    id : str
+        Beefy vault ID, the key of the prices and APY responses
+    address : str
+        Vault (share token) contract address, lowercased
+    token_address : str
+        Underlying token address, lowercased
+    token : str
+        Underlying token symbol
+    token_decimals : int
+        Decimals of the vault and underlying token
+    name : str
+        Vault display name
+    platform : str
+        Platform the vault farms on
+    strategy : str
+        Strategy contract address
+
+    """
+
+    id: str
+    address: str
+    token_address: str = ""
+    token: str = "UNKNOWN"
+    token_decimals: int = 18
+    name: str = ""
+    platform: str = ""
+    strategy: str = ""
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "BeefyVault":
+        """
+        Build a vault from a ``/vaults`` API record.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Vault record from the API
+
+        Returns
+        -------
+        BeefyVault
+            Vault with the fields used by the client
+
+        """
+        return cls(
+            id=data.get("id", ""),
+            address=sys.intern(data["earnContractAddress"].lower()),
+            token_address=sys.intern((data.get("tokenAddress") or "").lower()),
+            token=data.get("token", "UNKNOWN"),
+            token_decimals=data.get("tokenDecimals", 18),
+            name=data.get("name", ""),
+            platform=data.get("platform", ""),
+            strategy=data.get("strategy", ""),
+        )
+
+
 class BeefyAPIClient:
     """
     Client for Beefy Finance REST API.
@@ -24,24 +171,18 @@ class BeefyAPIClient:
         API base URL
     timeout : float
         Request timeout in seconds
+    cache : RPCCache | None
+        Cache for API responses (default: the process-wide ``API_CACHE``)
 
     """
 
     BASE_URL = "https://api.beefy.finance"
 
-    # Chain name mapping (Beefy uses different chain identifiers)
-    CHAIN_MAPPING = {
-        "ethereum": "ethereum",
-        "base": "base",
-        "arbitrum": "arbitrum",
-        "optimism": "optimism",
-        "polygon": "polygon",
-    }
-
     def __init__(
         self,
         base_url: str = BASE_URL,
         timeout: float = 30.0,
+        cache: RPCCache | None = None,
     ) -> None:
         """
         Initialize Beefy API client.
@@ -52,15 +193,23 @@ class BeefyAPIClient:
             API base URL
         timeout : float
             Request timeout in seconds
+        cache : RPCCache | None
+            Cache for API responses (default: the process-wide ``API_CACHE``)
 
         """
         self.base_url = base_url
-        self.client = httpx.Client(timeout=timeout)
+        self.timeout = timeout
+        self.client = get_shared_client()
+        self.cache = API_CACHE if cache is None else cache
 
-    def get_vaults(self, chain: str) -> list[dict[str, Any]]:
+    def get_vaults(self, chain: str) -> list[BeefyVault]:
         """
         Fetch all active vaults for a chain.
 
+        Only the chain's vault list is downloaded, and each record is reduced
+        to a ``BeefyVault``. The list is cached per chain for ``VAULTS_TTL``
+        seconds; do not mutate it.
+
         Parameters
         ----------
         chain : str
@@ -68,8 +217,8 @@ class BeefyAPIClient:
 
         Returns
         -------
-        list[dict[str, Any]]
-            List of vault configurations
+        list[BeefyVault]
+            Active vaults with a contract address
 
         Raises
         ------
@@ -77,24 +226,30 @@ class BeefyAPIClient:
             If the API request fails
 
         """
-        beefy_chain = self.CHAIN_MAPPING.get(chain.lower())
-        if not beefy_chain:
+        chain_lc = chain.lower()
+        if chain_lc not in SUPPORTED_CHAINS:
             msg = f"Unsupported chain: {chain}"
             raise BeefyAPIError(msg)
 
+        vaults = self.cache.get("vaults", [self.base_url, chain_lc])
+        if vaults is not None:
+            return vaults
+
         try:
-            # Fetch all vaults
-            url = f"{self.base_url}/vaults"
-            response = self.client.get(url)
+            # Fetch only this chain's vaults
+            url = f"{self.base_url}/vaults/{chain_lc}"
+            response = self.client.get(url, timeout=self.timeout)
             response.raise_for_status()
-            all_vaults = response.json()
 
-            # Filter for active vaults on this chain
-            chain_vaults = [
-                vault for vault in all_vaults if vault.get("chain") == beefy_chain and vault.get("status") == "active"
+            # Keep active vaults with a contract; the chain route also lists retired ones
+            vaults = [
+                BeefyVault.from_api(vault)
+                for vault in orjson.loads(response.content)
+                if vault.get("status") == "active" and vault.get("earnContractAddress")
             ]
 
-            return chain_vaults
+            self.cache.set("vaults", [self.base_url, chain_lc], vaults, ttl=VAULTS_TTL)
+            return vaults
 
         except httpx.TimeoutException as e:
             msg = f"Request timeout: {e}"
@@ -106,13 +261,17 @@ class BeefyAPIClient:
             msg = f"HTTP request failed: {e}"
             raise BeefyAPIError(msg) from e
 
-    def get_prices(self) -> dict[str, Decimal]:
+    def get_prices(self) -> dict[str, float]:
         """
         Fetch token prices in USD.
 
+        Prices are returned as the API's raw numbers; callers convert the few
+        they use. Cached for ``PRICES_TTL`` seconds; do not mutate the
+        returned dict.
+
         Returns
         -------
-        dict[str, Decimal]
+        dict[str, float]
             Mapping of token IDs to USD prices
 
         Raises
@@ -121,15 +280,17 @@ class BeefyAPIClient:
             If the API request fails
 
         """
+        prices = self.cache.get("prices", [self.base_url])
+        if prices is not None:
+            return prices
+
         try:
             url = f"{self.base_url}/prices"
-            response = self.client.get(url)
+            response = self.client.get(url, timeout=self.timeout)
             response.raise_for_status()
-            prices_raw = response.json()
-
-            # Convert to Decimal
-            prices = {k: Decimal(str(v)) for k, v in prices_raw.items()}
+            prices = orjson.loads(response.content)
 
+            self.cache.set("prices", [self.base_url], prices, ttl=PRICES_TTL)
             return prices
 
         except httpx.TimeoutException as e:
@@ -146,6 +307,8 @@ class BeefyAPIClient:
         """
         Fetch APY data for all vaults.
 
+        Cached for ``APY_TTL`` seconds; do not mutate the returned dict.
+
         Returns
         -------
         dict[str, dict[str, Any]]
@@ -157,11 +320,18 @@ class BeefyAPIClient:
             If the API request fails
 
         """
+        apy_data = self.cache.get("apy", [self.base_url])
+        if apy_data is not None:
+            return apy_data
+
         try:
             url = f"{self.base_url}/apy"
-            response = self.client.get(url)
+            response = self.client.get(url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            apy_data = orjson.loads(response.content)
+
+            self.cache.set("apy", [self.base_url], apy_data, ttl=APY_TTL)
+            return apy_data
 
         except httpx.TimeoutException as e:
             msg = f"Request timeout: {e}"
@@ -197,119 +367,202 @@ class BeefyAPIClient:
             List of Beefy vault positions with balances > 0
 
         """
-        positions = []
+        user_address = user_address.lower()
+
+        # Fetch vault list, prices and APY data concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            vaults_future = executor.submit(self.get_vaults, chain)
+            prices_future = executor.submit(self.get_prices)
+            apy_future = executor.submit(self.get_apy)
 
-        # Fetch vault list
         try:
-            vaults = self.get_vaults(chain)
+            vaults = vaults_future.result()
         except BeefyAPIError:
             return []
 
-        # Fetch prices
         try:
-            prices = self.get_prices()
+            prices = prices_future.result()
         except BeefyAPIError:
             prices = {}
 
-        # Fetch APY data
         try:
-            apy_data = self.get_apy()
+            apy_data = apy_future.result()
         except BeefyAPIError:
             apy_data = {}
 
-        # Check each vault for user balance
-        for vault in vaults:
-            vault_address = vault.get("earnContractAddress")
-            if not vault_address:
-                continue
+        if not vaults:
+            return []
+
+        # One multicall round for every balance, a second for share prices of held vaults only
+        balances = self._multicall_balances([vault.address for vault in vaults], user_address, rpc_provider)
+        held = [(vault, balance_raw) for vault, balance_raw in zip(vaults, balances, strict=True) if balance_raw]
+        if not held:
+            return []
 
-            try:
-                # Check user balance via RPC
-                contract = rpc_provider.get_contract(vault_address)
-                balance_raw = contract.balanceOf(user_address)
-
-                if balance_raw == 0:
-                    continue
-
-                # User has balance in this vault
-                # Get price per full share
-                try:
-                    price_per_share_raw = contract.getPricePerFullShare()
-                    price_per_share = Decimal(str(price_per_share_raw)) / Decimal(10**18)
-                except Exception:
-                    price_per_share = Decimal(1)
-
-                # Get token decimals
-                decimals = vault.get("tokenDecimals", 18)
-                balance = Decimal(str(balance_raw)) / Decimal(10**decimals)
-
-                # Calculate underlying balance
-                underlying_balance = balance * price_per_share
-
-                # Get token info
-                token_address = vault.get("tokenAddress", "")
-                token_symbol = vault.get("token", "UNKNOWN")
-
-                # Get USD value from prices
-                vault_id = vault.get("id", "")
-                usd_value = None
-                if vault_id in prices:
-                    usd_value = underlying_balance * prices[vault_id]
-
-                # Get APY
-                apy = None
-                if vault_id in apy_data:
-                    apy_info = apy_data[vault_id]
-                    if isinstance(apy_info, dict):
-                        apy = Decimal(str(apy_info.get("totalApy", 0)))
-                    else:
-                        apy = Decimal(str(apy_info))
-
-                # Create position
-                vault_token = Token(
-                    address=vault_address,
-                    symbol=f"moo{token_symbol}",
-                    decimals=decimals,
-                    name=vault.get("name", ""),
-                )
-
-                underlying_token = Token(
-                    address=token_address,
-                    symbol=token_symbol,
-                    decimals=decimals,
-                    name=token_symbol,
-                )
-
-                position = Position(
-                    protocol="beefy",
-                    chain=chain,
-                    position_type=PositionType.VAULT,
-                    token=vault_token,
-                    balance=balance,
-                    underlying_token=underlying_token,
-                    underlying_balance=underlying_balance,
-                    usd_value=usd_value,
-                    apy=apy,
-                    metadata={
-                        "vault_id": vault_id,
-                        "vault_name": vault.get("name", ""),
-                        "platform": vault.get("platform", ""),
-                        "strategy": vault.get("strategy", ""),
-                        "source": "beefy_api",
-                    },
-                )
-
-                positions.append(position)
+        prices_per_share = self._multicall_uint256(
+            [(vault.address, GET_PRICE_PER_FULL_SHARE_SELECTOR) for vault, _ in held], rpc_provider
+        )
+
+        return [
+            self._build_vault_position(vault, balance_raw, price_per_share_raw, chain, prices, apy_data)
+            for (vault, balance_raw), price_per_share_raw in zip(held, prices_per_share, strict=True)
+        ]
+
+    def _multicall_balances(self, vault_addresses: list[str], user_address: str, rpc_provider: Any) -> list[int | None]:
+        """
+        Read a user's share balance in many vaults through Multicall3.
+
+        Parameters
+        ----------
+        vault_addresses : list[str]
+            Vault contract addresses
+        user_address : str
+            User wallet address
+        rpc_provider : Any
+            RPC provider with ``make_request``
+
+        Returns
+        -------
+        list[int | None]
+            Raw balance per vault in order (None if the read failed)
 
+        """
+        calldata = BALANCE_OF_SELECTOR + encode(["address"], [user_address])
+        return self._multicall_uint256([(address, calldata) for address in vault_addresses], rpc_provider)
+
+    @staticmethod
+    def _multicall_uint256(calls: list[tuple[str, bytes]], rpc_provider: Any) -> list[int | None]:
+        """
+        Run uint256-returning calls as ``aggregate3`` batches.
+
+        Calls are split into batches of ``MULTICALL_BATCH_SIZE``, sent
+        concurrently.
+
+        Parameters
+        ----------
+        calls : list[tuple[str, bytes]]
+            List of (target address, calldata) tuples
+        rpc_provider : Any
+            RPC provider with ``make_request``
+
+        Returns
+        -------
+        list[int | None]
+            Decoded value per call in order (None if the call or its batch failed)
+
+        """
+
+        def run(batch: list[tuple[str, bytes]]) -> list[int | None]:
+            try:
+                results = aggregate3(rpc_provider, batch)
             except Exception:
-                # Skip vaults that fail
-                continue
+                return [None] * len(batch)
+            return [int.from_bytes(data[:32], "big") if data and len(data) >= 32 else None for data in results]
 
-        return positions
+        batches = [calls[i : i + MULTICALL_BATCH_SIZE] for i in range(0, len(calls), MULTICALL_BATCH_SIZE)]
+        if len(batches) == 1:
+            return run(batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(MAX_VAULT_WORKERS, len(batches))) as executor:
+            return [value for batch_values in executor.map(run, batches) for value in batch_values]
+
+    @staticmethod
+    def _build_vault_position(
+        vault: BeefyVault,
+        balance_raw: int,
+        price_per_share_raw: int | None,
+        chain: str,
+        prices: dict[str, float],
+        apy_data: dict[str, Any],
+    ) -> Position:
+        """
+        Build the position for a vault the user holds shares in.
+
+        Parameters
+        ----------
+        vault : BeefyVault
+            Vault from the API
+        balance_raw : int
+            User's raw share balance
+        price_per_share_raw : int | None
+            Raw ``getPricePerFullShare()`` value (None if the read failed)
+        chain : str
+            Chain name
+        prices : dict[str, float]
+            Vault prices by vault ID
+        apy_data : dict[str, Any]
+            APY information by vault ID
+
+        Returns
+        -------
+        Position
+            Vault position
+
+        """
+        # Underlying amount in raw units: price per full share is 18-decimal fixed point (1:1 if unreadable)
+        if price_per_share_raw is None:
+            underlying_raw = balance_raw
+        else:
+            underlying_raw = balance_raw * price_per_share_raw // PRICE_PER_SHARE_SCALE
+
+        # Convert to token units once, by shifting the exponent instead of dividing
+        decimals = vault.token_decimals
+        balance = Decimal(balance_raw).scaleb(-decimals)
+        underlying_balance = Decimal(underlying_raw).scaleb(-decimals)
+
+        # Get USD value from prices
+        vault_id = vault.id
+        usd_value = None
+        if vault_id in prices:
+            usd_value = underlying_balance * Decimal(str(prices[vault_id]))
+
+        # Get APY
+        apy = None
+        if vault_id in apy_data:
+            apy_info = apy_data[vault_id]
+            if isinstance(apy_info, dict):
+                apy = Decimal(str(apy_info.get("totalApy", 0)))
+            else:
+                apy = Decimal(str(apy_info))
+
+        # Create position
+        vault_token = Token(
+            address=vault.address,
+            symbol=f"moo{vault.token}",
+            decimals=decimals,
+            name=vault.name,
+        )
+
+        underlying_token = Token(
+            address=vault.token_address,
+            symbol=vault.token,
+            decimals=decimals,
+            name=vault.token,
+        )
+
+        return Position(
+            protocol="beefy",
+            chain=chain,
+            position_type=PositionType.VAULT,
+            token=vault_token,
+            balance=balance,
+            underlying_token=underlying_token,
+            underlying_balance=underlying_balance,
+            usd_value=usd_value,
+            apy=apy,
+            metadata={
+                "vault_id": vault_id,
+                "vault_name": vault.name,
+                "platform": vault.platform,
+                "strategy": vault.strategy,
+                "source": "beefy_api",
+            },
+        )
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client, unless it is the shared one kept open for later clients."""
+        if self.client is not _SHARED_CLIENT:
+            self.client.close()
 
     def __enter__(self) -> "BeefyAPIClient":
         """Context manager entry."""
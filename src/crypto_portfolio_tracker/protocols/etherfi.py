@@ -3,9 +3,9 @@
 import os
 from decimal import Decimal
 
-from crypto_portfolio_tracker.core.models import Position, PositionType, Token
+from crypto_portfolio_tracker.core.models import E6, E18, Position, PositionType, Token
 from crypto_portfolio_tracker.core.registry import ProtocolRegistry
-from crypto_portfolio_tracker.integrations.zerion import ZerionAPIError, ZerionClient
+from crypto_portfolio_tracker.integrations.zerion import ZerionAPIError, get_shared_client
 from crypto_portfolio_tracker.protocols.base import BaseProtocolHandler
 from crypto_portfolio_tracker.rpc.multicall import MulticallBatcher
 
@@ -29,6 +29,18 @@ class EtherfiHandler(BaseProtocolHandler):
         "0xe96d7872363f475d18b2f5390caaa5eaa96b2d38e42c62afe4ac08ebd2b13c3a",  # Deposit(uint256 indexed nonce,address indexed receiver,address indexed depositAsset,...)
     ]
 
+    # User receives shares as Enter `to` / Deposit `receiver`
+    discovery_topic_positions = {
+        "0xea00f88768a86184a6e515238a549c171769fe7460a011d6fd0bcd48ca078ea4": 3,
+        "0xe96d7872363f475d18b2f5390caaa5eaa96b2d38e42c62afe4ac08ebd2b13c3a": 2,
+    }
+
+    # Enter is emitted by the Liquid vault, Deposit by its teller
+    discovery_contracts = {
+        "0xea00f88768a86184a6e515238a549c171769fe7460a011d6fd0bcd48ca078ea4": ("liquid_vault",),
+        "0xe96d7872363f475d18b2f5390caaa5eaa96b2d38e42c62afe4ac08ebd2b13c3a": ("teller",),
+    }
+
     def get_positions(self, user_address: str, chain: str) -> list[Position]:
         """
         Fetch Ether.fi positions for a user.
@@ -55,30 +67,31 @@ class EtherfiHandler(BaseProtocolHandler):
         api_key = os.getenv("ZERION_API_KEY")
         if api_key:
             try:
-                with ZerionClient(api_key) as client:
-                    # Fetch all positions from Zerion
-                    all_positions = client.get_positions_as_models(user_address, [chain])
-
-                    # Filter for Ether.fi positions with flexible matching
-                    etherfi_keywords = ["etherfi", "ether.fi", "ether-fi"]
+                # Shared client: keeps connections and ETag validators between calls
+                client = get_shared_client(api_key)
+                # Fetch all positions from Zerion
+                all_positions = client.get_positions_as_models(user_address, [chain])
+
+                # Filter for Ether.fi positions with flexible matching
+                etherfi_keywords = ["etherfi", "ether.fi", "ether-fi"]
+                etherfi_positions = [
+                    pos
+                    for pos in all_positions
+                    if any(keyword in pos.protocol.lower() for keyword in etherfi_keywords) and pos.chain == chain
+                ]
+
+                # Fallback: Check for eETH/weETH/liquidUSD tokens as proof of positions
+                if not etherfi_positions:
+                    etherfi_token_symbols = ["eeth", "weeth", "liquidusd"]
                     etherfi_positions = [
                         pos
                         for pos in all_positions
-                        if any(keyword in pos.protocol.lower() for keyword in etherfi_keywords) and pos.chain == chain
+                        if any(token in pos.token.symbol.lower() for token in etherfi_token_symbols)
+                        and pos.chain == chain
                     ]
 
-                    # Fallback: Check for eETH/weETH/liquidUSD tokens as proof of positions
-                    if not etherfi_positions:
-                        etherfi_token_symbols = ["eeth", "weeth", "liquidusd"]
-                        etherfi_positions = [
-                            pos
-                            for pos in all_positions
-                            if any(token in pos.token.symbol.lower() for token in etherfi_token_symbols)
-                            and pos.chain == chain
-                        ]
-
-                    if etherfi_positions:
-                        return etherfi_positions
+                if etherfi_positions:
+                    return etherfi_positions
 
             except (ZerionAPIError, Exception):
                 # Silently fall back to RPC
@@ -353,7 +366,7 @@ class EtherfiHandler(BaseProtocolHandler):
             if exchange_rate_raw is not None:
                 # Convert exchange rate from 6 decimals to Decimal
                 # AccountantWithRateProviders returns rate in base asset decimals (USDC = 6)
-                exchange_rate = Decimal(str(exchange_rate_raw)) / Decimal(10**6)
+                exchange_rate = Decimal(str(exchange_rate_raw)) / E6
                 underlying_value = balance * exchange_rate
             else:
                 # Fallback if exchange rate not available
@@ -429,7 +442,7 @@ class EtherfiHandler(BaseProtocolHandler):
             )
 
             # Convert from wei to token amount (18 decimals)
-            balance = Decimal(str(balance_raw)) / Decimal(10**18)
+            balance = Decimal(str(balance_raw)) / E18
 
             if balance == 0:
                 return None
@@ -504,7 +517,7 @@ class EtherfiHandler(BaseProtocolHandler):
             )
 
             # Convert from wei to token amount (18 decimals)
-            balance = Decimal(str(balance_raw)) / Decimal(10**18)
+            balance = Decimal(str(balance_raw)) / E18
 
             if balance == 0:
                 return None
@@ -518,7 +531,7 @@ class EtherfiHandler(BaseProtocolHandler):
             )
 
             # Convert eETH amount from wei
-            eeth_amount = Decimal(str(eeth_amount_raw)) / Decimal(10**18)
+            eeth_amount = Decimal(str(eeth_amount_raw)) / E18
 
         except Exception:
             # If call fails, skip this position
@@ -592,7 +605,7 @@ class EtherfiHandler(BaseProtocolHandler):
             )
 
             # Convert from wei to token amount (18 decimals)
-            balance = Decimal(str(balance_raw)) / Decimal(10**18)
+            balance = Decimal(str(balance_raw)) / E18
 
             if balance == 0:
                 return None
@@ -605,7 +618,7 @@ class EtherfiHandler(BaseProtocolHandler):
                     [],
                     chain,
                 )
-                share_price = Decimal(str(share_price_raw)) / Decimal(10**18)
+                share_price = Decimal(str(share_price_raw)) / E18
                 underlying_value = balance * share_price
             except Exception:
                 # If pricePerShare fails, assume 1:1
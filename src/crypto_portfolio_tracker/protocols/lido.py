@@ -2,7 +2,7 @@
 
 from decimal import Decimal
 
-from crypto_portfolio_tracker.core.models import Position, PositionType, Token
+from crypto_portfolio_tracker.core.models import E18, Position, PositionType, Token
 from crypto_portfolio_tracker.core.registry import ProtocolRegistry
 from crypto_portfolio_tracker.protocols.base import BaseProtocolHandler
 
@@ -25,6 +25,16 @@ class LidoHandler(BaseProtocolHandler):
         "0x96a25c8ce0baabc1fdefd93e9ed25d8e092a3332f3aa9a41722b5697231d1d1a",  # Submitted(address indexed sender,uint256 amount,address indexed referral)
     ]
 
+    # User is the Submitted `sender`
+    discovery_topic_positions = {
+        "0x96a25c8ce0baabc1fdefd93e9ed25d8e092a3332f3aa9a41722b5697231d1d1a": 1,
+    }
+
+    # Submitted is emitted by the stETH contract
+    discovery_contracts = {
+        "0x96a25c8ce0baabc1fdefd93e9ed25d8e092a3332f3aa9a41722b5697231d1d1a": ("steth",),
+    }
+
     def get_positions(self, user_address: str, chain: str) -> list[Position]:
         """
         Fetch Lido positions for a user.
@@ -101,7 +111,7 @@ class LidoHandler(BaseProtocolHandler):
             )
 
             # Convert from wei to token amount (18 decimals)
-            balance = Decimal(str(balance_raw)) / Decimal(10**18)
+            balance = Decimal(str(balance_raw)) / E18
 
             if balance == 0:
                 return None
@@ -176,7 +186,7 @@ class LidoHandler(BaseProtocolHandler):
             )
 
             # Convert from wei to token amount (18 decimals)
-            balance = Decimal(str(balance_raw)) / Decimal(10**18)
+            balance = Decimal(str(balance_raw)) / E18
 
             if balance == 0:
                 return None
@@ -190,7 +200,7 @@ class LidoHandler(BaseProtocolHandler):
             )
 
             # Convert stETH amount from wei
-            steth_amount = Decimal(str(steth_amount_raw)) / Decimal(10**18)
+            steth_amount = Decimal(str(steth_amount_raw)) / E18
 
         except Exception:
             # If call fails, skip this position
@@ -24,6 +24,11 @@ class MorphoHandler(BaseProtocolHandler):
         "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",  # Transfer
     ]
 
+    # User receives tokens as Transfer `to`
+    discovery_topic_positions = {
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef": 2,
+    }
+
     def get_positions(self, user_address: str, chain: str) -> list[Position]:
         """
         Fetch Morpho positions for a user via GraphQL API.
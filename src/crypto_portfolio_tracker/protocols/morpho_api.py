@@ -5,7 +5,7 @@ from typing import Any
 
 import httpx
 
-from crypto_portfolio_tracker.core.models import Position, PositionType, Token
+from crypto_portfolio_tracker.core.models import E6, E18, Position, PositionType, Token
 
 
 class MorphoAPIError(Exception):
@@ -355,8 +355,8 @@ class MorphoGraphQLClient:
             name=vault.get("name"),
         )
 
-        shares = Decimal(str(vault_pos.get("shares", 0))) / Decimal(10**18)
-        assets_decimal = Decimal(str(assets)) / Decimal(10**6)  # USDC has 6 decimals
+        shares = Decimal(str(vault_pos.get("shares", 0))) / E18
+        assets_decimal = Decimal(str(assets)) / E6  # USDC has 6 decimals
         usd_value = Decimal(str(vault_pos.get("assetsUsd", 0)))
 
         return Position(
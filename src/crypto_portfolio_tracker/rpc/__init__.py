@@ -1,17 +1,38 @@
 """RPC layer with provider management, retry logic, caching, and multicall support."""
 
-from crypto_portfolio_tracker.rpc.cache import CacheEntry, RPCCache
-from crypto_portfolio_tracker.rpc.multicall import MulticallBatcher
-from crypto_portfolio_tracker.rpc.provider import ApeRPCProvider, MultiRPCProvider
+from crypto_portfolio_tracker.rpc.cache import CacheEntry, PersistentRPCCache, RPCCache, get_persistent_cache
+from crypto_portfolio_tracker.rpc.errors import RPCError
+from crypto_portfolio_tracker.rpc.multicall import (
+    MULTICALL3_ADDRESS,
+    CoalescingRPCClient,
+    MulticallBatcher,
+    aggregate3,
+)
+from crypto_portfolio_tracker.rpc.provider import (
+    ApeRPCProvider,
+    MultiChainRPCProvider,
+    MultiRPCProvider,
+    disconnect_all_providers,
+    get_provider,
+)
 from crypto_portfolio_tracker.rpc.retry import RetryConfig, RetryManager, with_retry
 
 __all__ = [
+    "MULTICALL3_ADDRESS",
     "ApeRPCProvider",
     "CacheEntry",
+    "CoalescingRPCClient",
+    "MultiChainRPCProvider",
     "MultiRPCProvider",
     "MulticallBatcher",
+    "PersistentRPCCache",
     "RPCCache",
+    "RPCError",
     "RetryConfig",
     "RetryManager",
+    "aggregate3",
+    "disconnect_all_providers",
+    "get_persistent_cache",
+    "get_provider",
     "with_retry",
 ]
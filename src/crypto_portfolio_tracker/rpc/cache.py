@@ -1,10 +1,21 @@
-"""TTL-based caching for RPC responses."""
+"""TTL-based and persistent caching for RPC responses."""
 
+import atexit
 import hashlib
-import json
+import logging
+import re
+import sqlite3
+import threading
 import time
+from decimal import Decimal
+from functools import cache
+from pathlib import Path
 from typing import Any
 
+import orjson
+
+logger = logging.getLogger(__name__)
+
 
 class CacheEntry:
     """
@@ -43,6 +54,8 @@ class RPCCache:
     """
     In-memory cache for RPC responses with TTL.
 
+    Safe to share between threads.
+
     Parameters
     ----------
     default_ttl : int
@@ -53,6 +66,7 @@ class RPCCache:
     def __init__(self, default_ttl: int = 300) -> None:
         self.default_ttl = default_ttl
         self._cache: dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
 
     def _make_key(self, method: str, params: list[Any]) -> str:
         """
@@ -73,9 +87,9 @@ class RPCCache:
         """
         # Create a deterministic string representation
         key_data = {"method": method, "params": params}
-        key_str = json.dumps(key_data, sort_keys=True)
+        key_bytes = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS)
         # Hash for consistent key length
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        return hashlib.sha256(key_bytes).hexdigest()
 
     def get(self, method: str, params: list[Any]) -> Any | None:
         """
@@ -95,17 +109,19 @@ class RPCCache:
 
         """
         key = self._make_key(method, params)
-        entry = self._cache.get(key)
 
-        if entry is None:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
 
-        if entry.is_expired():
-            # Clean up expired entry
-            del self._cache[key]
-            return None
+            if entry is None:
+                return None
+
+            if entry.is_expired():
+                # Clean up expired entry
+                del self._cache[key]
+                return None
 
-        return entry.value
+            return entry.value
 
     def set(self, method: str, params: list[Any], value: Any, ttl: int | None = None) -> None:
         """
@@ -125,11 +141,13 @@ class RPCCache:
         """
         key = self._make_key(method, params)
         ttl = ttl or self.default_ttl
-        self._cache[key] = CacheEntry(value, ttl)
+        with self._lock:
+            self._cache[key] = CacheEntry(value, ttl)
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def cleanup_expired(self) -> int:
         """
@@ -141,7 +159,379 @@ class RPCCache:
             Number of entries removed
 
         """
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        with self._lock:
+            expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
+            for key in expired_keys:
+                del self._cache[key]
         return len(expired_keys)
+
+
+# Hex block numbers of at most 16 digits; block tags, block hashes and
+# EIP-1898 objects never match and are not persisted
+BLOCK_NUMBER_PATTERN = re.compile(r"0x[0-9a-fA-F]{1,16}")
+
+# Largest value sqlite stores in a (signed 64-bit) INTEGER column
+MAX_BLOCK_NUMBER = 2**63 - 1
+
+# Stored eth_call responses older than this are pruned when the cache is opened;
+# each run pins a new block, so older entries are almost never hit again
+ETH_CALL_MAX_AGE = 24 * 60 * 60
+
+# Buffered eth_call responses written to disk in one transaction
+ETH_CALL_FLUSH_SIZE = 200
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "crypto-portfolio-tracker" / "cache.sqlite"
+
+
+class PersistentRPCCache:
+    """
+    SQLite-backed cache for ``eth_call`` responses that survives process exit.
+
+    Only calls made against a concrete block number are stored: state at a
+    fixed block never changes, so entries need no TTL. The database runs in
+    WAL mode so concurrent CLI invocations can read while another writes.
+    Safe to share between threads.
+
+    New ``eth_call`` responses are buffered and written in batches of
+    ``ETH_CALL_FLUSH_SIZE``, and entries older than ``ETH_CALL_MAX_AGE`` are
+    pruned on open. Database errors (e.g. ``database is locked`` from a
+    concurrent run) are logged and treated as cache misses, so callers fall
+    back to the network.
+
+    Also records per-protocol discovery results for the scanner, together
+    with the last block each one covers, and recent token prices so pricing
+    services can skip the network on a cold start.
+
+    Parameters
+    ----------
+    path : Path | None
+        Database file. Uses ``~/.cache/crypto-portfolio-tracker/cache.sqlite`` if None.
+
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS eth_call (
+                chain TEXT NOT NULL,
+                to_addr TEXT NOT NULL,
+                calldata TEXT NOT NULL,
+                block INTEGER NOT NULL,
+                response BLOB NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (chain, to_addr, calldata, block)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS protocol_activity (
+                chain TEXT NOT NULL,
+                address TEXT NOT NULL,
+                protocol TEXT NOT NULL,
+                has_activity INTEGER NOT NULL,
+                scanned_block INTEGER NOT NULL,
+                PRIMARY KEY (chain, address, protocol)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS token_price (
+                source TEXT NOT NULL,
+                chain TEXT NOT NULL,
+                address TEXT NOT NULL,
+                price TEXT NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (source, chain, address)
+            )
+            """
+        )
+        self._conn.commit()
+        self._pending_calls: dict[tuple[str, str, str, int], tuple[bytes, float]] = {}
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete ``eth_call`` entries older than ``ETH_CALL_MAX_AGE``."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM eth_call WHERE ts < ?", (time.time() - ETH_CALL_MAX_AGE,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.debug("Could not prune persistent cache: %s", e)
+
+    @staticmethod
+    def _parse_call(params: list[Any]) -> tuple[str, str, int] | None:
+        """
+        Extract the cache key parts from ``eth_call`` parameters.
+
+        Parameters
+        ----------
+        params : list[Any]
+            ``eth_call`` parameters: ``[{"to": ..., "data": ...}, block]``
+
+        Returns
+        -------
+        tuple[str, str, int] | None
+            (to address, calldata, block number), or None if the call is not
+            made against a hex block number
+
+        """
+        if len(params) != 2 or not isinstance(params[0], dict):
+            return None
+
+        call, block = params
+        if not isinstance(block, str) or not BLOCK_NUMBER_PATTERN.fullmatch(block):
+            return None
+
+        to_addr = call.get("to")
+        calldata = call.get("data") or call.get("input")
+        if not to_addr or calldata is None or set(call) - {"to", "data", "input"}:
+            return None
+
+        block_number = int(block, 16)
+        if block_number > MAX_BLOCK_NUMBER:
+            return None
+
+        return to_addr.lower(), calldata.lower(), block_number
+
+    def get(self, chain: str, params: list[Any]) -> Any | None:
+        """
+        Get a cached ``eth_call`` response.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier, e.g. ``ethereum:mainnet``
+        params : list[Any]
+            ``eth_call`` parameters
+
+        Returns
+        -------
+        Any | None
+            Cached response if found, None otherwise
+
+        """
+        key = self._parse_call(params)
+        if key is None:
+            return None
+
+        try:
+            with self._lock:
+                pending = self._pending_calls.get((chain, *key))
+                if pending is not None:
+                    return orjson.loads(pending[0])
+                row = self._conn.execute(
+                    "SELECT response FROM eth_call WHERE chain = ? AND to_addr = ? AND calldata = ? AND block = ?",
+                    (chain, *key),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug("Persistent cache read failed: %s", e)
+            return None
+
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, chain: str, params: list[Any], value: Any) -> None:
+        """
+        Store an ``eth_call`` response.
+
+        Calls not pinned to a concrete block number are ignored. The
+        response is buffered until ``ETH_CALL_FLUSH_SIZE`` are pending.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier, e.g. ``ethereum:mainnet``
+        params : list[Any]
+            ``eth_call`` parameters
+        value : Any
+            Response to cache
+
+        """
+        key = self._parse_call(params)
+        if key is None:
+            return
+
+        with self._lock:
+            self._pending_calls[chain, *key] = (orjson.dumps(value), time.time())
+            if len(self._pending_calls) >= ETH_CALL_FLUSH_SIZE:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write buffered ``eth_call`` responses to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Write buffered ``eth_call`` responses in one transaction; the caller holds the lock."""
+        if not self._pending_calls:
+            return
+
+        rows = [(*key, response, ts) for key, (response, ts) in self._pending_calls.items()]
+        self._pending_calls.clear()
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO eth_call (chain, to_addr, calldata, block, response, ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.debug("Persistent cache write failed, dropping %d entries: %s", len(rows), e)
+
+    def get_activity(self, chain: str, address: str, protocol: str) -> tuple[bool, int] | None:
+        """
+        Get the last discovery result for an address on a protocol.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+        address : str
+            User address
+        protocol : str
+            Protocol name
+
+        Returns
+        -------
+        tuple[bool, int] | None
+            (activity found, last block scanned), or None if never scanned
+
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT has_activity, scanned_block FROM protocol_activity "
+                    "WHERE chain = ? AND address = ? AND protocol = ?",
+                    (chain, address.lower(), protocol),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug("Persistent cache read failed: %s", e)
+            return None
+
+        return (bool(row[0]), row[1]) if row else None
+
+    def set_activity(self, chain: str, address: str, protocol: str, has_activity: bool, scanned_block: int) -> None:
+        """
+        Record a discovery result for an address on a protocol.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+        address : str
+            User address
+        protocol : str
+            Protocol name
+        has_activity : bool
+            Whether activity was found
+        scanned_block : int
+            Last block the scan covered
+
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO protocol_activity (chain, address, protocol, has_activity, scanned_block) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (chain, address.lower(), protocol, int(has_activity), scanned_block),
+                )
+        except sqlite3.Error as e:
+            logger.debug("Persistent cache write failed: %s", e)
+
+    def get_prices(
+        self,
+        source: str,
+        tokens: list[tuple[str, str]],
+        max_age: float,
+    ) -> dict[tuple[str, str], Decimal]:
+        """
+        Get recently stored prices for tokens.
+
+        Parameters
+        ----------
+        source : str
+            Pricing source, e.g. ``chainlink`` or ``defillama``
+        tokens : list[tuple[str, str]]
+            (chain, address) pairs
+        max_age : float
+            Maximum age in seconds of a usable price
+
+        Returns
+        -------
+        dict[tuple[str, str], Decimal]
+            Prices keyed by the given (chain, address) pairs, for tokens with a
+            fresh entry only
+
+        """
+        min_ts = time.time() - max_age
+        prices = {}
+        try:
+            with self._lock:
+                for chain, address in tokens:
+                    row = self._conn.execute(
+                        "SELECT price FROM token_price WHERE source = ? AND chain = ? AND address = ? AND ts >= ?",
+                        (source, chain, address.lower(), min_ts),
+                    ).fetchone()
+                    if row:
+                        prices[chain, address] = Decimal(row[0])
+        except sqlite3.Error as e:
+            logger.debug("Persistent cache read failed: %s", e)
+        return prices
+
+    def set_prices(self, source: str, prices: dict[tuple[str, str], Decimal]) -> None:
+        """
+        Store token prices.
+
+        Parameters
+        ----------
+        source : str
+            Pricing source, e.g. ``chainlink`` or ``defillama``
+        prices : dict[tuple[str, str], Decimal]
+            Prices keyed by (chain, address)
+
+        """
+        if not prices:
+            return
+
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO token_price (source, chain, address, price, ts) VALUES (?, ?, ?, ?, ?)",
+                    [(source, chain, address.lower(), str(price), now) for (chain, address), price in prices.items()],
+                )
+        except sqlite3.Error as e:
+            logger.debug("Persistent cache write failed: %s", e)
+
+    def close(self) -> None:
+        """Write buffered responses and close the database connection."""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+@cache
+def get_persistent_cache() -> PersistentRPCCache | None:
+    """
+    Get the process-wide persistent ``eth_call`` cache.
+
+    Returns
+    -------
+    PersistentRPCCache | None
+        Shared cache at the default path, or None if the database cannot be opened
+
+    """
+    try:
+        persistent_cache = PersistentRPCCache()
+    except (OSError, sqlite3.Error):
+        return None
+    # Write buffered responses on exit
+    atexit.register(persistent_cache.close)
+    return persistent_cache
@@ -0,0 +1,38 @@
+"""Structured errors raised by the RPC layer."""
+
+from typing import Any
+
+
+class RPCError(RuntimeError):
+    """
+    JSON-RPC error object returned by a node.
+
+    Parameters
+    ----------
+    method : str
+        RPC method that failed
+    error : Any
+        The response's ``error`` member
+
+    Attributes
+    ----------
+    code : int | None
+        JSON-RPC error code (None if the node sent no integer code)
+    message : str
+        Error message
+    data : Any
+        Optional ``data`` member with provider-specific details
+
+    """
+
+    def __init__(self, method: str, error: Any) -> None:
+        if isinstance(error, dict):
+            code = error.get("code")
+            self.code = code if isinstance(code, int) else None
+            self.message = str(error.get("message", ""))
+            self.data = error.get("data")
+        else:
+            self.code = None
+            self.message = str(error)
+            self.data = None
+        super().__init__(f"RPC error for {method}: {error}")
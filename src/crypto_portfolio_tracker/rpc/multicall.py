@@ -1,10 +1,89 @@
 """Multicall support for batching multiple contract calls using Multicall3 contract."""
 
+import queue
+import threading
 import time
+from concurrent.futures import Future
 from typing import Any
 
+from eth_abi import decode, encode
+
 from crypto_portfolio_tracker.rpc.retry import RetryConfig
 
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# aggregate3((address,bool,bytes)[])
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+# Retry settings shared by batchers created without their own, so a batcher is cheap to build per fetch
+DEFAULT_RETRY_CONFIG = RetryConfig(max_retries=3, base_delay=1.0, max_delay=30.0, exponential_base=2.0)
+
+
+def encode_aggregate3(calls: list[tuple[str, bytes]]) -> str:
+    """
+    Encode calldata for ``Multicall3.aggregate3`` with failures allowed.
+
+    Parameters
+    ----------
+    calls : list[tuple[str, bytes]]
+        List of (target address, calldata) tuples
+
+    Returns
+    -------
+    str
+        Hex-encoded calldata (0x prefixed)
+
+    """
+    encoded = encode(["(address,bool,bytes)[]"], [[(target, True, data) for target, data in calls]])
+    return "0x" + (AGGREGATE3_SELECTOR + encoded).hex()
+
+
+def decode_aggregate3(result: str) -> list[bytes | None]:
+    """
+    Decode the return data of ``Multicall3.aggregate3``.
+
+    Parameters
+    ----------
+    result : str
+        Hex-encoded ``eth_call`` result (0x prefixed)
+
+    Returns
+    -------
+    list[bytes | None]
+        Return data for each call in order (None if the call reverted)
+
+    """
+    (results,) = decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))
+    return [data if success else None for success, data in results]
+
+
+def aggregate3(rpc_provider: Any, calls: list[tuple[str, bytes]]) -> list[bytes | None]:
+    """
+    Execute several read-only calls in one ``eth_call`` through Multicall3.
+
+    Parameters
+    ----------
+    rpc_provider : Any
+        RPC provider with ``make_request``
+    calls : list[tuple[str, bytes]]
+        List of (target address, calldata) tuples
+
+    Returns
+    -------
+    list[bytes | None]
+        Return data for each call in order (None if the call reverted)
+
+    """
+    if not calls:
+        return []
+
+    result = rpc_provider.make_request(
+        "eth_call",
+        [{"to": MULTICALL3_ADDRESS, "data": encode_aggregate3(calls)}, "latest"],
+    )
+    return decode_aggregate3(result)
+
 
 class MulticallBatcher:
     """
@@ -42,12 +121,7 @@ class MulticallBatcher:
         self.provider = provider
         self._calls: list[dict[str, Any]] = []
         self.debug = debug
-        self.retry_config = retry_config or RetryConfig(
-            max_retries=3,
-            base_delay=1.0,
-            max_delay=30.0,
-            exponential_base=2.0,
-        )
+        self.retry_config = retry_config or DEFAULT_RETRY_CONFIG
 
     def add_call(self, contract_address: str, method: str, params: list[Any]) -> None:
         """
@@ -162,3 +236,143 @@ class MulticallBatcher:
 
         """
         return len(self._calls)
+
+
+class CoalescingRPCClient:
+    """
+    Coalesces read-only calls from concurrent callers into shared Multicall3 batches.
+
+    Calls are queued and sent by a background thread: after the first call
+    arrives it waits ``stall_ms`` for more, then sends up to ``max_batch``
+    calls as one ``aggregate3`` request. Callers on different threads that
+    read within the same window therefore share one RPC round-trip.
+
+    Parameters
+    ----------
+    rpc_provider : Any
+        RPC provider with ``make_request``
+    max_batch : int
+        Maximum number of calls sent in one batch
+    stall_ms : float
+        Milliseconds to wait for more calls before sending a batch
+
+    """
+
+    def __init__(self, rpc_provider: Any, max_batch: int = 20, stall_ms: float = 20) -> None:
+        """
+        Initialize the coalescing client.
+
+        Parameters
+        ----------
+        rpc_provider : Any
+            RPC provider with ``make_request``
+        max_batch : int
+            Maximum number of calls sent in one batch
+        stall_ms : float
+            Milliseconds to wait for more calls before sending a batch
+
+        """
+        self.rpc_provider = rpc_provider
+        self.max_batch = max_batch
+        self.stall_ms = stall_ms
+        self._queue: queue.Queue[tuple[str, bytes, Future] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, target: str, data: bytes) -> Future:
+        """
+        Queue a read-only call for the next batch.
+
+        Parameters
+        ----------
+        target : str
+            Contract address
+        data : bytes
+            Calldata
+
+        Returns
+        -------
+        Future
+            Resolves to the return data (None if the call reverted), or to the
+            exception raised by the batch request
+
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rpc-coalescer", daemon=True)
+                self._thread.start()
+            self._queue.put((target, data, future))
+        return future
+
+    def call(self, target: str, data: bytes) -> bytes | None:
+        """
+        Make a read-only call through the next batch and wait for its result.
+
+        Parameters
+        ----------
+        target : str
+            Contract address
+        data : bytes
+            Calldata
+
+        Returns
+        -------
+        bytes | None
+            Return data (None if the call reverted)
+
+        """
+        return self.submit(target, data).result()
+
+    def _run(self) -> None:
+        """Send queued calls in batches until ``close`` is called."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.stall_ms / 1000
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._send(batch)
+            if stop:
+                return
+
+    def _send(self, batch: list[tuple[str, bytes, Future]]) -> None:
+        """
+        Send one batch and resolve its futures.
+
+        Parameters
+        ----------
+        batch : list[tuple[str, bytes, Future]]
+            Queued (target, calldata, future) items
+
+        """
+        try:
+            results = aggregate3(self.rpc_provider, [(target, data) for target, data, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results, strict=True):
+            future.set_result(result)
+
+    def close(self) -> None:
+        """Send any queued calls and stop the background thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(None)
+        thread.join()
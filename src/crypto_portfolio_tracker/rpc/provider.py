@@ -1,15 +1,38 @@
 """RPC provider wrapper using Ape's network management."""
 
+import atexit
 import logging
+import threading
 import time
-from typing import Any
-
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import Any, TypeVar
+
+import httpx
+import orjson
 from ape import Contract, networks
 
+from crypto_portfolio_tracker.rpc.cache import PersistentRPCCache, RPCCache, get_persistent_cache
+from crypto_portfolio_tracker.rpc.errors import RPCError
 from crypto_portfolio_tracker.rpc.retry import RetryConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+JSON_HEADERS = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
+
+# Keep-alive pool for raw HTTP requests to the RPC endpoint
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Read-only methods whose responses are cached per (method, params)
+CACHEABLE_METHODS = frozenset({"eth_call", "eth_getBalance"})
+
 
 class ApeRPCProvider:
     """
@@ -24,6 +47,10 @@ class ApeRPCProvider:
         Chain name (e.g., 'ethereum', 'base')
     network : str
         Network name (default: 'mainnet')
+    cache_ttl : int
+        Time-to-live in seconds for cached read responses
+    persistent_cache : PersistentRPCCache | None
+        On-disk cache for ``eth_call`` responses at concrete block numbers
 
     """
 
@@ -33,12 +60,18 @@ class ApeRPCProvider:
         network: str = "mainnet",
         retry_config: RetryConfig | None = None,
         *,
+        cache_ttl: int = 30,
+        persistent_cache: PersistentRPCCache | None = None,
         debug: bool = False,
     ) -> None:
         self.chain = chain
         self.network = network
         self._network_context = None
         self._provider = None
+        self._pinned_block: str | None = None
+        self._http_client: httpx.Client | None = None
+        self.cache = RPCCache(default_ttl=cache_ttl)
+        self.persistent_cache = persistent_cache
         self.debug = debug
         self.retry_config = retry_config or RetryConfig(
             max_retries=3,
@@ -58,6 +91,12 @@ class ApeRPCProvider:
             self._network_context.__enter__()
             self._provider = networks.provider
 
+            # Persistent client so raw HTTP requests reuse keep-alive connections
+            self._http_client = httpx.Client(
+                timeout=30.0,
+                transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS, retries=1),
+            )
+
         except Exception as e:
             error_msg = f"Failed to connect to {self.chain}:{self.network}: {e}"
             raise RuntimeError(error_msg) from e
@@ -70,12 +109,68 @@ class ApeRPCProvider:
             except Exception as e:
                 logger.debug("Error during network context cleanup: %s", e)
             self._network_context = None
+        if self._http_client:
+            self._http_client.close()
+            self._http_client = None
         self._provider = None
+        self._pinned_block = None
+        self.cache.clear()
+
+    def pin_block(self) -> int:
+        """
+        Pin the 'latest' block tag to the current chain head.
+
+        Subsequent cacheable reads made with the 'latest' tag are sent for the
+        pinned block instead, and ``eth_blockNumber`` returns it, so repeated
+        reads within one scan see one consistent state and share cache keys.
+
+        Returns
+        -------
+        int
+            Pinned block number
+
+        """
+        self._pinned_block = None
+        latest = self.make_request("eth_blockNumber", [])
+        self._pinned_block = latest if isinstance(latest, str) else hex(latest)
+        return int(self._pinned_block, 16)
+
+    @contextmanager
+    def activate(self) -> Iterator["ApeRPCProvider"]:
+        """
+        Make this provider's network the active Ape network.
+
+        Ape resolves contract calls against a single process-wide active
+        network. When several chains are connected at once, wrap contract
+        calls for one chain in this context so they hit the right network.
+        Re-entering an already connected network reuses its provider.
+
+        Yields
+        ------
+        ApeRPCProvider
+            This provider
+
+        Raises
+        ------
+        RuntimeError
+            If provider is not connected
+
+        """
+        if not self._provider:
+            error_msg = "Provider not connected. Call connect() first."
+            raise RuntimeError(error_msg)
+
+        with networks.parse_network_choice(f"{self.chain}:{self.network}"):
+            yield self
 
     def make_request(self, method: str, params: list[Any]) -> Any:
         """
         Make an RPC request with retry logic and exponential backoff.
 
+        Responses to read-only methods (``eth_call``, ``eth_getBalance``) are
+        cached for ``cache_ttl`` seconds. ``eth_call`` responses at a concrete
+        block number are also kept in the persistent cache, if configured.
+
         Parameters
         ----------
         method : str
@@ -100,11 +195,198 @@ class ApeRPCProvider:
             error_msg = "Provider not connected. Call connect() first."
             raise RuntimeError(error_msg)
 
+        if method == "eth_blockNumber" and self._pinned_block is not None:
+            return self._pinned_block
+
+        send = self._send_request
+
+        if method not in CACHEABLE_METHODS:
+            return self._request_with_retry(method, lambda: send(method, params))
+
+        # Send 'latest' reads for the pinned block so they are stable cache keys
+        if self._pinned_block is not None and params and params[-1] == "latest":
+            params = [*params[:-1], self._pinned_block]
+
+        cached = self.cache.get(method, params)
+        if cached is not None:
+            return cached
+
+        persistent_cache = self.persistent_cache if method == "eth_call" else None
+        if persistent_cache:
+            cached = persistent_cache.get(f"{self.chain}:{self.network}", params)
+            if cached is not None:
+                self.cache.set(method, params, cached)
+                return cached
+
+        result = self._request_with_retry(method, lambda: send(method, params))
+        if result is not None:
+            self.cache.set(method, params, result)
+            if persistent_cache:
+                persistent_cache.set(f"{self.chain}:{self.network}", params, result)
+        return result
+
+    def _send_request(self, method: str, params: list[Any]) -> Any:
+        """
+        Send one JSON-RPC request without retry or caching.
+
+        Goes over the pooled HTTP client with orjson encoding when the
+        provider has an HTTP endpoint, and through Ape otherwise.
+
+        Parameters
+        ----------
+        method : str
+            RPC method name
+        params : list[Any]
+            Method parameters
+
+        Returns
+        -------
+        Any
+            RPC result
+
+        Raises
+        ------
+        RPCError
+            If the node returns a JSON-RPC error
+
+        """
+        uri = getattr(self._provider, "http_uri", None)
+        http_client = self._http_client
+        if not uri or not http_client:
+            return self._provider.make_request(method, params)
+
+        body = orjson.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+        response = http_client.post(uri, content=body, headers=JSON_HEADERS)
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            response.raise_for_status()
+            raise
+
+        # Some nodes pair JSON-RPC errors with a 4xx status; keep the node's message
+        if isinstance(data, dict) and "error" in data:
+            raise RPCError(method, data["error"])
+        response.raise_for_status()
+        return data.get("result")
+
+    def make_batch_request(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        """
+        Make several RPC requests in a single JSON-RPC batch round-trip.
+
+        All calls are encoded into one JSON array and sent in one HTTP POST,
+        so N independent reads (e.g., ``eth_call`` balance checks) cost one
+        network round-trip instead of N.
+
+        Parameters
+        ----------
+        calls : list[tuple[str, list[Any]]]
+            List of (method, params) tuples
+
+        Returns
+        -------
+        list[Any]
+            Results for each call in order (None if the call returned an error)
+
+        Raises
+        ------
+        RuntimeError
+            If provider is not connected
+        Exception
+            If all retry attempts fail
+
+        """
+        if not self._provider:
+            error_msg = "Provider not connected. Call connect() first."
+            raise RuntimeError(error_msg)
+
+        if not calls:
+            return []
+
+        uri = getattr(self._provider, "http_uri", None)
+        http_client = self._http_client
+        if not uri or not http_client:
+            # No HTTP endpoint to batch against, fall back to individual requests
+            return [self._make_request_or_none(method, params) for method, params in calls]
+
+        payload = [
+            {"jsonrpc": "2.0", "id": idx, "method": method, "params": params}
+            for idx, (method, params) in enumerate(calls)
+        ]
+
+        body = orjson.dumps(payload)
+
+        def send_batch() -> list[dict[str, Any]]:
+            response = http_client.post(uri, content=body, headers=JSON_HEADERS)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            if not isinstance(data, list):
+                error_msg = f"Batch request rejected: {data}"
+                raise RuntimeError(error_msg)
+            return data
+
+        responses = self._request_with_retry("batch", send_batch)
+
+        # Batch responses may be returned in any order, match them back by id
+        by_id = {item.get("id"): item for item in responses}
+        results = []
+        for idx in range(len(calls)):
+            item = by_id.get(idx)
+            if item is None or "error" in item:
+                results.append(None)
+            else:
+                results.append(item.get("result"))
+
+        return results
+
+    def _make_request_or_none(self, method: str, params: list[Any]) -> Any:
+        """
+        Make an RPC request, returning None instead of raising on failure.
+
+        Parameters
+        ----------
+        method : str
+            RPC method name
+        params : list[Any]
+            Method parameters
+
+        Returns
+        -------
+        Any
+            RPC response, or None if all retry attempts failed
+
+        """
+        try:
+            return self.make_request(method, params)
+        except Exception:
+            return None
+
+    def _request_with_retry(self, method: str, func: Callable[[], T]) -> T:
+        """
+        Run a request function with retry logic and exponential backoff.
+
+        Parameters
+        ----------
+        method : str
+            RPC method name (used for debug logging)
+        func : Callable[[], T]
+            Function performing the request
+
+        Returns
+        -------
+        T
+            Result of the request function
+
+        Raises
+        ------
+        Exception
+            If all retry attempts fail
+
+        """
         last_exception = None
 
         for attempt in range(self.retry_config.max_retries + 1):
             try:
-                return self._provider.make_request(method, params)
+                return func()
             except Exception as e:
                 last_exception = e
 
@@ -170,6 +452,154 @@ class ApeRPCProvider:
         self.disconnect()
 
 
+class MultiChainRPCProvider:
+    """
+    Routes JSON-RPC calls for several chains to their per-chain providers.
+
+    ``batch`` groups calls by endpoint URL, sends one JSON-RPC batch per
+    endpoint, and runs the endpoints concurrently. Chains that share an
+    endpoint share its batch.
+
+    Parameters
+    ----------
+    providers : dict[str, Any]
+        Connected provider for each chain name
+    max_workers : int
+        Endpoints queried concurrently (default: 8)
+
+    """
+
+    def __init__(self, providers: dict[str, Any], max_workers: int = 8) -> None:
+        self.providers = providers
+        self.max_workers = max_workers
+
+    def provider_for(self, chain: str) -> Any:
+        """
+        Get the provider serving a chain.
+
+        Parameters
+        ----------
+        chain : str
+            Chain name
+
+        Returns
+        -------
+        Any
+            Provider for the chain
+
+        Raises
+        ------
+        KeyError
+            If no provider is configured for the chain
+
+        """
+        return self.providers[chain]
+
+    def batch(self, calls: list[tuple[str, str, list[Any]]]) -> list[Any]:
+        """
+        Make calls across chains with one batch round-trip per endpoint.
+
+        Parameters
+        ----------
+        calls : list[tuple[str, str, list[Any]]]
+            List of (chain, method, params) tuples
+
+        Returns
+        -------
+        list[Any]
+            Results for each call in order (None if the call failed or its
+            chain has no provider)
+
+        """
+        # Endpoint -> (provider, indices into calls)
+        groups: dict[Any, tuple[Any, list[int]]] = {}
+        for idx, (chain, _, _) in enumerate(calls):
+            provider = self.providers.get(chain)
+            if provider is None:
+                continue
+            endpoint = getattr(getattr(provider, "_provider", None), "http_uri", None) or id(provider)
+            groups.setdefault(endpoint, (provider, []))[1].append(idx)
+
+        def send(group: tuple[Any, list[int]]) -> tuple[list[int], list[Any]]:
+            provider, indices = group
+            try:
+                return indices, provider.make_batch_request([calls[i][1:] for i in indices])
+            except Exception as e:
+                logger.debug("Batch to %s failed: %s", getattr(provider, "chain", provider), e)
+                return indices, [None] * len(indices)
+
+        results: list[Any] = [None] * len(calls)
+        if not groups:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(len(groups), self.max_workers)) as executor:
+            for indices, group_results in executor.map(send, groups.values()):
+                for idx, result in zip(indices, group_results, strict=True):
+                    results[idx] = result
+
+        return results
+
+
+# Process-wide pool of connected providers, keyed by "chain:network"
+_PROVIDER_POOL: dict[str, ApeRPCProvider] = {}
+_PROVIDER_POOL_LOCK = threading.Lock()
+
+
+def get_provider(chain: str, network: str = "mainnet") -> ApeRPCProvider:
+    """
+    Get a connected provider for a chain from the shared pool.
+
+    The first call for a chain creates and connects a provider; later calls
+    reuse it, so repeated scans of the same chain skip Ape's connection setup
+    and keep its response cache warm. Pooled providers share the persistent
+    ``eth_call`` cache and are disconnected at interpreter exit.
+
+    Parameters
+    ----------
+    chain : str
+        Chain name (e.g., 'ethereum', 'base')
+    network : str
+        Network name (default: 'mainnet')
+
+    Returns
+    -------
+    ApeRPCProvider
+        Connected RPC provider
+
+    Raises
+    ------
+    RuntimeError
+        If connecting to the network fails
+
+    """
+    key = f"{chain}:{network}"
+
+    with _PROVIDER_POOL_LOCK:
+        provider = _PROVIDER_POOL.get(key)
+        if provider is not None and provider._provider is not None:
+            return provider
+
+        provider = ApeRPCProvider(chain=chain, network=network, persistent_cache=get_persistent_cache())
+        provider.connect()
+        _PROVIDER_POOL[key] = provider
+        return provider
+
+
+def disconnect_all_providers() -> None:
+    """Disconnect and drop every pooled provider."""
+    with _PROVIDER_POOL_LOCK:
+        # Disconnect in reverse connection order to unwind Ape's network contexts
+        for provider in reversed(list(_PROVIDER_POOL.values())):
+            try:
+                provider.disconnect()
+            except Exception as e:
+                logger.debug("Error disconnecting %s provider: %s", provider.chain, e)
+        _PROVIDER_POOL.clear()
+
+
+atexit.register(disconnect_all_providers)
+
+
 # Backwards compatibility - MultiRPCProvider is an alias for ApeRPCProvider
 # The old multi-RPC fallback logic is now handled by Ape's provider system
 MultiRPCProvider = ApeRPCProvider
@@ -1,11 +1,14 @@
 """Diagnostic tests for AAVE v3 position fetching across all supported chains."""
 
 import pytest
+from eth_abi import decode, encode
 
+from crypto_portfolio_tracker.core.models import PositionType
 from crypto_portfolio_tracker.data import (
     get_all_supported_chains,
     get_protocol_addresses,
 )
+from crypto_portfolio_tracker.rpc import MULTICALL3_ADDRESS
 
 TARGET_ADDRESS = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"  # vitalik.eth
 
@@ -61,3 +64,138 @@ class TestAaveChainSupport:
             addresses = handler.get_contract_addresses(chain)
             assert len(addresses) > 0, f"No contract addresses for {chain}"
             assert "pool" in addresses, f"pool missing in addresses for {chain}"
+
+
+USDC = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+ATOKEN = "0x" + "a1" * 20
+STABLE_DEBT = "0x" + "b2" * 20
+VARIABLE_DEBT = "0x" + "c3" * 20
+
+
+class _FakeAaveProvider:
+    """RPC provider stub answering Pool and PoolDataProvider reads sent as eth_call / aggregate3."""
+
+    def __init__(self, accounts, user_reserves=None):
+        self.accounts = accounts
+        self.user_reserves = user_reserves
+        self.requests = []
+        self.account_calls = []
+
+    def make_request(self, method, params):
+        assert method == "eth_call"
+        self.requests.append(params[0])
+        call = params[0]
+        data = bytes.fromhex(call["data"][2:])
+
+        if call["to"] != MULTICALL3_ADDRESS:
+            assert data.hex() == "b316ff89"  # getAllReservesTokens()
+            if self.user_reserves is None:
+                raise RuntimeError("execution reverted")
+            return "0x" + encode(["(string,address)[]"], [[("USDC", USDC)]]).hex()
+
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = [(True, self._answer(calldata)) for _, _, calldata in calls]
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+    def _answer(self, calldata):
+        selector, args = calldata[:4].hex(), calldata[4:]
+        if selector == "bf92857c":  # getUserAccountData(address)
+            (user,) = decode(["address"], args)
+            self.account_calls.append(user)
+            return encode(["uint256"] * 6, self.accounts[user])
+        if selector == "3e150141":  # getReserveConfigurationData(address)
+            return encode(["uint256"] * 5 + ["bool"] * 5, (6, 7500, 8000, 10500, 1000, True, True, False, True, False))
+        if selector == "d2493b6c":  # getReserveTokensAddresses(address)
+            return encode(["address"] * 3, (ATOKEN, STABLE_DEBT, VARIABLE_DEBT))
+        assert selector == "28dd2d01"  # getUserReserveData(address,address)
+        _, user = decode(["address", "address"], args)
+        return encode(["uint256"] * 7 + ["uint40", "bool"], self.user_reserves[user])
+
+
+USER_A = "0x" + "aa" * 20
+USER_B = "0x" + "bb" * 20
+
+
+class TestAaveMultiUser:
+    """Account data for several users is fetched in one multicall."""
+
+    def test_get_positions_multi_maps_each_user(self):
+        from crypto_portfolio_tracker.protocols.aave import AaveHandler
+
+        provider = _FakeAaveProvider(
+            {
+                USER_A: (150_000_000_000, 50_000_000_000, 0, 8000, 7500, 2 * 10**18),
+                USER_B: (0, 0, 0, 0, 0, 0),
+            }
+        )
+        handler = AaveHandler(rpc_provider=provider)
+
+        positions = handler.get_positions_multi([USER_A, USER_B], "ethereum")
+
+        assert provider.account_calls == [USER_A, USER_B]
+        assert positions[USER_B] == []
+        (summary,) = positions[USER_A]
+        assert summary.usd_value == 1500
+        assert summary.health_factor == 2
+        assert summary.metadata["total_debt_usd"] == 500
+
+    def test_get_positions_wraps_multi(self):
+        from crypto_portfolio_tracker.protocols.aave import USD_BASE_TOKEN, AaveHandler
+
+        handler = AaveHandler(rpc_provider=_FakeAaveProvider({USER_A: (100_000_000, 0, 0, 0, 0, 0)}))
+
+        (summary,) = handler.get_positions(USER_A, "ethereum")
+        assert summary.token is USD_BASE_TOKEN
+        assert summary.usd_value == 1
+        assert summary.health_factor is None
+
+    def test_get_positions_multi_without_provider(self):
+        from crypto_portfolio_tracker.protocols.aave import AaveHandler
+
+        assert AaveHandler().get_positions_multi([USER_A], "ethereum") == {USER_A: []}
+
+
+class TestAaveReservePositions:
+    """Per-reserve supply and borrow positions come from one multicall of reads."""
+
+    def test_reserve_reads_take_two_round_trips(self):
+        from crypto_portfolio_tracker.protocols.aave import AaveHandler
+
+        provider = _FakeAaveProvider(
+            {USER_A: (300_000_000_000, 0, 0, 8000, 7500, 0), USER_B: (0, 0, 0, 0, 0, 0)},
+            {USER_A: (3_000_000_000, 0, 0, 0, 0, 0, 0, 0, True), USER_B: (0, 0, 0, 0, 0, 0, 0, 0, False)},
+        )
+
+        AaveHandler(rpc_provider=provider).get_positions_multi([USER_A, USER_B], "ethereum")
+
+        reserve_list, multicall = provider.requests
+        assert reserve_list["to"] == get_protocol_addresses("ethereum", "aave_v3")["pool_data_provider"]
+        assert multicall["to"] == MULTICALL3_ADDRESS
+
+    def test_reserve_balances_become_positions(self):
+        from crypto_portfolio_tracker.protocols.aave import AaveHandler
+
+        provider = _FakeAaveProvider(
+            {USER_A: (300_000_000_000, 150_000_000_000, 0, 8000, 7500, 2 * 10**18)},
+            {USER_A: (3_000_000_000, 500_000_000, 1_000_000_000, 0, 0, 0, 0, 0, True)},
+        )
+        handler = AaveHandler(rpc_provider=provider)
+
+        supply, stable_borrow, variable_borrow = handler.get_positions(USER_A, "ethereum")
+
+        assert supply.position_type == PositionType.LENDING_SUPPLY
+        assert supply.token.address == ATOKEN
+        assert supply.underlying_token.symbol == "USDC"
+        assert supply.balance == 3000
+        assert supply.metadata["is_collateral"] is True
+
+        assert stable_borrow.position_type == PositionType.LENDING_BORROW
+        assert stable_borrow.token.address == STABLE_DEBT
+        assert stable_borrow.token.symbol == "stableDebtUSDC"
+        assert stable_borrow.balance == 500
+
+        assert variable_borrow.position_type == PositionType.LENDING_BORROW
+        assert variable_borrow.token.address == VARIABLE_DEBT
+        assert variable_borrow.token.symbol == "variableDebtUSDC"
+        assert variable_borrow.balance == 1000
+        assert variable_borrow.health_factor == 2
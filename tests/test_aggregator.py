@@ -0,0 +1,257 @@
+"""Tests for position aggregation."""
+
+import gc
+import threading
+import weakref
+from dataclasses import replace
+from decimal import Decimal
+
+from crypto_portfolio_tracker.core.aggregator import PositionAggregator
+from crypto_portfolio_tracker.core.models import ChainActivity, Position, PositionType, Token
+from crypto_portfolio_tracker.core.registry import ProtocolRegistry
+
+USER = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
+
+
+class FakeScanner:
+    """Scanner stub reporting fixed chain activity."""
+
+    rpc_provider = None
+
+    def __init__(self, activities):
+        self.activities = activities
+        self.scans = 0
+
+    def scan_all_chains(self, user_address, *, force_refresh=False):
+        self.scans += 1
+        return self.activities
+
+
+class FakePricing:
+    """Pricing stub returning fixed prices."""
+
+    def __init__(self, prices=None):
+        self.prices = prices or {}
+        self.requests = []
+
+    def get_prices(self, tokens):
+        self.requests.append(tokens)
+        return {key: self.prices[key] for key in tokens if key in self.prices}
+
+
+class FakeProvider:
+    """RPC provider stub that handlers only hold a reference to."""
+
+
+def _position(chain, protocol="lido", balance="1", address="0xtoken"):
+    return Position(
+        protocol=protocol,
+        chain=chain,
+        position_type=PositionType.LIQUID_STAKING,
+        token=Token(address=address, symbol="TKN", decimals=18),
+        balance=Decimal(balance),
+    )
+
+
+def test_get_all_positions_reuses_worker_threads(monkeypatch):
+    """Test that repeated calls run on the aggregator's shared worker pool."""
+    activities = [
+        ChainActivity(chain="ethereum", has_activity=True, protocols_detected=["lido"]),
+        ChainActivity(chain="base", has_activity=True, protocols_detected=["lido"]),
+        ChainActivity(chain="arbitrum", has_activity=False),
+    ]
+    thread_names = set()
+
+    def fake_chain_positions(self, user_address, chain, protocols):
+        thread_names.add(threading.current_thread().name)
+        return [_position(chain)]
+
+    monkeypatch.setattr(PositionAggregator, "_get_chain_positions", fake_chain_positions)
+
+    aggregator = PositionAggregator(scanner=FakeScanner(activities), pricing_service=FakePricing(), chain_concurrency=2)
+    with aggregator:
+        first = aggregator.get_all_positions(USER)
+        second = aggregator.get_all_positions(USER, force_refresh=True)
+
+    assert sorted(p.chain for p in first.positions) == ["base", "ethereum"]
+    assert len(second.positions) == 2
+    assert thread_names
+    assert all(name.startswith("chain-") for name in thread_names)
+    assert len(thread_names) <= 2
+
+
+def test_chain_protocols_fetched_concurrently(monkeypatch):
+    """Test that protocol handlers on a chain overlap and keep protocol order."""
+    from crypto_portfolio_tracker.core.registry import ProtocolRegistry
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def make_handler(protocol):
+        class Handler:
+            def __init__(self, rpc_provider=None):
+                pass
+
+            def get_positions(self, user_address, chain):
+                # Both handlers must be running at once to pass the barrier
+                barrier.wait()
+                return [_position(chain, protocol=protocol)]
+
+        return Handler
+
+    handlers = {"lido": make_handler("lido"), "etherfi": make_handler("etherfi")}
+    monkeypatch.setattr(ProtocolRegistry, "get_handler", classmethod(lambda cls, name: handlers.get(name)))
+
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=FakePricing()) as aggregator:
+        positions = aggregator._get_chain_positions(USER, "ethereum", ["lido", "etherfi", "unknown"])
+
+    assert [p.protocol for p in positions] == ["lido", "etherfi"]
+
+
+def test_deferred_enrichment_prices_all_chains_once(monkeypatch):
+    """Test that positions collected unpriced are priced with one pricing call."""
+    monkeypatch.setattr(
+        PositionAggregator,
+        "_get_chain_positions",
+        lambda self, user_address, chain, protocols: [_position(chain, balance="2")],
+    )
+    pricing = FakePricing({("ethereum", "0xtoken"): Decimal("3"), ("base", "0xtoken"): Decimal("5")})
+
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=pricing) as aggregator:
+        positions = []
+        for chain in ("ethereum", "base"):
+            activity = ChainActivity(chain=chain, has_activity=True, protocols_detected=["lido"])
+            positions.extend(aggregator.get_positions_for_activity(USER, activity, enrich=False))
+
+        assert all(p.usd_value is None for p in positions)
+        positions = aggregator.enrich_positions(positions)
+
+    assert len(pricing.requests) == 1
+    assert [p.usd_value for p in positions] == [Decimal("6"), Decimal("10")]
+
+
+def test_enrichment_prefers_underlying_price():
+    """Test that vault positions use the underlying price and fall back to the share price."""
+    underlying = Token(address="0xusdc", symbol="USDC", decimals=6)
+    vault = replace(_position("base", balance="10", address="0xvault"), underlying_token=underlying)
+    vault.underlying_balance = Decimal("12")
+    unpriced_underlying = replace(vault, underlying_token=Token(address="0xother", symbol="X", decimals=18))
+
+    pricing = FakePricing({("base", "0xusdc"): Decimal("1"), ("base", "0xvault"): Decimal("2")})
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=pricing) as aggregator:
+        vault, unpriced_underlying = aggregator.enrich_positions([vault, unpriced_underlying])
+
+    assert vault.usd_value == Decimal("12")
+    assert unpriced_underlying.usd_value == Decimal("20")
+    assert set(pricing.requests[0]) == {("base", "0xvault"), ("base", "0xusdc"), ("base", "0xother")}
+
+
+def test_aget_all_positions_fans_out(monkeypatch):
+    """Test the async fan-out over chains and protocols."""
+    import asyncio
+
+    from crypto_portfolio_tracker.core.registry import ProtocolRegistry
+
+    class Handler:
+        def __init__(self, rpc_provider=None):
+            pass
+
+        def get_positions(self, user_address, chain):
+            if chain == "base":
+                raise RuntimeError("rpc down")
+            return [_position(chain, balance="2")]
+
+    monkeypatch.setattr(ProtocolRegistry, "get_handler", classmethod(lambda cls, name: Handler))
+    activities = [
+        ChainActivity(chain="ethereum", has_activity=True, protocols_detected=["lido"]),
+        ChainActivity(chain="base", has_activity=True, protocols_detected=["lido"]),
+    ]
+    pricing = FakePricing({("ethereum", "0xtoken"): Decimal("3")})
+
+    with PositionAggregator(scanner=FakeScanner(activities), pricing_service=pricing) as aggregator:
+        summary = asyncio.run(aggregator.aget_all_positions(USER))
+
+    assert [p.chain for p in summary.positions] == ["ethereum"]
+    assert summary.total_usd_value == Decimal("6")
+
+
+def test_get_all_positions_caches_summary(monkeypatch):
+    """Test that a repeated call for the same address is served from cache."""
+    monkeypatch.setattr(
+        PositionAggregator,
+        "_get_chain_positions",
+        lambda self, user_address, chain, protocols: [_position(chain)],
+    )
+    scanner = FakeScanner([ChainActivity(chain="ethereum", has_activity=True, protocols_detected=["lido"])])
+
+    with PositionAggregator(scanner=scanner, pricing_service=FakePricing()) as aggregator:
+        first = aggregator.get_all_positions(USER)
+        assert aggregator.get_all_positions(USER.lower()) is first
+        assert scanner.scans == 1
+
+        assert aggregator.get_all_positions(USER, force_refresh=True) is not first
+        assert scanner.scans == 2
+
+
+def test_single_chain_enrichment_uses_address_keys():
+    """Test that single-chain positions are priced through the address-keyed entry point."""
+
+    class SingleChainPricing(FakePricing):
+        def get_prices_single_chain(self, chain, addresses):
+            self.requests.append((chain, addresses))
+            return {"0xtoken": Decimal("4")}
+
+    pricing = SingleChainPricing()
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=pricing) as aggregator:
+        positions = aggregator.enrich_positions([_position("base", balance="2")])
+
+    assert pricing.requests == [("base", ["0xtoken"])]
+    assert positions[0].usd_value == Decimal("8")
+
+
+def test_summarize_positions_prices_and_totals():
+    """Test that pricing and summary totals come out of the same pass."""
+    positions = [
+        _position("ethereum", balance="2", address="0xa"),
+        _position("base", protocol="aave_v3", balance="3", address="0xb"),
+    ]
+    pricing = FakePricing({("ethereum", "0xa"): Decimal("10"), ("base", "0xb"): Decimal("1.5")})
+
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=pricing) as aggregator:
+        summary = aggregator.summarize_positions(USER, positions)
+
+    assert [p.usd_value for p in summary.positions] == [Decimal("20"), Decimal("4.5")]
+    assert summary.total_usd_value == Decimal("24.5")
+    assert summary.by_chain == {"ethereum": Decimal("20"), "base": Decimal("4.5")}
+    assert summary.by_protocol == {"lido": Decimal("20"), "aave_v3": Decimal("4.5")}
+
+
+def test_pool_sizes_read_from_environment(monkeypatch):
+    """Test that worker pool sizes default to the environment, then to the class defaults."""
+    monkeypatch.setenv("CRYPTO_PORTFOLIO_CHAIN_WORKERS", "3")
+    monkeypatch.setenv("CRYPTO_PORTFOLIO_PROTOCOL_WORKERS", "not-a-number")
+
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=FakePricing()) as aggregator:
+        assert aggregator._chain_executor._max_workers == 3
+        assert aggregator._protocol_executor._max_workers == PositionAggregator.MAX_PROTOCOL_WORKERS
+
+    with PositionAggregator(scanner=FakeScanner([]), pricing_service=FakePricing(), chain_concurrency=1) as aggregator:
+        assert aggregator._chain_executor._max_workers == 1
+
+
+def test_handlers_scoped_to_aggregator():
+    """Test that handler instances are shared within an aggregator and released with it."""
+    handler_class = ProtocolRegistry.get_handler("lido")
+    provider_a, provider_b = FakeProvider(), FakeProvider()
+
+    with PositionAggregator(FakeScanner([]), FakePricing(), rpc_provider=provider_a) as aggregator:
+        first = aggregator._get_handler(handler_class)
+        assert aggregator._get_handler(handler_class) is first
+        assert first.rpc_provider is provider_a
+
+    with PositionAggregator(FakeScanner([]), FakePricing(), rpc_provider=provider_b) as other:
+        assert other._get_handler(handler_class).rpc_provider is provider_b
+
+    provider_ref = weakref.ref(provider_a)
+    del aggregator, first, provider_a
+    gc.collect()
+    assert provider_ref() is None
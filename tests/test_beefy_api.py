@@ -0,0 +1,185 @@
+"""Tests for the Beefy Finance API client."""
+
+from decimal import Decimal
+
+import httpx
+from eth_abi import decode, encode
+
+from crypto_portfolio_tracker.core.models import PositionType
+from crypto_portfolio_tracker.protocols.beefy_api import BeefyAPIClient, BeefyVault
+from crypto_portfolio_tracker.rpc import MULTICALL3_ADDRESS, RPCCache
+
+USER = "0x1111111111111111111111111111111111111111"
+
+VAULTS = [
+    {
+        "id": f"vault-{i}",
+        "chain": "base",
+        "status": "active",
+        "earnContractAddress": f"0x{i + 1:040x}",
+        "tokenAddress": f"0x{i + 100:040x}",
+        "token": f"TKN{i}",
+        "tokenDecimals": 18,
+        "name": f"Vault {i}",
+    }
+    for i in range(2)
+]
+
+
+def make_client(cache=None, requested=None) -> BeefyAPIClient:
+    """Build a client answering the Beefy REST endpoints from fixtures."""
+    responses = {
+        "/vaults/base": VAULTS + [{**VAULTS[0], "id": "retired", "status": "eol"}],
+        "/vaults/ethereum": [],
+        "/prices": {"vault-0": 2, "vault-1": 3},
+        "/apy": {"vault-0": 0.1},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requested is not None:
+            requested.append(request.url.path)
+        return httpx.Response(200, json=responses[request.url.path])
+
+    client = BeefyAPIClient(cache=RPCCache() if cache is None else cache)
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+class FakeMulticallProvider:
+    """RPC provider stub answering Multicall3 aggregate3 calls from per-vault values."""
+
+    def __init__(self, balances, price_per_share=2 * 10**18):
+        self.balances = {address.lower(): balance for address, balance in balances.items()}
+        self.price_per_share = price_per_share
+        self.batches = []
+
+    def make_request(self, method, params):
+        assert method == "eth_call"
+        assert params[0]["to"] == MULTICALL3_ADDRESS
+
+        (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(params[0]["data"][10:]))
+        self.batches.append([(target.lower(), data[:4].hex()) for target, _, data in calls])
+        results = []
+        for target, _, data in calls:
+            value = self.balances[target.lower()] if data[:4].hex() == "70a08231" else self.price_per_share
+            results.append((True, encode(["uint256"], [value])))
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+
+def test_vault_reads_batched_in_two_multicalls():
+    """Test that balances are read in one multicall and share prices only for held vaults."""
+    held, empty = (vault["earnContractAddress"] for vault in VAULTS)
+    provider = FakeMulticallProvider({held: 10**18, empty: 0})
+
+    with make_client() as client:
+        positions = client.get_vault_positions(USER, "base", provider)
+
+    assert provider.batches == [
+        [(held.lower(), "70a08231"), (empty.lower(), "70a08231")],
+        [(held.lower(), "77c7b8fc")],
+    ]
+    (position,) = positions
+    assert position.position_type == PositionType.VAULT
+    assert position.token.address == held
+    assert position.underlying_balance == Decimal(2)
+    assert position.usd_value == Decimal(4)
+    assert position.apy == Decimal("0.1")
+
+
+def test_multicall_batches_split_and_keep_order(monkeypatch):
+    """Test that large vault lists are split into several multicalls without reordering results."""
+    from crypto_portfolio_tracker.protocols import beefy_api
+
+    monkeypatch.setattr(beefy_api, "MULTICALL_BATCH_SIZE", 2)
+    addresses = [f"0x{i + 1:040x}" for i in range(5)]
+    provider = FakeMulticallProvider({address: i for i, address in enumerate(addresses)})
+
+    with BeefyAPIClient() as client:
+        balances = client._multicall_balances(addresses, USER, provider)
+
+    assert balances == [0, 1, 2, 3, 4]
+    assert sorted(len(batch) for batch in provider.batches) == [1, 2, 2]
+
+
+def test_api_responses_cached_across_clients():
+    """Test that clients sharing a cache fetch each chain's vaults, prices and APYs once."""
+    cache = RPCCache()
+    requested = []
+
+    for chain in ("base", "ethereum"):
+        with make_client(cache, requested) as client:
+            client.get_vaults(chain)
+            client.get_prices()
+            client.get_apy()
+
+    assert sorted(requested) == ["/apy", "/prices", "/vaults/base", "/vaults/ethereum"]
+
+
+def test_clients_share_one_http_client():
+    """Test that clients reuse the process-wide HTTP client and leave it open on close."""
+    with BeefyAPIClient() as first:
+        pass
+    with BeefyAPIClient() as second:
+        assert second.client is first.client
+
+    assert not first.client.is_closed
+
+
+def test_get_vaults_requests_chain_route_and_keeps_active():
+    """Test that only the chain's vaults are fetched and retired ones are dropped."""
+    requested = []
+
+    with make_client(requested=requested) as client:
+        vaults = client.get_vaults("base")
+
+    assert requested == ["/vaults/base"]
+    assert [vault.id for vault in vaults] == ["vault-0", "vault-1"]
+    assert vaults[0] == BeefyVault(
+        id="vault-0",
+        address=VAULTS[0]["earnContractAddress"],
+        token_address=VAULTS[0]["tokenAddress"],
+        token="TKN0",
+        name="Vault 0",
+    )
+
+
+def test_vault_addresses_are_lowercased_at_ingest():
+    """Test that vault and token addresses are stored in one canonical lowercase form."""
+    vault = BeefyVault.from_api(
+        {"id": "v", "earnContractAddress": "0xAbCdEf0000000000000000000000000000000001", "tokenAddress": "0xABC"}
+    )
+
+    assert vault.address == "0xabcdef0000000000000000000000000000000001"
+    assert vault.token_address == "0xabc"
+
+
+def test_handler_reuses_zerion_answer_per_user_and_chain(monkeypatch):
+    """Test that BeefyHandler asks Zerion once per (user, chain) within the cache TTL."""
+    from crypto_portfolio_tracker.core.models import Position, Token
+    from crypto_portfolio_tracker.protocols import beefy
+    from crypto_portfolio_tracker.protocols.beefy import BeefyHandler
+
+    requests = []
+    position = Position(
+        protocol="beefy",
+        chain="base",
+        position_type=PositionType.VAULT,
+        token=Token(address=VAULTS[0]["earnContractAddress"], symbol="mooTKN0", decimals=18),
+        balance=Decimal(1),
+    )
+
+    class FakeZerionClient:
+        def __init__(self, api_key):
+            pass
+
+        def get_positions_as_models(self, user_address, chains):
+            requests.append((user_address, tuple(chains)))
+            return [position]
+
+    monkeypatch.setenv("ZERION_API_KEY", "test-key")
+    monkeypatch.setattr(beefy, "get_shared_client", FakeZerionClient)
+    handler = BeefyHandler()
+
+    assert handler.get_positions(USER, "base") == [position]
+    assert handler.get_positions(USER.upper().replace("0X", "0x"), "base") == [position]
+    assert requests == [(USER, ("base",))]
@@ -0,0 +1,218 @@
+"""Tests for Chainlink pricing."""
+
+from decimal import Decimal
+
+from eth_abi import decode, encode
+
+from crypto_portfolio_tracker.data.addresses import CHAINLINK_PRICE_FEEDS
+from crypto_portfolio_tracker.pricing import ChainlinkPricing
+from crypto_portfolio_tracker.rpc import MULTICALL3_ADDRESS
+
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+class FakeMulticallProvider:
+    """RPC provider stub answering Multicall3 aggregate3 calls with fixed feed answers."""
+
+    def __init__(self, answers):
+        self.answers = {feed.lower(): answer for feed, answer in answers.items()}
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        assert method == "eth_call"
+        assert params[0]["to"] == MULTICALL3_ADDRESS
+
+        (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(params[0]["data"][10:]))
+        results = []
+        for target, _, _ in calls:
+            answer = self.answers.get(target.lower())
+            if answer is None:
+                results.append((False, b""))
+            else:
+                results.append((True, encode(["uint80", "int256", "uint256", "uint256", "uint80"], [1, answer, 0, 0, 1])))
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+
+def test_chainlink_prices_single_multicall():
+    """Test that all feeds on a chain are read with one aggregate3 call."""
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    provider = FakeMulticallProvider({feeds[USDC]: 100_000_000, feeds[WETH]: 250_000_000_000})
+    pricing = ChainlinkPricing(rpc_provider=provider)
+
+    prices = pricing.get_prices([("ethereum", USDC), ("ethereum", WETH)])
+
+    assert len(provider.requests) == 1
+    assert prices == {("ethereum", USDC): Decimal("1"), ("ethereum", WETH): Decimal("2500")}
+
+
+def test_chainlink_reverted_feed_prices_zero():
+    """Test that a reverted feed read yields a zero price."""
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    provider = FakeMulticallProvider({feeds[USDC]: 100_000_000})
+    pricing = ChainlinkPricing(rpc_provider=provider)
+
+    prices = pricing.get_prices([("ethereum", USDC), ("ethereum", WETH)])
+
+    assert prices[("ethereum", USDC)] == Decimal("1")
+    assert prices[("ethereum", WETH)] == Decimal("0")
+
+
+def test_chainlink_chains_fetched_concurrently():
+    """Test that each chain's multicall goes to its own provider in parallel."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierProvider(FakeMulticallProvider):
+        def make_request(self, method, params):
+            # Both chains must be in flight at once to pass the barrier
+            barrier.wait()
+            return super().make_request(method, params)
+
+    base_usdc = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+    eth_provider = BarrierProvider({CHAINLINK_PRICE_FEEDS["ethereum"][USDC]: 100_000_000})
+    base_provider = BarrierProvider({CHAINLINK_PRICE_FEEDS["base"][base_usdc]: 100_000_000})
+    pricing = ChainlinkPricing(rpc_provider=eth_provider, rpc_providers={"base": base_provider})
+
+    prices = pricing.get_prices([("ethereum", USDC), ("base", base_usdc)])
+
+    assert prices == {("ethereum", USDC): Decimal("1"), ("base", base_usdc): Decimal("1")}
+    assert len(eth_provider.requests) == len(base_provider.requests) == 1
+
+
+def test_chainlink_and_fallback_fetched_concurrently():
+    """Test that the fallback request overlaps the Chainlink multicall."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    unknown = "0x0000000000000000000000000000000000000001"
+
+    class BarrierProvider(FakeMulticallProvider):
+        def make_request(self, method, params):
+            barrier.wait()
+            return super().make_request(method, params)
+
+    class BarrierFallback:
+        def get_prices(self, tokens):
+            barrier.wait()
+            return dict.fromkeys(tokens, Decimal("3"))
+
+    provider = BarrierProvider({CHAINLINK_PRICE_FEEDS["ethereum"][USDC]: 100_000_000})
+    pricing = ChainlinkPricing(rpc_provider=provider, fallback_pricing=BarrierFallback())
+
+    prices = pricing.get_prices([("ethereum", USDC), ("ethereum", unknown)])
+
+    assert prices == {("ethereum", USDC): Decimal("1"), ("ethereum", unknown): Decimal("3")}
+
+
+def test_chainlink_feed_lookup_ignores_address_case():
+    """Test that lowercase token addresses still resolve to their Chainlink feed."""
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    pricing = ChainlinkPricing(rpc_provider=FakeMulticallProvider({feeds[USDC]: 100_000_000}))
+
+    assert pricing._get_feed_address("Ethereum", USDC.lower()) == feeds[USDC]
+    assert pricing.get_prices([("ethereum", USDC.lower())]) == {("ethereum", USDC.lower()): Decimal("1")}
+
+
+def test_chainlink_repeated_tokens_read_once():
+    """Test that a token listed several times is read from its feed once."""
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    provider = FakeMulticallProvider({feeds[USDC]: 100_000_000})
+    pricing = ChainlinkPricing(rpc_provider=provider)
+
+    prices = pricing.get_prices([("ethereum", USDC)] * 3)
+
+    (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(provider.requests[0][1][0]["data"][10:]))
+    assert len(calls) == 1
+    assert prices == {("ethereum", USDC): Decimal("1")}
+
+
+def test_chainlink_prices_reused_from_persistent_cache(tmp_path):
+    """Test that feed prices written by one instance skip the RPC in the next."""
+    from crypto_portfolio_tracker.rpc import PersistentRPCCache
+
+    cache = PersistentRPCCache(tmp_path / "cache.sqlite")
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+
+    first = FakeMulticallProvider({feeds[USDC]: 100_000_000})
+    ChainlinkPricing(rpc_provider=first, price_cache=cache).get_prices([("ethereum", USDC)])
+
+    second = FakeMulticallProvider({})
+    prices = ChainlinkPricing(rpc_provider=second, price_cache=cache).get_prices([("ethereum", USDC)])
+
+    assert prices == {("ethereum", USDC): Decimal("1")}
+    assert second.requests == []
+    assert ChainlinkPricing(rpc_provider=second, price_cache=cache, price_ttl=-1).get_price("ethereum", USDC) == 0
+    cache.close()
+
+
+def test_chainlink_single_price_reads_feed_directly():
+    """Test that get_price calls the feed itself rather than going through Multicall3."""
+    feed = CHAINLINK_PRICE_FEEDS["ethereum"][USDC]
+
+    class FeedProvider:
+        def __init__(self):
+            self.requests = []
+
+        def make_request(self, method, params):
+            self.requests.append(params)
+            return "0x" + encode(["uint80", "int256", "uint256", "uint256", "uint80"], [1, 100_000_000, 0, 0, 1]).hex()
+
+    provider = FeedProvider()
+    pricing = ChainlinkPricing(rpc_provider=provider)
+
+    assert pricing.get_price("ethereum", USDC) == Decimal("1")
+    assert [params[0]["to"] for params in provider.requests] == [feed]
+
+
+def test_chainlink_fails_over_to_backup_provider():
+    """Test that a failed feed read is retried on the chain's backup provider."""
+
+    class DownProvider:
+        def make_request(self, method, params):
+            raise RuntimeError("endpoint down")
+
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    backup = FakeMulticallProvider({feeds[USDC]: 100_000_000})
+    pricing = ChainlinkPricing(rpc_provider=DownProvider(), backup_rpc_providers={"ethereum": [backup]})
+
+    assert pricing.get_prices([("ethereum", USDC)]) == {("ethereum", USDC): Decimal("1")}
+    assert len(backup.requests) == 1
+
+    # Without a working endpoint the feed is left to fallback pricing
+    assert ChainlinkPricing(rpc_provider=DownProvider()).get_prices([("ethereum", USDC)]) == {
+        ("ethereum", USDC): Decimal("0")
+    }
+
+
+def test_chainlink_concurrent_single_prices_coalesced():
+    """Test that concurrent get_price calls share one multicall when coalescing is on."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    provider = FakeMulticallProvider({feeds[USDC]: 100_000_000, feeds[WETH]: 250_000_000_000})
+    pricing = ChainlinkPricing(rpc_provider=provider, coalesce_ms=200)
+
+    with pricing, ThreadPoolExecutor(max_workers=2) as executor:
+        prices = list(executor.map(pricing.get_price, ["ethereum", "ethereum"], [USDC, WETH]))
+
+    assert prices == [Decimal("1"), Decimal("2500")]
+    assert len(provider.requests) == 1
+
+
+def test_coalescing_client_splits_at_max_batch():
+    """Test that queued calls beyond max_batch go out in a second multicall."""
+    from crypto_portfolio_tracker.rpc import CoalescingRPCClient
+
+    feeds = CHAINLINK_PRICE_FEEDS["ethereum"]
+    provider = FakeMulticallProvider({feeds[USDC]: 100_000_000})
+    client = CoalescingRPCClient(provider, max_batch=2, stall_ms=200)
+
+    futures = [client.submit(feeds[USDC], bytes.fromhex("feaf968c")) for _ in range(3)]
+    results = [future.result(timeout=5) for future in futures]
+    client.close()
+
+    assert all(result is not None for result in results)
+    assert len(provider.requests) == 2
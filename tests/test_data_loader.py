@@ -6,8 +6,12 @@ from crypto_portfolio_tracker.data import (
     get_all_supported_chains,
     get_chain_config,
     get_chain_id,
+    get_event_signatures,
+    get_protocol_address_set,
     get_protocol_addresses,
     get_rpc_endpoints,
+    load_contracts,
+    reload_contracts,
 )
 
 
@@ -89,6 +93,15 @@ def test_get_protocol_addresses():
     assert empty == {}
 
 
+def test_get_protocol_address_set():
+    """Test that protocol addresses are lowercased into a memoized set."""
+    addresses = get_protocol_address_set("ethereum", "aave_v3")
+
+    assert addresses == {address.lower() for address in get_protocol_addresses("ethereum", "aave_v3").values()}
+    assert get_protocol_address_set("ethereum", "aave_v3") is addresses
+    assert get_protocol_address_set("ethereum", "nonexistent") == frozenset()
+
+
 def test_chain_config_structure():
     """Test that chain config has required structure."""
     for chain in get_all_supported_chains():
@@ -106,3 +119,41 @@ def test_chain_config_structure():
         
         # At least one RPC endpoint
         assert len(config["rpc_endpoints"]) > 0
+
+
+def test_lookups_are_memoized():
+    """Test that repeated lookups return the cached objects."""
+    assert get_all_supported_chains() is get_all_supported_chains()
+    assert get_protocol_addresses("ethereum", "lido") is get_protocol_addresses("ethereum", "lido")
+
+
+def test_reload_contracts_reparses_yaml():
+    """Test that contracts.yaml is parsed once until explicitly reloaded."""
+    first = load_contracts()
+    assert load_contracts() is first
+
+    reload_contracts()
+
+    assert load_contracts() is not first
+    assert load_contracts() == first
+
+
+def test_event_signatures_are_interned():
+    """Test that event signature hashes are lowercased and interned at load."""
+    import sys
+
+    signatures = get_event_signatures("lido")
+
+    assert signatures["transfer"] == signatures["transfer"].lower()
+    assert sys.intern(signatures["transfer"].lower()) is signatures["transfer"]
+
+
+def test_package_exports_resolve_lazily():
+    """Test that package exports resolve on access and unknown names still raise."""
+    import crypto_portfolio_tracker.data as data
+
+    for name in data.__all__:
+        assert getattr(data, name) is not None
+
+    with pytest.raises(AttributeError):
+        data.not_a_real_export  # noqa: B018
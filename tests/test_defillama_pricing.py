@@ -0,0 +1,72 @@
+"""Tests for DeFiLlama pricing."""
+
+from decimal import Decimal
+
+import httpx
+
+from crypto_portfolio_tracker.pricing import DeFiLlamaPricing
+
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def test_prices_are_served_from_cache_until_ttl():
+    """Test that repeat lookups only request coins missing from the TTL cache."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        coins = request.url.path.rsplit("/", 1)[-1].split(",")
+        requested.append(coins)
+        return httpx.Response(200, json={"coins": {coin: {"price": 2.5} for coin in coins}})
+
+    pricing = DeFiLlamaPricing()
+    pricing.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert pricing.get_prices([("ethereum", USDC)]) == {("ethereum", USDC): Decimal("2.5")}
+    prices = pricing.get_prices([("ethereum", USDC), ("ethereum", WETH)])
+
+    assert prices == {("ethereum", USDC): Decimal("2.5"), ("ethereum", WETH): Decimal("2.5")}
+    assert requested == [[f"ethereum:{USDC}"], [f"ethereum:{WETH}"]]
+
+
+def test_large_batches_are_split_into_chunks():
+    """Test that coin ids are sent at most chunk_size per request."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        coins = request.url.path.rsplit("/", 1)[-1].split(",")
+        requested.append(len(coins))
+        return httpx.Response(200, json={"coins": {coin: {"price": 1} for coin in coins}})
+
+    pricing = DeFiLlamaPricing(chunk_size=2)
+    pricing.client = httpx.Client(transport=httpx.MockTransport(handler))
+    tokens = [("ethereum", f"0x{i:040x}") for i in range(5)]
+
+    prices = pricing.get_prices(tokens)
+
+    assert sorted(requested) == [1, 2, 2]
+    assert all(price == Decimal("1") for price in prices.values())
+
+
+def test_async_prices_fetch_chunks_and_share_cache():
+    """Test that async lookups request chunks concurrently and fill the shared cache."""
+    import asyncio
+
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        coins = request.url.path.rsplit("/", 1)[-1].split(",")
+        requested.append(len(coins))
+        return httpx.Response(200, json={"coins": {coin: {"price": 4} for coin in coins}})
+
+    pricing = DeFiLlamaPricing(chunk_size=2)
+    pricing._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    tokens = [("ethereum", f"0x{i:040x}") for i in range(3)]
+
+    prices = asyncio.run(pricing.get_prices_async(tokens))
+
+    assert sorted(requested) == [1, 2]
+    assert prices == dict.fromkeys(tokens, Decimal("4"))
+    # The sync path is served from the cache the async one filled
+    assert pricing.get_prices(tokens) == prices
+    assert len(requested) == 2
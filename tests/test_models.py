@@ -1,5 +1,6 @@
 """Tests for Pydantic data models."""
 
+from dataclasses import replace
 from decimal import Decimal
 
 import pytest
@@ -126,3 +127,89 @@ def test_position_type_enum():
     assert PositionType.LIQUID_STAKING.value == "liquid_staking"
     assert PositionType.VAULT.value == "vault"
     assert PositionType.RESTAKING.value == "restaking"
+
+
+def test_portfolio_summary_finalize():
+    """Test single-pass aggregation of totals and breakdowns."""
+    token = Token(address="0x...", symbol="stETH", decimals=18)
+    reward_token = Token(address="0x...", symbol="AAVE", decimals=18)
+
+    positions = [
+        Position(
+            protocol="lido",
+            chain="ethereum",
+            position_type=PositionType.LIQUID_STAKING,
+            token=token,
+            balance=Decimal("10"),
+            usd_value=Decimal("25000"),
+        ),
+        Position(
+            protocol="aave_v3",
+            chain="base",
+            position_type=PositionType.LENDING_SUPPLY,
+            token=token,
+            balance=Decimal("1"),
+            usd_value=Decimal("100.50"),
+            claimable_rewards=[Reward(token=reward_token, amount=Decimal("1"), usd_value=Decimal("5"))],
+        ),
+        Position(
+            protocol="aave_v3",
+            chain="ethereum",
+            position_type=PositionType.LENDING_SUPPLY,
+            token=token,
+            balance=Decimal("1"),
+        ),
+    ]
+
+    summary = PortfolioSummary(address="0xUser...", positions=positions).finalize()
+
+    assert summary.total_usd_value == Decimal("25100.50")
+    assert summary.by_chain == {"ethereum": Decimal("25000"), "base": Decimal("100.50")}
+    assert summary.by_protocol == {"lido": Decimal("25000"), "aave_v3": Decimal("100.50")}
+    assert summary.total_claimable_rewards_usd == Decimal("5")
+
+
+def test_portfolio_summary_keeps_sub_cent_precision():
+    """Test that totals are accumulated below cent resolution."""
+    token = Token(address="0x...", symbol="USDC", decimals=6)
+    position = Position(
+        protocol="aave_v3",
+        chain="ethereum",
+        position_type=PositionType.LENDING_SUPPLY,
+        token=token,
+        balance=Decimal("1"),
+        usd_value=Decimal("0.004"),
+    )
+
+    summary = PortfolioSummary(address="0xUser...", positions=[position, replace(position)]).finalize()
+
+    assert summary.total_usd_value == Decimal("0.008")
+
+
+def test_portfolio_summary_subtracts_borrows():
+    """Test that borrow positions count as debt against the totals."""
+    token = Token(address="0x...", symbol="USDC", decimals=6)
+    supply = Position(
+        protocol="aave_v3",
+        chain="ethereum",
+        position_type=PositionType.LENDING_SUPPLY,
+        token=token,
+        balance=Decimal("3000"),
+        usd_value=Decimal("3000"),
+    )
+    borrow = replace(supply, position_type=PositionType.LENDING_BORROW, balance=Decimal("1000"), usd_value=Decimal("1000"))
+
+    summary = PortfolioSummary(address="0xUser...", positions=[supply, borrow]).finalize()
+
+    assert summary.total_usd_value == Decimal("2000")
+    assert summary.by_protocol == {"aave_v3": Decimal("2000")}
+
+
+def test_chain_activity_is_frozen():
+    """Test that ChainActivity is an immutable slotted record."""
+    activity = ChainActivity(chain="base", has_activity=False)
+
+    assert activity.protocols_detected == []
+    assert not hasattr(activity, "__dict__")
+    with pytest.raises(AttributeError):
+        activity.has_activity = True
@@ -84,3 +84,79 @@ def test_discovery_events():
     assert "aave_v3" in events
     assert isinstance(events["lido"], list)
     assert len(events["lido"]) > 0
+
+
+def test_handlers_load_lazily_from_manifest():
+    """Test that handlers are imported on lookup, even after the registry is cleared."""
+    ProtocolRegistry.clear()
+
+    handler_class = ProtocolRegistry.get_handler("aave_v3")
+    assert handler_class is not None
+    assert ProtocolRegistry._handlers.keys() == {"aave_v3"}
+
+    assert len(ProtocolRegistry.list_protocols()) == 5
+    assert len(ProtocolRegistry.get_handlers_for_chain("base")) == 3
+
+
+def test_get_instance_reuses_provider_less_handler():
+    """Test that contract-matching handler instances are cached per class."""
+    handler_class = ProtocolRegistry.get_handler("lido")
+
+    first = ProtocolRegistry.get_instance(handler_class)
+
+    assert ProtocolRegistry.get_instance(handler_class) is first
+    assert first.rpc_provider is None
+
+
+def test_discovery_events_cached_per_chain():
+    """Test that discovery events are built once per chain and rebuilt after clear."""
+    events = ProtocolRegistry.get_discovery_events("ethereum")
+    assert ProtocolRegistry.get_discovery_events("ethereum") is events
+
+    ProtocolRegistry.clear()
+    rebuilt = ProtocolRegistry.get_discovery_events("ethereum")
+    assert rebuilt is not events
+    assert rebuilt.keys() == events.keys()
+
+
+def test_discovery_probes_use_declared_topic_positions():
+    """Test that declared user topic positions give one probe per event."""
+    events = ProtocolRegistry.get_discovery_events("ethereum")
+    probes = ProtocolRegistry.get_discovery_probes("ethereum")
+
+    assert ProtocolRegistry.get_discovery_probes("ethereum") is probes
+    assert probes["lido"] == [(events["lido"][0], 1, ("0xae7ab96520de3a18e5e111b5eaab095312d7fe84",))]
+    assert len(probes["aave_v3"]) == len(events["aave_v3"])
+
+
+def test_discovery_probes_resolve_contract_addresses_per_chain():
+    """Test that declared discovery contracts resolve to that chain's addresses."""
+    probes = ProtocolRegistry.get_discovery_probes("base")
+
+    assert {addresses for _, _, addresses in probes["aave_v3"]} == {("0xa238dd80c259a72e81d7e4664a9801593f98d1c5",)}
+    assert all(addresses == () for _, _, addresses in probes["morpho"])
+
+
+def test_discovery_probes_default_to_every_topic_position():
+    """Test that events without a declared position are probed at positions 1-3."""
+
+    class UndeclaredHandler:
+        name = "undeclared"
+        supported_chains = ["ethereum"]
+        discovery_events = ["0xaa"]
+
+    ProtocolRegistry.register(UndeclaredHandler)
+    try:
+        probes = ProtocolRegistry.get_discovery_probes("ethereum")
+        assert probes["undeclared"] == [("0xaa", 1, ()), ("0xaa", 2, ()), ("0xaa", 3, ())]
+    finally:
+        ProtocolRegistry.clear()
+
+
+def test_find_handler_for_contract_ignores_address_case():
+    """Test that contract matching is case-insensitive."""
+    lido_steth = "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84"
+
+    assert ProtocolRegistry.find_handler_for_contract(lido_steth.lower(), "ethereum").name == "lido"
+    assert ProtocolRegistry.find_handler_for_contract(lido_steth.upper().replace("0X", "0x"), "ethereum").name == "lido"
+    assert ProtocolRegistry.find_handler_for_contract("0x" + "0" * 40, "ethereum") is None
@@ -0,0 +1,275 @@
+"""Tests for RPC provider batching."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+
+from crypto_portfolio_tracker.rpc import ApeRPCProvider, MultiChainRPCProvider, PersistentRPCCache
+from crypto_portfolio_tracker.rpc import cache as cache_module
+
+
+class FakeApeProvider:
+    """Minimal stand-in for a connected Ape provider."""
+
+    http_uri = "https://rpc.example"
+
+    def make_request(self, method, params):
+        return f"{method}-result"
+
+
+def _connected_provider(http_client=None):
+    provider = ApeRPCProvider(chain="ethereum")
+    provider._provider = FakeApeProvider()
+    provider._http_client = http_client
+    return provider
+
+
+def test_make_batch_request_single_round_trip():
+    """Test that all calls are sent in one POST and matched back by id."""
+    posts = []
+
+    def fake_post(url, content, headers):
+        posts.append(orjson.loads(content))
+        # Respond out of order, with an error for the second call
+        body = [
+            {"jsonrpc": "2.0", "id": 2, "result": "0x3"},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "execution reverted"}},
+        ]
+        return httpx.Response(200, json=body, request=httpx.Request("POST", url))
+
+    provider = _connected_provider(http_client=SimpleNamespace(post=fake_post))
+    results = provider.make_batch_request(
+        [
+            ("eth_call", [{"to": "0x1", "data": "0x"}, "latest"]),
+            ("eth_call", [{"to": "0x2", "data": "0x"}, "latest"]),
+            ("eth_blockNumber", []),
+        ]
+    )
+
+    assert len(posts) == 1
+    assert [item["id"] for item in posts[0]] == [0, 1, 2]
+    assert results == ["0x1", None, "0x3"]
+
+
+def test_make_batch_request_empty():
+    """Test that an empty batch makes no request."""
+    provider = _connected_provider()
+    assert provider.make_batch_request([]) == []
+
+
+def test_make_batch_request_requires_connection():
+    """Test that batching without a connection raises."""
+    provider = ApeRPCProvider(chain="ethereum")
+    with pytest.raises(RuntimeError):
+        provider.make_batch_request([("eth_blockNumber", [])])
+
+
+class CountingApeProvider(FakeApeProvider):
+    """Ape provider stand-in that records every request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        if method == "eth_blockNumber":
+            return "0x10"
+        return "0x01"
+
+
+def test_eth_call_responses_are_cached():
+    """Test that repeated eth_calls hit the cache."""
+    provider = ApeRPCProvider(chain="ethereum")
+    provider._provider = ape_provider = CountingApeProvider()
+
+    params = [{"to": "0xpool", "data": "0xbf92857c"}, "latest"]
+    assert provider.make_request("eth_call", params) == "0x01"
+    assert provider.make_request("eth_call", params) == "0x01"
+
+    assert len(ape_provider.requests) == 1
+
+
+def test_pin_block_rewrites_latest_tag():
+    """Test that pinned reads use the pinned block number."""
+    provider = ApeRPCProvider(chain="ethereum")
+    provider._provider = ape_provider = CountingApeProvider()
+
+    assert provider.pin_block() == 16
+    assert provider.make_request("eth_blockNumber", []) == "0x10"
+
+    provider.make_request("eth_getBalance", ["0xuser", "latest"])
+    assert ape_provider.requests[-1] == ("eth_getBalance", ["0xuser", "0x10"])
+    # eth_blockNumber is only sent once, when pinning
+    assert [method for method, _ in ape_provider.requests].count("eth_blockNumber") == 1
+
+
+def test_get_provider_reuses_pooled_instance(monkeypatch):
+    """Test that the provider pool connects once per chain."""
+    from crypto_portfolio_tracker.rpc import provider as provider_module
+
+    connects = []
+
+    def fake_connect(self):
+        connects.append(self.chain)
+        self._provider = FakeApeProvider()
+
+    monkeypatch.setattr(ApeRPCProvider, "connect", fake_connect)
+    monkeypatch.setattr(ApeRPCProvider, "disconnect", lambda self: None)
+    monkeypatch.setattr(provider_module, "_PROVIDER_POOL", {})
+    monkeypatch.setattr(provider_module, "get_persistent_cache", lambda: None)
+
+    first = provider_module.get_provider("base")
+    second = provider_module.get_provider("base")
+
+    assert first is second
+    assert connects == ["base"]
+
+
+def test_disconnect_closes_http_client():
+    """Test that disconnecting closes the persistent HTTP client."""
+    provider = _connected_provider(http_client=httpx.Client())
+    client = provider._http_client
+
+    provider.disconnect()
+
+    assert client.is_closed
+    assert provider._http_client is None
+
+
+def test_persistent_cache_survives_provider(tmp_path):
+    """Test that eth_calls at a pinned block are served from the on-disk cache."""
+    db_path = tmp_path / "cache.sqlite"
+    params = [{"to": "0xPool", "data": "0xbf92857c"}, "latest"]
+
+    first = ApeRPCProvider(chain="ethereum", persistent_cache=PersistentRPCCache(db_path))
+    first._provider = CountingApeProvider()
+    first.pin_block()
+    assert first.make_request("eth_call", params) == "0x01"
+    # Buffered responses are written when the cache closes at exit
+    first.persistent_cache.close()
+
+    # A fresh provider (e.g. the next CLI run) at the same block skips the RPC
+    second = ApeRPCProvider(chain="ethereum", persistent_cache=PersistentRPCCache(db_path))
+    second._provider = ape_provider = CountingApeProvider()
+    second.pin_block()
+    assert second.make_request("eth_call", params) == "0x01"
+    assert [method for method, _ in ape_provider.requests] == ["eth_blockNumber"]
+
+
+def test_persistent_cache_errors_fall_back_to_network(tmp_path):
+    """Test that a failing cache database does not fail the call it backs."""
+    cache = PersistentRPCCache(tmp_path / "cache.sqlite")
+    cache.close()
+
+    provider = ApeRPCProvider(chain="ethereum", persistent_cache=cache)
+    provider._provider = ape_provider = CountingApeProvider()
+    provider.pin_block()
+
+    assert provider.make_request("eth_call", [{"to": "0xpool", "data": "0x"}, "latest"]) == "0x01"
+    assert [method for method, _ in ape_provider.requests] == ["eth_blockNumber", "eth_call"]
+    cache.set_activity("ethereum", "0xuser", "lido", True, 1)
+    assert cache.get_activity("ethereum", "0xuser", "lido") is None
+    cache.set_prices("defillama", {("ethereum", "0xtoken"): Decimal(1)})
+    assert cache.get_prices("defillama", [("ethereum", "0xtoken")], 60) == {}
+
+
+def test_persistent_cache_prunes_old_calls_on_open(tmp_path, monkeypatch):
+    """Test that eth_call entries older than the max age are dropped when the cache opens."""
+    db_path = tmp_path / "cache.sqlite"
+    old, fresh = ([{"to": "0xpool", "data": data}, "0x10"] for data in ("0x01", "0x02"))
+
+    cache = PersistentRPCCache(db_path)
+    monkeypatch.setattr(cache_module.time, "time", lambda: 0.0)
+    cache.set("ethereum:mainnet", old, "0x01")
+    monkeypatch.undo()
+    cache.set("ethereum:mainnet", fresh, "0x02")
+    cache.close()
+
+    reopened = PersistentRPCCache(db_path)
+    assert reopened.get("ethereum:mainnet", old) is None
+    assert reopened.get("ethereum:mainnet", fresh) == "0x02"
+
+
+def test_persistent_cache_ignores_block_tags(tmp_path):
+    """Test that calls against a block tag are never persisted."""
+    cache = PersistentRPCCache(tmp_path / "cache.sqlite")
+    params = [{"to": "0xpool", "data": "0x"}, "latest"]
+
+    cache.set("ethereum:mainnet", params, "0x01")
+
+    assert cache.get("ethereum:mainnet", params) is None
+
+
+def test_persistent_cache_ignores_non_number_blocks(tmp_path):
+    """Test that block hashes, EIP-1898 objects and malformed blocks are never persisted."""
+    cache = PersistentRPCCache(tmp_path / "cache.sqlite")
+    call = {"to": "0xpool", "data": "0x"}
+
+    for block in ("0x" + "ab" * 32, {"blockHash": "0x" + "ab" * 32}, "0xzz", "12", "0xffffffffffffffff"):
+        params = [call, block]
+        cache.set("ethereum:mainnet", params, "0x01")
+        assert cache.get("ethereum:mainnet", params) is None
+
+    params = [call, "0x7fffffffffffffff"]
+    cache.set("ethereum:mainnet", params, "0x01")
+    assert cache.get("ethereum:mainnet", params) == "0x01"
+
+
+class FakeChainProvider:
+    """Per-chain provider stub recording batches."""
+
+    def __init__(self, chain, uri):
+        self.chain = chain
+        self._provider = SimpleNamespace(http_uri=uri)
+        self.batches = []
+
+    def make_batch_request(self, calls):
+        self.batches.append(calls)
+        return [f"{self.chain}:{method}" for method, _ in calls]
+
+
+def test_multi_chain_batch_groups_by_endpoint():
+    """Test that one batch is sent per endpoint and results keep call order."""
+    ethereum = FakeChainProvider("ethereum", "https://eth.example")
+    base = FakeChainProvider("base", "https://shared.example")
+    optimism = FakeChainProvider("optimism", "https://shared.example")
+    multi = MultiChainRPCProvider({"ethereum": ethereum, "base": base, "optimism": optimism})
+
+    results = multi.batch(
+        [
+            ("base", "eth_chainId", []),
+            ("ethereum", "eth_chainId", []),
+            ("optimism", "eth_blockNumber", []),
+            ("polygon", "eth_chainId", []),
+        ]
+    )
+
+    assert results == ["base:eth_chainId", "ethereum:eth_chainId", "base:eth_blockNumber", None]
+    assert len(ethereum.batches) == 1
+    assert base.batches == [[("eth_chainId", []), ("eth_blockNumber", [])]]
+    assert optimism.batches == []
+
+
+def test_make_request_uses_pooled_client_with_orjson():
+    """Test that single requests go over the pooled client and surface node errors."""
+    replies = [
+        {"jsonrpc": "2.0", "id": 1, "result": "0x10"},
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32005, "message": "query returned more than 10000 results"}},
+    ]
+    bodies = []
+
+    def fake_post(url, content, headers):
+        bodies.append(orjson.loads(content))
+        return httpx.Response(200, content=orjson.dumps(replies.pop(0)), request=httpx.Request("POST", url))
+
+    provider = _connected_provider(http_client=SimpleNamespace(post=fake_post))
+    provider.retry_config.max_retries = 0
+
+    assert provider.make_request("eth_getLogs", [{}]) == "0x10"
+    with pytest.raises(RuntimeError, match="-32005"):
+        provider.make_request("eth_getLogs", [{}])
+    assert bodies[0]["method"] == "eth_getLogs"
@@ -0,0 +1,453 @@
+"""Tests for chain scanner activity detection."""
+
+import pytest
+
+from crypto_portfolio_tracker.core.scanner import ChainScanner
+
+
+class FakeRPCProvider:
+    """RPC provider stub that records eth_getLogs ranges, single or batched."""
+
+    def __init__(self, latest_block, logs_for_range=None, error=None):
+        self.latest_block = latest_block
+        self.logs_for_range = logs_for_range or (lambda from_block, to_block: [])
+        self.error = error
+        self.log_queries = []
+        self.batch_sizes = []
+
+    def make_batch_request(self, calls):
+        if any(method != "eth_getLogs" for method, _ in calls):
+            raise RuntimeError("account probes not supported")
+        self.batch_sizes.append(len(calls))
+        results = []
+        for _, params in calls:
+            from_block = int(params[0]["fromBlock"], 16)
+            to_block = int(params[0]["toBlock"], 16)
+            self.log_queries.append((from_block, to_block))
+            # A batch reports a failed call as a missing result
+            results.append(None if self.error else self.logs_for_range(from_block, to_block))
+        return results
+
+    def make_request(self, method, params):
+        if method == "eth_blockNumber":
+            return hex(self.latest_block)
+        if method == "eth_getLogs":
+            from_block = int(params[0]["fromBlock"], 16)
+            to_block = int(params[0]["toBlock"], 16)
+            self.log_queries.append((from_block, to_block))
+            if self.error:
+                raise self.error
+            return self.logs_for_range(from_block, to_block)
+        raise AssertionError(f"unexpected method {method}")
+
+
+USER = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
+
+
+def test_chain_activity_stops_at_first_recent_hit():
+    """Test that the recent windows go out in one batch and a hit there skips the history."""
+    provider = FakeRPCProvider(latest_block=1_000_000, logs_for_range=lambda f, t: [{"blockNumber": hex(t)}])
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._has_chain_activity(USER, "ethereum") is True
+    assert provider.batch_sizes == [ChainScanner.ACTIVITY_LOOKBACK_BLOCKS // ChainScanner.LOG_CHUNK_SIZE]
+    assert min(frm for frm, _ in provider.log_queries) == 1_000_000 - ChainScanner.ACTIVITY_LOOKBACK_BLOCKS + 1
+
+
+def test_chain_activity_queries_bounded_windows_then_history():
+    """Test that an inactive address is probed in bounded windows over the whole history."""
+    provider = FakeRPCProvider(latest_block=1_000_000)
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._has_chain_activity(USER, "ethereum") is False
+
+    assert all(to - frm + 1 <= ChainScanner.LOG_CHUNK_SIZE for frm, to in provider.log_queries)
+    assert all(size <= ChainScanner.LOG_BATCH_WINDOWS for size in provider.batch_sizes)
+    assert sorted(provider.log_queries)[0][0] == 0
+    assert len(provider.log_queries) == 1_000_001 // ChainScanner.LOG_CHUNK_SIZE + 1
+
+
+def test_chain_activity_finds_transfer_older_than_lookback():
+    """Test that a Transfer older than the lookback is found by the windowed history walk, which then stops."""
+
+    def logs_for_range(from_block, to_block):
+        return [{"blockNumber": hex(50_000)}] if from_block <= 50_000 <= to_block else []
+
+    provider = FakeRPCProvider(latest_block=10_000_000, logs_for_range=logs_for_range)
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._has_chain_activity(USER, "ethereum") is True
+    assert all(to - frm + 1 <= ChainScanner.LOG_CHUNK_SIZE for frm, to in provider.log_queries)
+    # Recent batch, then only the first history batch (which holds block 50,000)
+    assert provider.batch_sizes == [
+        ChainScanner.ACTIVITY_LOOKBACK_BLOCKS // ChainScanner.LOG_CHUNK_SIZE,
+        ChainScanner.LOG_BATCH_WINDOWS,
+    ]
+
+
+def test_chain_activity_too_many_results_counts_as_hit():
+    """Test that a result-size rejection is treated as activity."""
+    error = RuntimeError("query returned more than 10000 results")
+    provider = FakeRPCProvider(latest_block=50, error=error)
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._has_chain_activity(USER, "ethereum") is True
+
+
+class FakeBatchRPCProvider:
+    """RPC provider stub answering batched account probes."""
+
+    def __init__(self, nonce="0x0", balance="0x0", code="0x"):
+        self.results = [nonce, balance, code]
+        self.batches = []
+
+    def make_batch_request(self, calls):
+        self.batches.append([method for method, _ in calls])
+        return self.results
+
+    def make_request(self, method, params):
+        raise AssertionError(f"unexpected method {method}")
+
+
+def test_is_unused_address_single_batch():
+    """Test that an untouched address is detected with one batched probe."""
+    provider = FakeBatchRPCProvider()
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner.is_unused_address(USER) is True
+    assert provider.batches == [["eth_getTransactionCount", "eth_getBalance", "eth_getCode"]]
+
+
+def test_is_unused_address_used_or_contract():
+    """Test that nonce, balance, code or a failed probe mark the address as used."""
+    assert ChainScanner(rpc_provider=FakeBatchRPCProvider(nonce="0x3")).is_unused_address(USER) is False
+    assert ChainScanner(rpc_provider=FakeBatchRPCProvider(balance="0x1")).is_unused_address(USER) is False
+    assert ChainScanner(rpc_provider=FakeBatchRPCProvider(code="0x6080")).is_unused_address(USER) is False
+    assert ChainScanner(rpc_provider=FakeBatchRPCProvider(nonce=None)).is_unused_address(USER) is False
+
+
+def test_chain_activity_skips_logs_for_unused_address():
+    """Test that an unused address is ruled out without any eth_getLogs query."""
+    provider = FakeBatchRPCProvider()
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._has_chain_activity(USER, "ethereum") is False
+    assert len(provider.batches) == 1
+
+
+def test_pad_address():
+    """Test topic padding of addresses."""
+    padded = ChainScanner._pad_address(USER)
+    assert padded == "0x" + USER[2:].lower().zfill(64)
+
+
+def test_detect_active_chains_probes_concurrently(monkeypatch):
+    """Test that chain probes overlap and results keep chain order."""
+    import threading
+
+    from crypto_portfolio_tracker.core import scanner as scanner_module
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_has_chain_activity(self, user_address, chain):
+        # All three probes must be in flight at once to pass the barrier
+        barrier.wait()
+        return chain != "base"
+
+    monkeypatch.setattr(scanner_module, "get_all_supported_chains", lambda: ["ethereum", "base", "arbitrum"])
+    monkeypatch.setattr(ChainScanner, "_has_chain_activity", fake_has_chain_activity)
+
+    scanner = ChainScanner(rpc_provider=None)
+
+    assert scanner.detect_active_chains(USER) == ["ethereum", "arbitrum"]
+
+
+class FakeLogsBatchRPCProvider:
+    """RPC provider stub answering batched eth_getLogs probes and block windows."""
+
+    def __init__(self, batch_results, latest_block=0, window_logs=None):
+        self.batch_results = batch_results
+        self.latest_block = latest_block
+        self.window_logs = window_logs or (lambda from_block, to_block: [])
+        self.batches = []
+
+    def make_batch_request(self, calls):
+        self.batches.append(calls)
+        if len(self.batches) == 1:
+            return self.batch_results
+        return [
+            self.window_logs(int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)) for _, params in calls
+        ]
+
+    def make_request(self, method, params):
+        if method == "eth_blockNumber":
+            return hex(self.latest_block)
+        raise AssertionError(f"unexpected method {method}")
+
+
+def test_protocol_activity_single_batch():
+    """Test that all topic probes for a protocol go out in one batch."""
+    provider = FakeLogsBatchRPCProvider([[], [], [], [], [{"logIndex": "0x0"}], []])
+    scanner = ChainScanner(rpc_provider=provider)
+
+    probes = [(sig, pos, ()) for sig in ("0xaa", "0xbb") for pos in (1, 2, 3)]
+    assert scanner._has_protocol_activity(USER, "ethereum", probes) is True
+    assert len(provider.batches) == 1
+    assert len(provider.batches[0]) == 6
+
+
+def test_protocol_activity_retries_failed_probes():
+    """Test that only probes the batch could not answer are retried in block windows."""
+    provider = FakeLogsBatchRPCProvider(
+        [[], None, []],
+        latest_block=25_000,
+        window_logs=lambda from_block, to_block: [{"logIndex": "0x0"}] if from_block >= 20_000 else [],
+    )
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._has_protocol_activity(USER, "ethereum", [("0xaa", 1, ()), ("0xaa", 2, ()), ("0xaa", 3, ())]) is True
+    retried = provider.batches[1]
+    assert [params[0]["topics"] for _, params in retried] == [["0xaa", None, ChainScanner._pad_address(USER)]] * 3
+    assert [params[0]["fromBlock"] for _, params in retried] == [hex(0), hex(10_000), hex(20_000)]
+
+
+def test_protocol_activity_filters_by_contract_address():
+    """Test that probes with known contracts carry an address filter, including on retry."""
+    provider = FakeLogsBatchRPCProvider([None, []], latest_block=5)
+    scanner = ChainScanner(rpc_provider=provider)
+
+    probes = [("0xaa", 1, ("0x01", "0x02")), ("0xbb", 2, ())]
+    assert scanner._has_protocol_activity(USER, "ethereum", probes) is False
+    probe_filters = [params[0] for _, params in provider.batches[0]]
+    assert probe_filters[0]["address"] == ["0x01", "0x02"]
+    assert "address" not in probe_filters[1]
+    assert [params[0]["address"] for _, params in provider.batches[1]] == [["0x01", "0x02"]]
+
+
+def test_query_logs_stops_after_first_hit():
+    """Test that later window batches are not requested once a log is consumed."""
+    provider = FakeLogsBatchRPCProvider(
+        None, latest_block=49, window_logs=lambda from_block, to_block: [{"logIndex": "0x0"}]
+    )
+    provider.batches.append([])  # skip the probe batch
+    scanner = ChainScanner(rpc_provider=provider)
+    scanner.LOG_CHUNK_SIZE = 10
+    scanner.LOG_BATCH_WINDOWS = 2
+
+    logs = scanner._query_logs_with_chunking(["0xaa"], "0x0", "latest")
+
+    assert next(logs) == {"logIndex": "0x0"}
+    logs.close()
+    assert len(provider.batches) == 2
+
+
+def test_query_logs_splits_range_into_batched_windows():
+    """Test that long ranges are walked in fixed windows, several per batch."""
+    provider = FakeLogsBatchRPCProvider(None, latest_block=49)
+    provider.batches.append([])  # skip the probe batch
+    scanner = ChainScanner(rpc_provider=provider)
+    scanner.LOG_CHUNK_SIZE = 10
+    scanner.LOG_BATCH_WINDOWS = 2
+
+    assert list(scanner._query_logs_with_chunking(["0xaa"], "0x0", "latest")) == []
+
+    windows = [
+        (int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16))
+        for batch in provider.batches[1:]
+        for _, params in batch
+    ]
+    assert [len(batch) for batch in provider.batches[1:]] == [2, 2, 1]
+    assert windows == [(0, 9), (10, 19), (20, 29), (30, 39), (40, 49)]
+
+
+def test_discover_protocols_uses_activity_cache(monkeypatch, tmp_path):
+    """Test that cached hits skip queries and cached misses rescan only new blocks."""
+    from crypto_portfolio_tracker.core.registry import ProtocolRegistry
+    from crypto_portfolio_tracker.rpc.cache import PersistentRPCCache
+
+    cache = PersistentRPCCache(tmp_path / "cache.sqlite")
+    cache.set_activity("ethereum", USER, "lido", True, 100)
+    cache.set_activity("ethereum", USER, "aave_v3", False, 100)
+
+    probes = {"lido": [("0xaa", 1, ())], "aave_v3": [("0xbb", 2, ())], "beefy": [("0xcc", 2, ())]}
+    monkeypatch.setattr(ProtocolRegistry, "get_discovery_probes", classmethod(lambda cls, chain: probes))
+    scanned = []
+
+    def fake_has_protocol_activity(self, user_address, chain, probes, from_block=0, to_block=None):
+        scanned.append((probes[0][0], from_block, to_block))
+        return probes[0][0] == "0xcc"
+
+    monkeypatch.setattr(ChainScanner, "_has_protocol_activity", fake_has_protocol_activity)
+    monkeypatch.setattr(ChainScanner, "_get_latest_block", lambda self: 150)
+
+    scanner = ChainScanner(rpc_provider=None, activity_cache=cache)
+
+    assert scanner.discover_protocols(USER, "ethereum") == ["lido", "beefy"]
+    assert scanned == [("0xbb", 101, 150), ("0xcc", 0, 150)]
+    assert cache.get_activity("ethereum", USER, "aave_v3") == (False, 150)
+    assert cache.get_activity("ethereum", USER.lower(), "beefy") == (True, 150)
+    cache.close()
+
+
+class FakeOracle:
+    """Activity oracle stub with fixed per-chain answers."""
+
+    def __init__(self, answers):
+        self.answers = answers
+
+    def has_chain_activity(self, user_address, chain):
+        return self.answers.get(chain)
+
+
+def test_chain_activity_prefers_oracle_answer():
+    """Test that a known oracle answer skips every RPC probe."""
+    provider = FakeBatchRPCProvider()
+    scanner = ChainScanner(rpc_provider=provider, activity_oracle=FakeOracle({"base": True}))
+
+    assert scanner._has_chain_activity(USER, "base") is True
+    assert provider.batches == []
+
+    # Unknown chains fall back to the account probe
+    assert scanner._has_chain_activity(USER, "ethereum") is False
+    assert len(provider.batches) == 1
+
+
+def test_chain_activity_nonzero_nonce_skips_logs():
+    """Test that an address that has sent transactions is active without a log scan."""
+    provider = FakeBatchRPCProvider(nonce="0x5")
+    scanner = ChainScanner(rpc_provider=provider)
+
+    # FakeBatchRPCProvider.make_request raises on any eth_getLogs
+    assert scanner._has_chain_activity(USER, "ethereum") is True
+
+
+class FakeMultiChainProvider:
+    """Multi-chain provider stub answering account probes per chain."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.batches = []
+
+    def batch(self, calls):
+        self.batches.append(calls)
+        methods = ("eth_getTransactionCount", "eth_getBalance", "eth_getCode")
+        return [self.accounts[chain][methods.index(method)] for chain, method, _ in calls]
+
+    def provider_for(self, chain):
+        return FakeBatchRPCProvider(*self.accounts[chain])
+
+
+def test_detect_active_chains_batches_account_probes(monkeypatch):
+    """Test that every chain's account probe goes out in one multi-chain batch."""
+    from crypto_portfolio_tracker.core import scanner as scanner_module
+
+    monkeypatch.setattr(scanner_module, "get_all_supported_chains", lambda: ["ethereum", "base", "arbitrum"])
+    provider = FakeMultiChainProvider(
+        {
+            "ethereum": ("0x3", "0x0", "0x"),
+            "base": ("0x0", "0x0", "0x"),
+            "arbitrum": ("0x0", "0x0", "0x"),
+        }
+    )
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner.detect_active_chains(USER) == ["ethereum"]
+    assert len(provider.batches) == 1
+    assert len(provider.batches[0]) == 9
+
+
+class FakeChainProvider:
+    """Single-chain provider stub answering account probes and protocol log probes."""
+
+    def __init__(self, nonce, logs):
+        self.answers = {
+            "eth_getTransactionCount": nonce,
+            "eth_getBalance": "0x0",
+            "eth_getCode": "0x",
+            "eth_getLogs": logs,
+            "eth_blockNumber": "0x64",
+        }
+        self.methods = []
+
+    def make_batch_request(self, calls):
+        self.methods.extend(method for method, _ in calls)
+        return [self.answers[method] for method, _ in calls]
+
+    def make_request(self, method, params):
+        self.methods.append(method)
+        return self.answers[method]
+
+
+def test_scan_all_chains_routes_through_multi_chain_provider(monkeypatch):
+    """Test that per-chain scans go to each chain's own provider behind a MultiChainRPCProvider."""
+    from crypto_portfolio_tracker.core import scanner as scanner_module
+    from crypto_portfolio_tracker.core.registry import ProtocolRegistry
+    from crypto_portfolio_tracker.rpc.provider import MultiChainRPCProvider
+
+    monkeypatch.setattr(scanner_module, "get_all_supported_chains", lambda: ["ethereum", "base"])
+    monkeypatch.setattr(
+        ProtocolRegistry, "get_discovery_probes", classmethod(lambda cls, chain: {"aave_v3": [("0xaa", 2, ())]})
+    )
+    ethereum = FakeChainProvider(nonce="0x1", logs=[{"logIndex": "0x0"}])
+    base = FakeChainProvider(nonce="0x0", logs=[])
+    scanner = ChainScanner(rpc_provider=MultiChainRPCProvider({"ethereum": ethereum, "base": base}))
+
+    results = scanner.scan_all_chains(USER)
+
+    assert [(r.chain, r.has_activity, r.protocols_detected) for r in results] == [
+        ("ethereum", True, ["aave_v3"]),
+        ("base", False, []),
+    ]
+    assert "eth_getLogs" in ethereum.methods
+    assert "eth_getLogs" not in base.methods
+
+
+def test_suggested_ranges_split_iteratively_and_dedupe():
+    """Test that a rejected range is split as suggested and duplicate logs are dropped."""
+    log = {"transactionHash": "0xabc", "logIndex": "0x1"}
+
+    def logs_for_range(from_block, to_block):
+        if (from_block, to_block) == (0, 99):
+            raise RuntimeError("query returned more than 10000 results. Try with this block range [0x0A, 0x13]")
+        return [log]
+
+    provider = FakeRPCProvider(latest_block=99, logs_for_range=logs_for_range)
+    scanner = ChainScanner(rpc_provider=provider)
+
+    logs = scanner._query_logs_in_suggested_ranges(["0xaa"], "0x0", "0x63")
+
+    assert logs == [log]
+    assert provider.log_queries == [(0, 99), (10, 19), (0, 9), (20, 99)]
+
+
+def test_suggested_range_without_progress_raises():
+    """Test that a suggestion covering the whole rejected range is not retried forever."""
+
+    def logs_for_range(from_block, to_block):
+        raise RuntimeError("query returned more than 10000 results. Try with this block range [0x0, 0x63]")
+
+    scanner = ChainScanner(rpc_provider=FakeRPCProvider(latest_block=99, logs_for_range=logs_for_range))
+
+    with pytest.raises(RuntimeError):
+        scanner._query_logs_in_suggested_ranges(["0xaa"], "0x0", "0x63")
+
+
+def test_suggested_range_from_structured_rpc_error():
+    """Test that JSON-RPC error codes and data ranges drive the split, not message text."""
+    from crypto_portfolio_tracker.rpc.errors import RPCError
+
+    def logs_for_range(from_block, to_block):
+        if (from_block, to_block) == (0, 99):
+            error = {"code": -32005, "message": "limit exceeded", "data": {"from": "0x0", "to": "0x31"}}
+            raise RPCError("eth_getLogs", error)
+        return []
+
+    provider = FakeRPCProvider(latest_block=99, logs_for_range=logs_for_range)
+    scanner = ChainScanner(rpc_provider=provider)
+
+    assert scanner._query_logs_in_suggested_ranges(["0xaa"], "0x0", "0x63") == []
+    assert provider.log_queries == [(0, 99), (0, 49), (50, 99)]
+
+    # Other codes are not treated as a result size rejection, whatever the message says
+    other = RPCError("eth_getLogs", {"code": -32000, "message": "Try with this block range [0x0, 0x31]"})
+    assert ChainScanner._is_too_many_results_error(other) is False
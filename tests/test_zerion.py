@@ -0,0 +1,68 @@
+"""Tests for the Zerion API client."""
+
+import httpx
+import orjson
+
+from crypto_portfolio_tracker.integrations import zerion
+from crypto_portfolio_tracker.integrations.zerion import ZerionClient, get_shared_client
+
+
+def test_get_positions_reuses_body_on_not_modified():
+    """Test that repeated requests send If-None-Match and reuse the parsed body on 304."""
+    body = {"data": [{"id": "position-1"}]}
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, content=orjson.dumps(body), headers={"ETag": '"v1"'})
+
+    client = ZerionClient(api_key="zk_dev_test")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    first = client.get_positions("0xABC", ["ethereum", "base"])
+    second = client.get_positions("0xabc", ["base", "ethereum"])
+
+    assert first == body
+    assert second is first
+    assert seen_headers == [None, '"v1"']
+
+
+def test_shared_client_reused_per_api_key(monkeypatch):
+    """Test that handlers get one long-lived client per API key."""
+    monkeypatch.setattr(zerion, "_SHARED_CLIENTS", {})
+
+    client = get_shared_client("zk_dev_test")
+
+    assert get_shared_client("zk_dev_test") is client
+    assert get_shared_client("zk_dev_other") is not client
+
+    client.close()
+    assert get_shared_client("zk_dev_test") is not client
+    zerion.close_shared_clients()
+
+
+def test_handler_calls_send_conditional_requests(monkeypatch):
+    """Test that repeated handler lookups reach the API as a 200 followed by a 304 on one client."""
+    from crypto_portfolio_tracker.protocols.etherfi import EtherfiHandler
+
+    statuses = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            statuses.append(304)
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        statuses.append(200)
+        return httpx.Response(200, content=orjson.dumps({"data": []}), headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(zerion, "_SHARED_CLIENTS", {})
+    monkeypatch.setenv("ZERION_API_KEY", "zk_dev_test")
+    get_shared_client("zk_dev_test").client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    etherfi = EtherfiHandler()
+    etherfi.get_positions("0xabc", "ethereum")
+    etherfi.get_positions("0xabc", "ethereum")
+
+    assert statuses == [200, 304]
+    zerion.close_shared_clients()